@@ -0,0 +1,207 @@
+"""Benchmarks for the countdown hot paths. Headless, and no network beyond a loopback stand-in sheet server.
+
+    python background/benchmarks.py                       # JSON report on stdout
+    python background/benchmarks.py -o bench-0.5.0.json   # ...or to a file
+    python background/benchmarks.py --compare bench-0.4.0.json
+
+The app folder is redirected to a temporary HOME, so real settings and HTML outputs are
+never touched. --compare prints each benchmark's mean against an earlier report.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# main.py creates its app folder under ~/Documents at import time
+_home = tempfile.mkdtemp(prefix="rlc-bench-")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+CSV_ROWS = (10, 1000, 10000, 100000)
+STATUSES = ('GO', 'go', 'NO GO', 'No-Go', 'nogo', 'HOLD', '', None, 'ERROR', '  Go  ')
+
+
+def make_csv(rows, columns=12):
+    lines = []
+    for r in range(rows):
+        cells = [f"r{r}c{c}" for c in range(columns - 1)]
+        cells.append(STATUSES[r % 4] or 'GO')
+        lines.append(','.join(cells))
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class SheetHandler(BaseHTTPRequestHandler):
+    """GET /<rows>.csv serves a pre-built CSV with that many rows."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = self.server.sheets.get(self.path.strip('/'))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_sheet_server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), SheetHandler)
+    httpd.daemon_threads = True
+    httpd.sheets = {f"{rows}.csv": make_csv(rows) for rows in CSV_ROWS}
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def bench(fn, min_time=0.5, max_iterations=100000):
+    """Run fn repeatedly for about min_time seconds; per-call times in microseconds."""
+    fn()
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_iterations and (len(samples) < 5 or time.perf_counter() < deadline):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1e6)
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    return {
+        'iterations': len(samples),
+        'mean_us': round(mean, 3),
+        'p50_us': round(samples[len(samples) // 2], 3),
+        'p95_us': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'min_us': round(samples[0], 3),
+        'ops_per_s': round(1e6 / mean, 1) if mean else None,
+    }
+
+
+def bench_metrics(settings, min_time, ticks=200):
+    """Cost of one measurement, and of all the measurements made per engine tick (buttons mode)."""
+    results = {}
+    registry = main.MetricsRegistry()
+    counter = registry.counter('bench_total', "benchmark counter")
+    histogram = registry.histogram('bench_seconds', "benchmark histogram")
+    results['metrics_counter_inc'] = bench(lambda: counter.inc(status='200'), min_time)
+    results['metrics_histogram_observe'] = bench(lambda: histogram.observe(0.0042, file='countdown'), min_time)
+
+    # count the measurements a tick really makes, including those on the output workers
+    calls = [0]
+    originals = main.Counter.inc, main.Histogram.observe
+
+    def counted(method):
+        def wrapper(*args, **kwargs):
+            calls[0] += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    main.save_settings(dict(settings, mode='buttons'))
+    engine = main.CountdownEngine()
+    engine.execute({'cmd': 'start', 'seconds': 3600, 'mission': 'Benchmark'})
+    main.Counter.inc, main.Histogram.observe = counted(originals[0]), counted(originals[1])
+    try:
+        for _ in range(ticks):
+            # as run_headless does around each tick
+            started = time.monotonic()
+            main.TICK_LATENESS_SECONDS.observe(0.0)
+            engine.tick()
+            main.TICK_SECONDS.observe(time.monotonic() - started)
+            time.sleep(0.002)
+    finally:
+        main.Counter.inc, main.Histogram.observe = originals
+        engine.close()
+        main.save_settings(settings)
+    per_tick = calls[0] / ticks
+    cost_us = per_tick * max(results['metrics_counter_inc']['mean_us'], results['metrics_histogram_observe']['mean_us'])
+    results['metrics_per_tick'] = {
+        'measurements': round(per_tick, 1),
+        'mean_us': round(cost_us, 3),
+        'share_of_tick_interval': round(cost_us / (main.TICK_MS * 1000), 6),
+    }
+    return results
+
+
+def run(min_time):
+    results = {}
+    settings = dict(main.DEFAULT_SETTINGS)
+    main.save_settings(settings)
+
+    timers = [main.format_time(s) for s in range(0, 3600, 7)]
+    i = iter(range(10 ** 9))
+    results['write_countdown_html'] = bench(
+        lambda: main.write_countdown_html("Benchmark Mission", timers[next(i) % len(timers)], settings=settings), min_time)
+    results['write_gonogo_html'] = bench(
+        lambda: main.write_gonogo_html(['GO', 'NO-GO', 'GO'], settings=settings), min_time)
+    results['write_countdown_html_load_settings'] = bench(
+        lambda: main.write_countdown_html("Benchmark Mission", "T-00:10:00"), min_time)
+
+    results['get_status_color'] = bench(lambda: [main.get_status_color(s) for s in STATUSES], min_time)
+    results['format_status_display'] = bench(lambda: [main.format_status_display(s) for s in STATUSES], min_time)
+    results['format_time'] = bench(lambda: [main.format_time(s) for s in (0, 59, 3599, 86399, 359999)], min_time)
+
+    results['load_settings'] = bench(main.load_settings, min_time)
+    results['save_settings'] = bench(lambda: main.save_settings(settings), min_time)
+
+    results.update(bench_metrics(settings, min_time))
+
+    server = start_sheet_server()
+    try:
+        for rows in CSV_ROWS:
+            sheet = dict(settings, mode='spreadsheet', column=12,
+                         sheet_link=f"http://127.0.0.1:{server.server_address[1]}/{rows}.csv")
+            main.save_settings(sheet)
+            values = main.fetch_gonogo()
+            if 'ERROR' in values:
+                raise RuntimeError(f"stand-in sheet fetch failed for {rows} rows")
+            results[f'fetch_gonogo_{rows}_rows'] = bench(main.fetch_gonogo, min_time, max_iterations=2000)
+    finally:
+        server.shutdown()
+        main.save_settings(settings)
+    return results
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, 'r', encoding='utf-8') as fh:
+        baseline = json.load(fh).get('results', {})
+    print(f"{'benchmark':<38}{'baseline us':>14}{'now us':>12}{'change':>9}", file=sys.stderr)
+    for name, now in results.items():
+        old = baseline.get(name)
+        if not old:
+            print(f"{name:<38}{'-':>14}{now['mean_us']:>12.1f}", file=sys.stderr)
+            continue
+        change = now['mean_us'] / old['mean_us'] - 1 if old['mean_us'] else 0.0
+        print(f"{name:<38}{old['mean_us']:>14.1f}{now['mean_us']:>12.1f}{change:>+9.1%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RocketLaunchCountdown benchmarks")
+    parser.add_argument('-o', '--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--min-time', type=float, default=0.5, help="seconds to spend per benchmark (default 0.5)")
+    parser.add_argument('--compare', metavar='REPORT', help="print changes against an earlier JSON report")
+    options = parser.parse_args()
+
+    report = {
+        'app_version': main.appVersion,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': run(options.min_time),
+    }
+    main.timeline.close()
+    shutil.rmtree(_home, ignore_errors=True)
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as fh:
+            fh.write(text + '\n')
+    else:
+        print(text)
+    if options.compare:
+        compare(report['results'], options.compare)
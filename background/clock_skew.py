@@ -0,0 +1,195 @@
+"""Time-sync check with deliberately skewed clients against a real headless instance.
+
+    python background/clock_skew.py
+    python background/clock_skew.py --seconds 10 --tolerance-ms 1 -o skew.json
+
+Starts the app headless with a time-sync port in a temporary app folder, then runs
+SyncedClock clients whose local clock is off by seconds to minutes and drifts by hundreds
+of ppm. Some of them reach the app through a UDP relay that adds random, asymmetric delay.
+Both ends run on this machine, so the app's timebase is this machine's wall clock, and
+each client's estimate is checked against it. A display-page style exchange over HTTP
+(/time, then /countdown) is checked the same way. Exits non-zero if any error is over
+tolerance.
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+# main.py creates its app folder under ~/Documents at import time; the app under test gets its own home below
+_home = tempfile.mkdtemp(prefix="rlc-skew-client-")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+# (name, skew seconds, drift ppm, relay jitter ms)
+SCENARIOS = (
+    ('fast 2.5 s', 2.5, 0, 0),
+    ('slow 97 s, +300 ppm', -97.0, 300, 0),
+    ('fast 41 s, -150 ppm, 5 ms jitter', 41.0, -150, 5),
+    ('slow 0.3 s, 20 ms jitter', -0.3, 0, 20),
+)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def skewed_clock(skew, drift_ppm):
+    start = time.monotonic()
+    return lambda: time.monotonic() + skew + (time.monotonic() - start) * drift_ppm * 1e-6
+
+
+class JitterRelay:
+    """UDP relay that holds each datagram for a random 0..jitter seconds, each way independently."""
+
+    def __init__(self, target, jitter):
+        self.target = target
+        self.jitter = jitter
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.address = self.sock.getsockname()
+        self.client = None
+        self._due = []
+        self._cond = threading.Condition()
+        threading.Thread(target=self._receive, daemon=True).start()
+        threading.Thread(target=self._send, daemon=True).start()
+
+    def _receive(self):
+        while True:
+            data, addr = self.sock.recvfrom(64)
+            if addr != self.target:
+                self.client = addr
+                dest = self.target
+            else:
+                dest = self.client
+            with self._cond:
+                heapq.heappush(self._due, (time.monotonic() + random.uniform(0, self.jitter), data, dest))
+                self._cond.notify()
+
+    def _send(self):
+        while True:
+            with self._cond:
+                while not self._due or self._due[0][0] > time.monotonic():
+                    self._cond.wait(self._due[0][0] - time.monotonic() if self._due else None)
+                _, data, dest = heapq.heappop(self._due)
+            self.sock.sendto(data, dest)
+
+
+def run_client(name, skew, drift_ppm, jitter_ms, port, seconds, settle):
+    server = ('127.0.0.1', port)
+    if jitter_ms:
+        server = JitterRelay(server, jitter_ms / 1000.0).address
+    synced = main.SyncedClock(f"{server[0]}:{server[1]}", interval=0.2, local=skewed_clock(skew, drift_ppm))
+    if not synced.ready.wait(5):
+        raise RuntimeError(f"{name}: no answer from the time service")
+    errors = []
+    started = time.monotonic()
+    while time.monotonic() - started < seconds:
+        error = synced.time() - time.time()
+        if time.monotonic() - started >= settle:
+            errors.append(abs(error) * 1000)
+        time.sleep(0.05)
+    synced.close()
+    errors.sort()
+    return {
+        'client': name,
+        'transport': 'udp',
+        'skew_s': skew,
+        'drift_ppm': drift_ppm,
+        'jitter_ms': jitter_ms,
+        'rtt_ms': round(synced.sync.delay * 1000, 3),
+        'error_p50_ms': round(errors[len(errors) // 2], 3),
+        'error_max_ms': round(errors[-1], 3),
+    }
+
+
+def run_page(port, skew):
+    """What a live display page does: /time exchanges on its own (skewed) clock, then render /countdown."""
+    local = skewed_clock(skew, 0)
+    sync = main.ClockSync()
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(8):
+        t1 = local()
+        with urllib.request.urlopen(f"{base}/time?t1={t1!r}", timeout=2) as resp:
+            reply = json.load(resp)
+        sync.add(reply['t1'], reply['t2'], reply['t3'], local())
+        time.sleep(0.05)
+    error = (local() + sync.offset - time.time()) * 1000
+    with urllib.request.urlopen(f"{base}/countdown?name=main", timeout=2) as resp:
+        cd = json.load(resp)
+    page_now = local() + sync.offset
+    page_timer = main.format_time(int(cd['target_time'] - page_now), "T-") if cd.get('target_time') else None
+    return {
+        'client': f'page, fast {skew} s',
+        'transport': 'http',
+        'skew_s': skew,
+        'rtt_ms': round(sync.delay * 1000, 3),
+        'error_p50_ms': round(abs(error), 3),
+        'error_max_ms': round(abs(error), 3),
+        'page_timer': page_timer,
+        'app_timer': cd.get('timer'),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time-sync check with skewed clients")
+    parser.add_argument('--seconds', type=float, default=6.0, help="how long each client runs")
+    parser.add_argument('--settle', type=float, default=1.0, help="seconds ignored while a client converges")
+    parser.add_argument('--tolerance-ms', type=float, default=1.0, help="allowed error, plus half the jitter")
+    parser.add_argument('-o', '--output', help="also write the results as JSON")
+    options = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix="rlc-skew-")
+    folder = os.path.join(home, "Documents", "RocketLaunchCountdown")
+    os.makedirs(folder, exist_ok=True)
+    port = free_port()
+    with open(os.path.join(folder, "settings.json"), 'w', encoding='utf-8') as fh:
+        json.dump({'mode': 'buttons', 'warm_start': False, 'time_sync_port': port}, fh)
+    app = subprocess.Popen([sys.executable, main.__file__, '--headless', '--start', '600', '--mission', 'Skew'],
+                           env=dict(os.environ, HOME=home, USERPROFILE=home),
+                           stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results = []
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/time", timeout=0.5).read()
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("the app's time service never answered")
+                time.sleep(0.1)
+        for scenario in SCENARIOS:
+            results.append(run_client(*scenario, port, options.seconds, options.settle))
+        results.append(run_page(port, 13.7))
+    finally:
+        app.kill()
+        app.wait()
+        shutil.rmtree(home, ignore_errors=True)
+        main.timeline.close()
+        shutil.rmtree(_home, ignore_errors=True)
+
+    failed = False
+    for r in results:
+        limit = options.tolerance_ms + r.get('jitter_ms', 0) / 2
+        ok = r['error_max_ms'] <= limit
+        failed = failed or not ok
+        extra = f", page shows {r['page_timer']} / app {r['app_timer']}" if 'page_timer' in r else ''
+        print(f"{'ok  ' if ok else 'FAIL'} {r['client']:<36} {r['transport']:<4} rtt {r['rtt_ms']:7.3f} ms  "
+              f"error p50 {r['error_p50_ms']:7.3f} ms  max {r['error_max_ms']:7.3f} ms (limit {limit:g}){extra}")
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+    sys.exit(1 if failed else 0)
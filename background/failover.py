@@ -0,0 +1,249 @@
+"""Hot-standby failover on loopback: two headless instances, a primary and a standby, in separate app folders.
+
+    python background/failover.py                     # kill the primary (process crash)
+    python background/failover.py --mode stop         # freeze it instead (SIGSTOP; heartbeat timeout path)
+    python background/failover.py --sheet-delay 0     # buttons mode, no sheet fetches at all
+    python background/failover.py --trials 5 -o failover.json
+
+Both instances fetch Go/No-Go from a loopback stand-in sheet that answers after
+--sheet-delay seconds (1.0 by default, as long as the standby's timeout), so a fetch
+that held up the primary's tick would look like a dead primary. Each trial starts both, lets the standby follow for
+--seconds (with a hold and a resume on the primary part-way), checks that the standby
+did not take over from the live primary, sends start and hold to the standby's control
+API and checks that both are refused and that its countdown.html is left alone, measures
+replication bandwidth from both instances' metrics, then kills or freezes the primary. A frozen primary is thawed afterwards, and the
+standby must step down again. Failover time is measured from that moment until the
+standby's metrics show it took over, and the time on the standby's countdown.html just
+after is reported so it can be compared with the primary's count.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def app_folder(home):
+    # same layout main.py derives from the home directory
+    folder = os.path.join(home, "Documents", "RocketLaunchCountdown")
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+
+class SlowSheet(BaseHTTPRequestHandler):
+    """Go/No-Go CSV that takes the server's `delay` seconds to answer."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        body = "\n".join(f"r{r}," + ",".join(["x"] * 10) + "GO" for r in range(1, 6)).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(body)))
+        try:
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # the instance asking was killed mid-request
+
+
+def start_sheet_server(delay):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), SlowSheet)
+    httpd.daemon_threads = True
+    httpd.delay = delay
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def launch(home, args, tick_ms, sheet=None):
+    folder = app_folder(home)
+    settings = {'mode': 'buttons', 'warm_start': False, 'watchdog_stall_seconds': 0}
+    if sheet is not None:
+        settings.update(mode='spreadsheet', column=12, sheet_link=f"http://127.0.0.1:{sheet.server_address[1]}/sheet.csv")
+    with open(os.path.join(folder, "settings.json"), 'w', encoding='utf-8') as fh:
+        json.dump(settings, fh)
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+    return subprocess.Popen([sys.executable, MAIN, '--headless', '--tick-ms', str(tick_ms)] + args,
+                            env=env, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def scrape(port, timeout=0.5):
+    """{metric line key: value} from an instance's /metrics page, or None while it isn't answering."""
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=timeout) as resp:
+            text = resp.read().decode('utf-8')
+    except Exception:
+        return None
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            key, _, value = line.rpartition(' ')
+            values[key] = float(value)
+    return values
+
+
+def total(values, name, **labels):
+    want = [f'{k}="{v}"' for k, v in labels.items()]
+    return sum(v for k, v in (values or {}).items()
+               if k.split('{')[0] == name and all(w in k for w in want))
+
+
+def wait_for(predicate, timeout, interval=0.002):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = predicate()
+        if result:
+            return result
+        time.sleep(interval)
+    return None
+
+
+def command(proc, line):
+    proc.stdin.write((line + '\n').encode('utf-8'))
+    proc.stdin.flush()
+
+
+def post(port, path, body):
+    """POST a control API command; returns the HTTP status."""
+    request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=json.dumps(body).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            return resp.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def page_stamp(path):
+    """(mtime, content) of an output page, or None while it doesn't exist."""
+    try:
+        with open(path, encoding='utf-8') as fh:
+            return os.stat(path).st_mtime_ns, fh.read()
+    except FileNotFoundError:
+        return None
+
+
+def trial(options, sheet):
+    repl_port, primary_metrics, standby_metrics, standby_api = free_port(), free_port(), free_port(), free_port()
+    homes = [tempfile.mkdtemp(prefix="rlc-failover-") for _ in range(2)]
+    primary = launch(homes[0], ['--primary', f"127.0.0.1:{repl_port}", '--metrics-port', str(primary_metrics),
+                                '--start', str(options.countdown), '--mission', 'Failover'], options.tick_ms, sheet)
+    standby = launch(homes[1], ['--standby', f"127.0.0.1:{repl_port}", '--metrics-port', str(standby_metrics),
+                                '--api-port', str(standby_api)], options.tick_ms, sheet)
+    started = time.time()
+    try:
+        if not wait_for(lambda: total(scrape(standby_metrics), 'rlc_replication_messages_total', direction='received'), 15, 0.05):
+            raise RuntimeError("standby never received anything from the primary")
+        before = scrape(standby_metrics)
+        t0 = time.monotonic()
+        time.sleep(options.seconds / 3)
+        command(primary, 'hold')
+        time.sleep(options.seconds / 3)
+        command(primary, 'resume')
+        time.sleep(options.seconds / 3)
+        after = scrape(standby_metrics)
+        sent = scrape(primary_metrics)
+        window = time.monotonic() - t0
+        received_bytes = total(after, 'rlc_replication_bytes_total', direction='received') - \
+            total(before, 'rlc_replication_bytes_total', direction='received')
+        received_msgs = total(after, 'rlc_replication_messages_total', direction='received') - \
+            total(before, 'rlc_replication_messages_total', direction='received')
+        # the primary was alive all along, however slow its fetches: the standby must still be following
+        false_takeovers = total(after, 'rlc_replication_takeovers_total')
+        # the primary owns the count and the pages: the standby must refuse operator commands and write nothing
+        standby_page = os.path.join(app_folder(homes[1]), "countdown.html")
+        page_before = page_stamp(standby_page)
+        refused = sum(post(standby_api, path, body) == 400
+                      for path, body in (('/start', {'seconds': 30, 'mission': 'Standby'}), ('/hold', {})))
+        time.sleep(0.5)
+        standby_wrote = page_stamp(standby_page) != page_before
+
+        # fail the primary, then watch for the standby to take over
+        failed_at = time.monotonic()
+        primary.send_signal(signal.SIGKILL if options.mode == 'kill' else signal.SIGSTOP)
+        took_over = wait_for(lambda: total(scrape(standby_metrics, 0.05), 'rlc_replication_takeovers_total'), 10)
+        failover_ms = (time.monotonic() - failed_at) * 1000 if took_over else None
+        time.sleep(0.3)
+        with open(os.path.join(app_folder(homes[1]), "countdown.html"), encoding='utf-8') as fh:
+            timer = re.search(r'<div id="timer">([^<]*)</div>', fh.read())
+        detected = scrape(standby_metrics) or {}
+        stepped_down_ms = None
+        if options.mode == 'stop':
+            # thaw the primary: the standby must hand the outputs back rather than stay in charge too
+            resumed_at = time.monotonic()
+            primary.send_signal(signal.SIGCONT)
+            if wait_for(lambda: total(scrape(standby_metrics, 0.05), 'rlc_replication_stepdowns_total'), 10):
+                stepped_down_ms = round((time.monotonic() - resumed_at) * 1000, 1)
+        return {
+            'mode': options.mode,
+            'sheet_delay_s': options.sheet_delay,
+            'false_takeovers': false_takeovers,
+            'standby_refused': refused,
+            'standby_wrote': standby_wrote,
+            'failover_ms': round(failover_ms, 1) if failover_ms is not None else None,
+            'standby_detection_ms': round(total(detected, 'rlc_replication_failover_seconds_sum') * 1000, 1),
+            'bytes_per_s': round(received_bytes / window, 1),
+            'messages_per_s': round(received_msgs / window, 1),
+            'primary_bytes_sent': total(sent, 'rlc_replication_bytes_total', direction='sent'),
+            'standby_timer_after': timer.group(1) if timer else None,
+            'stepped_down_ms': stepped_down_ms,
+            'elapsed_s': round(time.time() - started, 1),
+        }
+    finally:
+        for proc in (primary, standby):
+            if options.mode == 'stop':
+                proc.send_signal(signal.SIGCONT)
+            proc.kill()
+            proc.wait()
+        for home in homes:
+            shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hot-standby failover test on loopback")
+    parser.add_argument('--mode', choices=('kill', 'stop'), default='kill',
+                        help="kill the primary (SIGKILL) or freeze it (SIGSTOP)")
+    parser.add_argument('--trials', type=int, default=1)
+    parser.add_argument('--seconds', type=float, default=3.0, help="replication time measured before the failure")
+    parser.add_argument('--countdown', type=int, default=600, help="seconds on the primary's countdown")
+    parser.add_argument('--tick-ms', type=int, default=100)
+    parser.add_argument('--sheet-delay', type=float, default=1.0,
+                        help="seconds the stand-in sheet takes to answer; 0 runs both instances in buttons mode")
+    parser.add_argument('-o', '--output', help="also write the results as JSON")
+    options = parser.parse_args()
+
+    sheet = start_sheet_server(options.sheet_delay) if options.sheet_delay > 0 else None
+    results = [trial(options, sheet) for _ in range(options.trials)]
+    if sheet is not None:
+        sheet.shutdown()
+    for r in results:
+        print(f"{r['mode']}: failover {r['failover_ms']} ms (standby saw {r['standby_detection_ms']} ms of silence), "
+              f"{r['bytes_per_s']} B/s in {r['messages_per_s']} msg/s, standby now shows {r['standby_timer_after']}, "
+              f"{r['false_takeovers']:.0f} takeover(s) while the primary was alive, "
+              f"standby refused {r['standby_refused']} of 2 commands" + (" but rewrote its page" if r['standby_wrote'] else "")
+              + (f", stepped down {r['stepped_down_ms']} ms after the primary resumed" if r['mode'] == 'stop' else ''))
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+    sys.exit(1 if any(r['false_takeovers'] or r['failover_ms'] is None or r['standby_refused'] != 2 or r['standby_wrote']
+                      or (r['mode'] == 'stop' and r['stepped_down_ms'] is None) for r in results) else 0)
@@ -0,0 +1,76 @@
+"""Per-frame cost of the raster output at 1080p and 4K.
+
+Run from the repo root: python background/raster_benchmark.py [frames]
+Reports compose time for a timer-only change (the normal per-second case), a full
+redraw, PNG encode + atomic write, and a copy into the shared-memory buffer.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# main.py creates its app folder under ~/Documents at import time
+_home = tempfile.mkdtemp(prefix="rlc-raster-")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+SETTINGS = dict(main.DEFAULT_SETTINGS)
+GONOGO = ("GO", "NO-GO", "GO")
+
+
+def ms(samples):
+    samples = sorted(samples)
+    return sum(samples) / len(samples) * 1000, samples[len(samples) // 2] * 1000, samples[-1] * 1000
+
+
+def bench(width, height, frames):
+    r = main.FrameRenderer(width, height, SETTINGS)
+    r.render("ARTEMIS II", "T-00:10:00", GONOGO)
+    timer_only, full = [], []
+    for i in range(frames):
+        t = time.perf_counter()
+        r.render("ARTEMIS II", main.format_time(600 - i, "T-"), GONOGO)
+        timer_only.append(time.perf_counter() - t)
+    for i in range(frames):
+        r._bands.clear()
+        t = time.perf_counter()
+        r.render("ARTEMIS II", main.format_time(600 - i, "T-"), GONOGO)
+        full.append(time.perf_counter() - t)
+
+    png = []
+    path = os.path.join(_home, f"raster_bench_{width}x{height}.png")
+    for _ in range(max(1, frames // 10)):
+        t = time.perf_counter()
+        main.write_png_atomic(path, width, height, r.frame)
+        png.append(time.perf_counter() - t)
+    size = os.path.getsize(path)
+    os.remove(path)
+
+    shm_times = []
+    shm = main.SharedFrameBuffer(width, height, name=f"rlc_bench_{os.getpid()}")
+    try:
+        for _ in range(frames):
+            t = time.perf_counter()
+            shm.write(r.frame)
+            shm_times.append(time.perf_counter() - t)
+    finally:
+        shm.close()
+
+    print(f"{width}x{height}")
+    for name, samples in (("compose (timer band)", timer_only), ("compose (full frame)", full),
+                          ("png encode + write", png), ("shared memory copy", shm_times)):
+        mean, p50, worst = ms(samples)
+        print(f"  {name:<22} mean {mean:8.2f} ms   p50 {p50:8.2f} ms   max {worst:8.2f} ms")
+    print(f"  png size {size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    try:
+        for w, h in ((1920, 1080), (3840, 2160)):
+            bench(w, h, frames)
+    finally:
+        main.timeline.close()
+        shutil.rmtree(_home, ignore_errors=True)
@@ -0,0 +1,285 @@
+"""Soak test: run the countdown for a long simulated session and watch for resource growth and latency creep.
+
+    python background/soak.py                              # 8 simulated hours at 200x, headless engine
+    python background/soak.py --hours 12 --speed 300 --tk  # drive the full CountdownApp window instead
+    python background/soak.py -o soak.json
+
+A loopback stand-in sheet server cycles through healthy, slow and failing phases while the
+countdown runs from T-<hours> with a planned hold every simulated hour. RSS, open file
+descriptors, threads, Tk widgets (with --tk) and tick lateness are sampled throughout; the
+report flags anything that keeps growing between the first and second half of the run.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_home = tempfile.mkdtemp(prefix="rlc-soak-")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+PHASES = ('healthy', 'slow', 'failing')
+SHEET_CSV = "\n".join(f"r{r}," + ",".join(["x"] * 10) + ("GO" if r % 2 else "NO GO") for r in range(1, 40)).encode()
+
+
+class StandInSheet(BaseHTTPRequestHandler):
+    """Serves the Go/No-Go CSV; behaviour follows the server's current phase."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        phase = self.server.phase()
+        self.server.requests[phase] = self.server.requests.get(phase, 0) + 1
+        if phase == 'failing':
+            # alternate between an HTTP error and a dropped connection
+            if self.server.requests[phase] % 2:
+                self.send_error(500)
+            else:
+                self.close_connection = True
+                self.connection.close()
+            return
+        if phase == 'slow':
+            time.sleep(self.server.slow_seconds)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(SHEET_CSV)))
+        self.end_headers()
+        self.wfile.write(SHEET_CSV)
+
+
+def start_sheet_server(phase_seconds, slow_seconds):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInSheet)
+    httpd.daemon_threads = True
+    httpd.requests = {}
+    httpd.slow_seconds = slow_seconds
+    started = time.monotonic()
+    httpd.phase = lambda: PHASES[int((time.monotonic() - started) // phase_seconds) % len(PHASES)]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def rss_mb():
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1048576
+    except Exception:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1048576
+    except Exception:
+        return None
+
+
+def open_fds():
+    for path in ('/proc/self/fd', '/dev/fd'):
+        try:
+            return len(os.listdir(path))
+        except Exception:
+            pass
+    try:
+        import psutil
+        proc = psutil.Process()
+        return proc.num_handles() if hasattr(proc, 'num_handles') else proc.num_fds()
+    except Exception:
+        return None
+
+
+def widget_count(root):
+    count, stack = 0, [root]
+    while stack:
+        w = stack.pop()
+        count += 1
+        stack.extend(w.winfo_children())
+    return count
+
+
+class Soak:
+    def __init__(self, options, server):
+        self.options = options
+        self.server = server
+        self.samples = []
+        self.started = time.monotonic()
+        self._hist = (0.0, 0)
+        self.root = None
+
+    def sample(self, engine):
+        # mean tick lateness since the previous sample, from the metrics the loops already keep
+        series = dict(main.TICK_LATENESS_SECONDS.samples()).get(())
+        total, count = (series[1], series[2]) if series else (0.0, 0)
+        prev_total, prev_count = self._hist
+        self._hist = (total, count)
+        late_ms = (total - prev_total) / (count - prev_count) * 1000 if count > prev_count else None
+        self.samples.append({
+            'real_s': round(time.monotonic() - self.started, 2),
+            'sim_h': round((main.clock.time() - self.sim_start) / 3600, 3),
+            'phase': self.server.phase(),
+            'rss_mb': rss_mb(),
+            'fds': open_fds(),
+            'threads': threading.active_count(),
+            'widgets': widget_count(self.root) if self.root is not None else None,
+            'ticks': count,
+            'lateness_ms': round(late_ms, 3) if late_ms is not None else None,
+            'timer': engine.countdown().timer_text,
+        })
+
+    def drive(self, engine):
+        """Planned hold of `hold_minutes` simulated minutes at the top of each simulated hour."""
+        cd = engine.countdown()
+        elapsed = main.clock.time() - self.sim_start
+        minute_of_hour = (elapsed % 3600) / 60
+        if 0 < elapsed and minute_of_hour < self.options.hold_minutes and not cd.on_hold and elapsed > 60:
+            engine.execute({'cmd': 'hold'})
+        elif minute_of_hour >= self.options.hold_minutes and cd.on_hold:
+            engine.execute({'cmd': 'resume'})
+
+    def done(self):
+        return main.clock.time() - self.sim_start >= self.options.hours * 3600
+
+    def run_headless(self):
+        engine = main.CountdownEngine()
+        self.sim_start = main.clock.time()
+        engine.execute({'cmd': 'start', 'seconds': int(self.options.hours * 3600) + 600, 'mission': 'Soak'})
+        interval = self.options.tick_ms / 1000.0
+        due = next_tick = next_sample = time.monotonic()
+        while not self.done():
+            started = time.monotonic()
+            main.TICK_LATENESS_SECONDS.observe(max(0.0, started - due))
+            main.clock.on_tick()
+            self.drive(engine)
+            engine.tick()
+            main.TICK_SECONDS.observe(time.monotonic() - started)
+            if started >= next_sample:
+                self.sample(engine)
+                next_sample = started + self.options.sample_seconds
+            next_tick += interval
+            due = next_tick
+            if next_tick < time.monotonic():
+                next_tick = time.monotonic()
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+        self.sample(engine)
+        engine.close()
+
+    def run_tk(self):
+        main.load_tk()
+        self.root = main.tk.Tk()
+        app = main.CountdownApp(self.root, tick_ms=self.options.tick_ms)
+        self.sim_start = main.clock.time()
+        app.engine.execute({'cmd': 'start', 'seconds': int(self.options.hours * 3600) + 600, 'mission': 'Soak'})
+
+        def step():
+            if self.done():
+                self.sample(app.engine)
+                self.root.quit()
+                return
+            self.drive(app.engine)
+            self.sample(app.engine)
+            # open and close a settings window now and then, as operators do
+            if len(self.samples) % 10 == 0:
+                app.show_settings_window()
+                win = getattr(app, 'settings_win', None)
+                if win is not None:
+                    self.root.after(500, win.destroy)
+            self.root.after(int(self.options.sample_seconds * 1000), step)
+
+        self.root.after(int(self.options.sample_seconds * 1000), step)
+        self.root.mainloop()
+        app.engine.close()
+        self.root.destroy()
+        self.root = None
+
+
+def growth(samples, key):
+    """(first-half median, second-half median, last) of one sampled value, skipping missing ones."""
+    values = [s[key] for s in samples if s.get(key) is not None]
+    if len(values) < 4:
+        return None
+    half = len(values) // 2
+    median = lambda v: sorted(v)[len(v) // 2]
+    return median(values[:half]), median(values[half:]), values[-1]
+
+
+def report(soak, options):
+    samples = soak.samples
+    findings = []
+    checks = {
+        # key: (allowed absolute growth between half medians, unit)
+        'rss_mb': (options.rss_tolerance_mb, 'MB'),
+        'fds': (3, 'fds'),
+        'threads': (3, 'threads'),
+        'widgets': (0, 'widgets'),
+        'lateness_ms': (options.lateness_tolerance_ms, 'ms'),
+    }
+    summary = {}
+    for key, (tolerance, unit) in checks.items():
+        g = growth(samples, key)
+        if g is None:
+            continue
+        first, second, last = g
+        summary[key] = {'first_half_median': first, 'second_half_median': second, 'last': last}
+        if second - first > tolerance:
+            findings.append(f"{key} grew from {first:.2f} to {second:.2f} {unit} (median, first vs second half)")
+    by_phase = {}
+    for s in samples:
+        if s.get('lateness_ms') is not None:
+            by_phase.setdefault(s['phase'], []).append(s['lateness_ms'])
+    summary['lateness_ms_by_phase'] = {p: {'mean': round(sum(v) / len(v), 3), 'max': max(v)} for p, v in by_phase.items()}
+    return {
+        'options': vars(options),
+        'duration_real_s': samples[-1]['real_s'] if samples else 0,
+        'simulated_hours': samples[-1]['sim_h'] if samples else 0,
+        'sheet_requests': soak.server.requests,
+        'summary': summary,
+        'findings': findings,
+        'ok': not findings,
+        'samples': samples,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RocketLaunchCountdown soak test")
+    parser.add_argument('--hours', type=float, default=8.0, help="simulated session length (default 8)")
+    parser.add_argument('--speed', type=float, default=200.0, help="clock acceleration (default 200)")
+    parser.add_argument('--tick-ms', type=int, default=main.TICK_MS, help="real tick interval")
+    parser.add_argument('--sample-seconds', type=float, default=2.0, help="real seconds between samples")
+    parser.add_argument('--phase-seconds', type=float, default=15.0, help="real seconds per sheet server phase")
+    parser.add_argument('--slow-seconds', type=float, default=1.5, help="response delay in the slow phase")
+    parser.add_argument('--hold-minutes', type=float, default=10.0, help="simulated hold at the top of each hour")
+    parser.add_argument('--rss-tolerance-mb', type=float, default=5.0)
+    parser.add_argument('--lateness-tolerance-ms', type=float, default=20.0)
+    parser.add_argument('--tk', action='store_true', help="drive the CountdownApp window instead of the bare engine")
+    parser.add_argument('-o', '--output', help="write the JSON report here (default: soak-<time>.json in the cwd)")
+    options = parser.parse_args()
+
+    server = start_sheet_server(options.phase_seconds, options.slow_seconds)
+    settings = dict(main.DEFAULT_SETTINGS, mode='spreadsheet', column=12,
+                    sheet_link=f"http://127.0.0.1:{server.server_address[1]}/sheet.csv")
+    main.save_settings(settings)
+    main.set_clock(main.SimulatedClock(speed=options.speed))
+
+    soak = Soak(options, server)
+    try:
+        soak.run_tk() if options.tk else soak.run_headless()
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    main.timeline.close()
+    shutil.rmtree(_home, ignore_errors=True)
+
+    result = report(soak, options)
+    path = options.output or f"soak-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(result, fh, indent=2)
+    print(f"{result['simulated_hours']:.2f} simulated hours in {result['duration_real_s']:.0f} s; report: {path}")
+    for key, values in result['summary'].items():
+        print(f"  {key}: {values}")
+    for finding in result['findings'] or ["no growth beyond tolerances"]:
+        print(f"  - {finding}")
+    sys.exit(0 if result['ok'] else 1)
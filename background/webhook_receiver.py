@@ -0,0 +1,124 @@
+"""Stand-in webhook receiver for trying out the `webhooks` setting without a real lighting desk or bot.
+
+    python background/webhook_receiver.py                       # listen on 127.0.0.1:8600, print each POST
+    python background/webhook_receiver.py --fail-rate 0.3 --delay 0.5
+    python background/webhook_receiver.py --demo                # drive a countdown against it and report
+
+Each POST is printed with its sequence number, events, attempt and how long it took to
+arrive. --fail-rate answers that share of requests with 503 (the app retries those) and
+--delay slows every answer. --demo starts the countdown engine in a temporary HOME, points
+its webhooks here, runs hold / resume / Go/No-Go flips / scrub and a T-0, then prints the
+deliveries the app recorded and what arrived.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Receiver(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if random.random() < self.server.fail_rate:
+            self.send_response(503)
+            self.end_headers()
+            return
+        arrived = time.time()
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+        with self.server.lock:
+            self.server.received.append((arrived, self.path, payload))
+        self.send_response(204)
+        self.end_headers()
+        if not self.server.quiet:
+            events = ', '.join(e.get('event', '?') for e in payload.get('events', []))
+            transit = (arrived - payload.get('sent_at', arrived)) * 1000
+            print(f"{self.path} seq={payload.get('seq')} attempt={payload.get('attempt')} "
+                  f"transit={transit:.1f} ms events: {events}", flush=True)
+
+
+def start_receiver(port=0, fail_rate=0.0, delay=0.0, quiet=False):
+    httpd = ThreadingHTTPServer(('127.0.0.1', port), Receiver)
+    httpd.daemon_threads = True
+    httpd.fail_rate = fail_rate
+    httpd.delay = delay
+    httpd.quiet = quiet
+    httpd.received = []
+    httpd.lock = threading.Lock()
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def demo(httpd):
+    home = tempfile.mkdtemp(prefix="rlc-webhooks-")
+    os.environ['HOME'] = os.environ['USERPROFILE'] = home
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import main
+
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    main.save_settings(dict(main.DEFAULT_SETTINGS, mode='buttons', webhooks={
+        'targets': [{'url': f"{base}/lights", 'events': ['hold', 'resume', 'scrub', 't0']},
+                    {'url': f"{base}/bot"}],
+        'coalesce_ms': 200,
+    }))
+    engine = main.CountdownEngine()
+    run = lambda seconds: [engine.tick() or time.sleep(0.05) for _ in range(int(seconds / 0.05))]
+    engine.execute({'cmd': 'start', 'seconds': 2, 'mission': 'Webhook demo'})
+    run(0.5)
+    engine.execute({'cmd': 'hold'})
+    engine.execute({'cmd': 'resume'})  # same window as the hold: one POST with both
+    run(0.5)
+    for value in ('GO', 'NO-GO', 'GO'):
+        engine.execute({'cmd': 'set_manual', 'which': 'range', 'value': value})
+    run(2.5)  # T-0 passes
+    engine.execute({'cmd': 'scrub'})
+    run(1.0)
+    deliveries = list(engine.webhooks.recent)
+    engine.webhooks.close()
+    engine.outputs.close()
+    main.timeline.close()
+    shutil.rmtree(home, ignore_errors=True)
+
+    print("\ndeliveries recorded by the app:")
+    for d in deliveries:
+        print(f"  {d['url']:<32} seq={d['seq']:<3} {d['status']:<7} attempts={d['attempts']} "
+              f"latency={d['latency_ms']:.1f} ms  {', '.join(d['events'])}")
+    print(f"\n{len(httpd.received)} POSTs arrived; {sum(d['status'] == 'ok' for d in deliveries)} "
+          f"of {len(deliveries)} deliveries succeeded")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stand-in webhook receiver")
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds to wait before answering")
+    parser.add_argument('--demo', action='store_true', help="drive a countdown against this receiver and report")
+    parser.add_argument('--quiet', action='store_true')
+    options = parser.parse_args()
+
+    httpd = start_receiver(0 if options.demo else options.port, options.fail_rate, options.delay, options.quiet)
+    if options.demo:
+        demo(httpd)
+        httpd.shutdown()
+    else:
+        print(f"listening on http://127.0.0.1:{httpd.server_address[1]}/ (Ctrl+C to stop)", flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            httpd.shutdown()
@@ -1,19 +1,52 @@
-import tkinter as tk
-from tkinter import colorchooser
+import sys
 import time
+# startup timing is measured from here (see StartupTimer)
+STARTUP_T0 = time.perf_counter()
 import threading
 from datetime import datetime, timedelta
 import re
-import requests
 import csv
 import io
 import os
 import json
+import errno
+import heapq
+import traceback
+import logging
+import logging.handlers
+import bisect
+import struct
+import zlib
+import string
+import random
+import argparse
+import atexit
+import queue
+import socket
+import socketserver
+import signal
+import stat
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qsl
 try:
     from zoneinfo import ZoneInfo
 except Exception:
     ZoneInfo = None
 
+# tkinter is imported on demand by load_tk() so headless mode never loads it
+tk = colorchooser = simpledialog = filedialog = messagebox = tkfont = None
+
+
+def load_tk():
+    global tk, colorchooser, simpledialog, filedialog, messagebox, tkfont
+    if tk is None:
+        import tkinter
+        from tkinter import colorchooser, simpledialog, filedialog, messagebox
+        from tkinter import font as tkfont
+        tk = tkinter
+    return tk
+
 # Get the user's Documents folder (cross-platform)
 documents_folder = os.path.join(os.path.expanduser("~"), "Documents")
 
@@ -25,9 +58,18 @@ os.makedirs(app_folder, exist_ok=True)
 COUNTDOWN_HTML = os.path.join(app_folder, "countdown.html")
 GONOGO_HTML = os.path.join(app_folder, "gonogo.html")
 SHEET_LINK = ""
-session = requests.Session()
+# seconds a sheet fetch may take before it counts as failed
+GONOGO_FETCH_TIMEOUT = 3
+# requests is imported on first use (see get_session); it is most of our import time
+_session = None
 appVersion = "0.5.0"
 SETTINGS_FILE = os.path.join(app_folder, "settings.json")
+SEQUENCE_FILE = os.path.join(app_folder, "sequence.json")
+PRIMARY_COUNTDOWN = "main"
+TIMELINE_FILE = os.path.join(app_folder, "timeline.jsonl")
+LOG_FILE = os.path.join(app_folder, "rocketlaunchcountdown.log")
+STATE_SNAPSHOT_FILE = os.path.join(app_folder, "state_snapshot.json")
+STARTUP_TIMINGS_FILE = os.path.join(app_folder, "startup_timings.jsonl")
 
 # Default settings
 DEFAULT_SETTINGS = {
@@ -36,7 +78,9 @@ DEFAULT_SETTINGS = {
     "range_row": 2,
     "weather_row": 3,
     "vehicle_row": 4,
-    "column": 12
+    "column": 12,
+    # names of the countdowns run side by side; the first drives countdown.html
+    "countdowns": [PRIMARY_COUNTDOWN]
 }
 # default timezone: 'local' uses system local tz, otherwise an IANA name or 'UTC'
 DEFAULT_SETTINGS.setdefault('timezone', 'local')
@@ -73,30 +117,655 @@ TIMEZONE_CHOICES = [
 ]
 
 def load_settings():
+    started = time.perf_counter()
     try:
         if os.path.exists(SETTINGS_FILE):
             with open(SETTINGS_FILE, 'r', encoding='utf-8') as fh:
                 return json.load(fh)
     except Exception:
         pass
+    finally:
+        elapsed = time.perf_counter() - started
+        SETTINGS_IO_SECONDS.observe(elapsed, op='load')
+        if profiler.enabled:
+            profiler.record('settings', elapsed)
     # ensure default saved
     save_settings(DEFAULT_SETTINGS)
     return DEFAULT_SETTINGS.copy()
 
 def save_settings(s):
+    started = time.perf_counter()
     try:
         with open(SETTINGS_FILE, 'w', encoding='utf-8') as fh:
             json.dump(s, fh, indent=2)
     except Exception:
         pass
+    SETTINGS_IO_SECONDS.observe(time.perf_counter() - started, op='save')
+
+
+# -------------------------
+# Logging (ring buffer + background file/console writer)
+# -------------------------
+class RateLimitFilter(logging.Filter):
+    """Passes at most `burst` records per (level, message template) every `window` seconds.
+
+    When a window in which records were dropped ends, the last dropped record is logged
+    with `suppressed`, the number dropped, so a flood that stops still leaves its count.
+    """
+
+    def __init__(self, burst=5, window=1.0, max_keys=1000):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.max_keys = max_keys
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._seen.get(key)
+            if state is None or now - state[0] >= self.window:
+                if state is not None and state[2]:
+                    # arrived before the window's report did: carry the count here instead
+                    record.suppressed = state[2]
+                    state[2] = 0
+                if len(self._seen) >= self.max_keys:
+                    self._seen.clear()
+                # window start, records passed, records dropped, last dropped record
+                self._seen[key] = [now, 1, 0, None]
+                return True
+            if state[1] < self.burst:
+                state[1] += 1
+                return True
+            state[2] += 1
+            state[3] = record
+            if state[2] == 1:
+                timer = threading.Timer(state[0] + self.window - now, self._report, (state,))
+                timer.daemon = True
+                timer.start()
+            return False
+
+    def _report(self, state):
+        with self._lock:
+            count, record = state[2], state[3]
+            state[2] = 0
+        if count:
+            summary = logging.makeLogRecord(record.__dict__)
+            summary.suppressed = count
+            summary.created = time.time()
+            # straight to the handlers: the summary must not count against the next window
+            logging.getLogger(record.name).callHandlers(summary)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records in memory for the log viewer."""
+
+    def __init__(self, capacity=2000):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def entries(self, level=logging.NOTSET):
+        return [r for r in list(self.records) if r.levelno >= level]
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line: time, level, message, plus `fields` passed via extra={'fields': {...}}."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'suppressed', 0):
+            entry['suppressed'] = record.suppressed
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def format_log_line(record):
+    line = f"[{record.levelname}] {record.getMessage()}"
+    if getattr(record, 'suppressed', 0):
+        line += f" ({record.suppressed} similar suppressed)"
+    return line
+
+
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        return format_log_line(record)
+
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+log = logging.getLogger("RocketLaunchCountdown")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addFilter(RateLimitFilter())
+log_buffer = RingBufferHandler()
+log.addHandler(log_buffer)
+_log_listener = None
+
+
+def setup_logging(level=None, path=LOG_FILE, console=True):
+    """Send log records to a rotating JSON-lines file (and stderr when there is one) from a background thread.
+
+    Callers on the tick loop only pay for the level check, the rate limit and a queue put.
+    Safe to call again to change the level.
+    """
+    global _log_listener
+    if level is not None:
+        log.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+    if _log_listener is not None:
+        return log
+    handlers = []
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=1_000_000, backupCount=3,
+                                                            encoding='utf-8', delay=True)
+        file_handler.setFormatter(JsonLineFormatter())
+        handlers.append(file_handler)
+    except Exception as e:
+        log.error("Failed to open log file %s: %s", path, e)
+    # windowed builds have no console (sys.stderr is None)
+    if console and sys.stderr is not None:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(ConsoleFormatter())
+        handlers.append(console_handler)
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    return log
+
+
+# -------------------------
+# Clock source (real time, or accelerated for rehearsals)
+# -------------------------
+class SystemClock:
+    """Wall-clock time; the default time source."""
+
+    def time(self):
+        return time.time()
+
+    def on_tick(self):
+        pass
+
+
+class SimulatedClock:
+    """Time that runs `speed` times faster than real time, starting from `start` (epoch seconds).
+
+    With `step` set the clock is fully deterministic instead: it only moves, by exactly
+    `step` simulated seconds, each time the tick loop calls on_tick().
+    """
+
+    def __init__(self, speed=1.0, start=None, step=None):
+        self.speed = max(0.0, float(speed))
+        self.step = step
+        self._base = time.time() if start is None else float(start)
+        self._mono0 = time.monotonic()
+
+    def time(self):
+        if self.step is not None:
+            return self._base
+        return self._base + (time.monotonic() - self._mono0) * self.speed
+
+    def set_speed(self, speed):
+        # rebase so changing speed doesn't jump the clock
+        self._base = self.time()
+        self._mono0 = time.monotonic()
+        self.speed = max(0.0, float(speed))
+
+    def on_tick(self):
+        if self.step is not None:
+            self._base += self.step
+
+
+clock = SystemClock()
+
+
+def set_clock(source):
+    """Swap the time source read by the countdown engine, the app and the Go/No-Go poller."""
+    global clock
+    clock = source
+    return source
+
+
+# -------------------------
+# Metrics (Prometheus text format)
+# -------------------------
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _label_value(value):
+    # the exposition format's escapes; sink names and webhook URLs come from settings
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(key):
+    if not key:
+        return ''
+    return '{' + ','.join(f'{k}="{_label_value(v)}"' for k, v in key) + '}'
+
+
+def _label_key(labels):
+    if not labels:
+        return ()
+    return tuple(labels.items()) if len(labels) == 1 else tuple(sorted(labels.items()))
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels (inc(status='200'))."""
+    kind = 'counter'
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return sorted(self._values.items())
+
+    def render(self):
+        return [f"{self.name}{_label_text(key)} {value}" for key, value in self.samples()]
+
+
+class Histogram:
+    """Cumulative-bucket histogram as Prometheus expects; observe() is a bisect and three adds."""
+    kind = 'histogram'
+
+    def __init__(self, name, help, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # per-bucket counts (last slot is +Inf), sum, count
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        with self._lock:
+            return sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+
+    def quantile(self, q, counts, total):
+        """Upper bound of the bucket holding the q-th observation (an estimate, as in Prometheus)."""
+        seen = 0
+        for bound, n in zip(self.buckets + (float('inf'),), counts):
+            seen += n
+            if seen >= q * total:
+                return bound
+        return float('inf')
+
+    def render(self):
+        lines = []
+        for key, (counts, total_sum, total) in self.samples():
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float('inf'),), counts):
+                cumulative += n
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f"{self.name}_bucket{_label_text(key + (('le', le),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_label_text(key)} {total_sum}")
+            lines.append(f"{self.name}_count{_label_text(key)} {total}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name, help):
+        metric = Counter(name, help)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help, buckets=LATENCY_BUCKETS):
+        metric = Histogram(name, help, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """The whole registry in Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """Rows of (series, count, mean_ms, p50_ms, p95_ms, value) for the debug panel."""
+        rows = []
+        for metric in self._metrics:
+            if metric.kind == 'counter':
+                for key, value in metric.samples():
+                    rows.append((metric.name + _label_text(key), None, None, None, None, value))
+                continue
+            for key, (counts, total_sum, total) in metric.samples():
+                if not total:
+                    continue
+                scale = 1000 if metric.name.endswith('_seconds') else 1
+                rows.append((metric.name + _label_text(key), total, total_sum / total * scale,
+                             metric.quantile(0.5, counts, total) * scale,
+                             metric.quantile(0.95, counts, total) * scale, None))
+        return rows
+
+
+metrics = MetricsRegistry()
+TICK_SECONDS = metrics.histogram('rlc_tick_duration_seconds', "Time spent in one countdown tick (update_clock)")
+TICK_LATENESS_SECONDS = metrics.histogram('rlc_tick_lateness_seconds', "How late a tick started against its schedule")
+GONOGO_FETCH_SECONDS = metrics.histogram('rlc_gonogo_fetch_seconds', "Go/No-Go sheet HTTP request time")
+GONOGO_FETCH_TOTAL = metrics.counter('rlc_gonogo_fetch_total', "Go/No-Go sheet fetches by HTTP status")
+GONOGO_FETCH_BYTES = metrics.counter('rlc_gonogo_fetch_bytes_total', "Bytes downloaded from the Go/No-Go sheet")
+CSV_PARSE_SECONDS = metrics.histogram('rlc_csv_parse_seconds', "Time to parse the Go/No-Go sheet CSV")
+HTML_WRITE_SECONDS = metrics.histogram('rlc_html_write_seconds', "Time to render and write an HTML output")
+HTML_WRITE_BYTES = metrics.counter('rlc_html_write_bytes_total', "Bytes written to HTML outputs")
+SETTINGS_IO_SECONDS = metrics.histogram('rlc_settings_io_seconds', "settings.json load/save time")
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if urlparse(self.path).path not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(port):
+    """Serve GET /metrics on the loopback interface if a port is configured; errors are reported, not raised."""
+    if not port:
+        return None
+    try:
+        httpd = ThreadingHTTPServer((CONTROL_HOST, int(port)), MetricsRequestHandler)
+        httpd.daemon_threads = True
+        threading.Thread(target=httpd.serve_forever, name="metrics", daemon=True).start()
+        return httpd
+    except Exception as e:
+        log.error("Failed to start metrics endpoint on port %s: %s", port, e)
+        return None
+
+
+# -------------------------
+# Profiling (--profile): per-stage timers and cProfile capture windows
+# -------------------------
+PROFILE_SUMMARY_FILE = os.path.join(app_folder, "profile_summary.txt")
+
+
+class StageProfiler:
+    """Accumulates time per hot-path stage (tick, settings, fetch, parse, render, write, outputs, tk).
+
+    Call sites guard with `if profiler.enabled:` so the disabled cost is one attribute read.
+    A cProfile window is started with start_capture() on the thread to profile (the Tk or
+    headless loop) and stopped by check() from the engine tick once its time is up.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages = {}
+        self._capture = None
+        self._capture_until = None
+
+    def record(self, stage, seconds):
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = [0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += seconds
+        if seconds > totals[2]:
+            totals[2] = seconds
+
+    def summary(self):
+        """Stage table, largest total first; share is of loop time (tick + tk), which the other stages sit inside."""
+        rows = sorted(self.stages.items(), key=lambda item: item[1][1], reverse=True)
+        grand = sum(self.stages[s][1] for s in ('tick', 'tk') if s in self.stages) or sum(t[1] for _, t in rows) or 1.0
+        lines = [f"{'stage':<10}{'calls':>9}{'total ms':>12}{'mean ms':>10}{'max ms':>10}{'of loop':>9}"]
+        for stage, (count, total, worst) in rows:
+            lines.append(f"{stage:<10}{count:>9}{total * 1000:>12.1f}{total / count * 1000:>10.3f}"
+                         f"{worst * 1000:>10.3f}{total / grand:>9.1%}")
+        return '\n'.join(lines)
+
+    def write_summary(self, path=PROFILE_SUMMARY_FILE):
+        if not self.stages:
+            return None
+        try:
+            with open(path, 'w', encoding='utf-8') as fh:
+                fh.write(f"RocketLaunchCountdown {appVersion} stage profile, {datetime.now().isoformat(timespec='seconds')}\n\n")
+                fh.write(self.summary() + '\n')
+            return path
+        except Exception as e:
+            log.error("Failed to write profile summary: %s", e)
+            return None
+
+    @property
+    def capturing(self):
+        return self._capture is not None
+
+    def start_capture(self, seconds=10.0):
+        """Profile the calling thread for `seconds`; ignored if a capture is already running."""
+        if self._capture is not None:
+            return False
+        import cProfile
+        self._capture = cProfile.Profile()
+        self._capture_until = time.monotonic() + max(0.1, float(seconds))
+        self._capture.enable()
+        return True
+
+    def check(self):
+        """Finish the capture window once its time is up; returns the .pstats path when one was written."""
+        if self._capture is None or time.monotonic() < self._capture_until:
+            return None
+        return self.stop_capture()
+
+    def stop_capture(self):
+        capture, self._capture = self._capture, None
+        if capture is None:
+            return None
+        capture.disable()
+        import pstats
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(app_folder, f"profile-{stamp}.pstats")
+        try:
+            capture.dump_stats(path)
+            # a readable top-30 next to the raw dump, plus the stage table
+            with open(path[:-len('.pstats')] + '.txt', 'w', encoding='utf-8') as fh:
+                fh.write(self.summary() + '\n\n')
+                pstats.Stats(capture, stream=fh).sort_stats('cumulative').print_stats(30)
+            self.write_summary()
+            log.info("Profile saved to %s", path)
+            return path
+        except Exception as e:
+            log.error("Failed to save profile capture: %s", e)
+            return None
+
+
+profiler = StageProfiler()
+
+
+class StartupTimer:
+    """Startup milestones in ms since main.py began executing (interpreter start-up itself is not included).
+
+    Once every expected milestone is in, one line is appended to startup_timings.jsonl so
+    releases can be compared.
+    """
+
+    def __init__(self, t0, expect=('imports', 'tk_init', 'first_paint', 'first_data')):
+        self.t0 = t0
+        self.expect = expect
+        self.marks = {}
+        self.mode = 'window'
+        self.written = False
+
+    def mark(self, name):
+        if name in self.marks:
+            return
+        self.marks[name] = round((time.perf_counter() - self.t0) * 1000, 1)
+        if not self.written and all(m in self.marks for m in self.expect):
+            self.written = True
+            self.write()
+
+    def write(self, path=STARTUP_TIMINGS_FILE):
+        entry = {'time': datetime.now().isoformat(timespec='seconds'), 'version': appVersion,
+                 'mode': self.mode, 'ms': self.marks}
+        log.info("Startup: %s", ', '.join(f"{k} {v:.0f} ms" for k, v in self.marks.items()))
+        try:
+            with open(path, 'a', encoding='utf-8') as fh:
+                fh.write(json.dumps(entry) + '\n')
+        except Exception as e:
+            log.error("Failed to write startup timings: %s", e)
+
+
+startup = StartupTimer(STARTUP_T0)
+
+
+# -------------------------
+# Event timeline (append-only JSONL)
+# -------------------------
+class TimelineRecorder:
+    """Buffered, append-only log of countdown and Go/No-Go state transitions.
+
+    record() only appends to a bounded in-memory buffer (oldest entries are dropped if
+    the writer falls behind), so it never blocks the tick loop. A daemon thread
+    flushes the buffer to a JSONL file every `flush_interval` seconds. Listeners (such as
+    WebhookNotifier.notify) see each entry as it is recorded and must not block.
+    """
+
+    def __init__(self, path=TIMELINE_FILE, max_pending=10000, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pending = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        # held from taking a batch until it is on disk, so concurrent flushes keep entries in order;
+        # record() only takes _lock and never waits on the file
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+        self.listeners = []
+
+    def record(self, event, **fields):
+        entry = {'wall': clock.time(), 'mono': time.monotonic(), 'event': event}
+        entry.update(fields)
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(entry)
+        for listener in self.listeners:
+            try:
+                listener(entry)
+            except Exception as e:
+                log.error("Timeline listener failed: %s", e)
+        if self._thread is None and not self._closed:
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="timeline-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+            try:
+                with open(self.path, 'a', encoding='utf-8') as fh:
+                    fh.write(''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in batch))
+            except Exception as e:
+                log.error("Failed to write timeline: %s", e)
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+
+def export_timeline_csv(csv_path, jsonl_path=TIMELINE_FILE):
+    """Convert a timeline JSONL file to CSV; nested values are kept as JSON text."""
+    rows = []
+    columns = ['wall', 'wall_iso', 'mono', 'event']
+    with open(jsonl_path, 'r', encoding='utf-8') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except Exception:
+                continue
+            try:
+                entry['wall_iso'] = datetime.fromtimestamp(float(entry.get('wall', 0))).isoformat(timespec='milliseconds')
+            except Exception:
+                entry['wall_iso'] = ''
+            for key in entry:
+                if key not in columns:
+                    columns.append(key)
+            rows.append(entry)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        for entry in rows:
+            writer.writerow({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in entry.items()})
+    return len(rows)
+
+
+timeline = TimelineRecorder()
+atexit.register(timeline.close)
 
 
 # -------------------------
 # Fetch Go/No-Go Data
 # -------------------------
-def fetch_gonogo():
+def get_session():
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+def fetch_gonogo(settings=None):
     """Fetch Go/No-Go parameters either from configured spreadsheet or return manual button values."""
-    settings = load_settings()
+    settings = settings if settings is not None else load_settings()
     mode = settings.get('mode', 'spreadsheet')
     # If manual mode, read values from a runtime stash (set by the GUI buttons)
     if mode == 'buttons':
@@ -114,11 +783,28 @@ def fetch_gonogo():
     rows = [int(settings.get('range_row', 2)) - 1,
             int(settings.get('weather_row', 3)) - 1,
             int(settings.get('vehicle_row', 4)) - 1]
+    started = time.perf_counter()
     try:
-        resp = session.get(link, timeout=3)
+        try:
+            resp = get_session().get(link, timeout=GONOGO_FETCH_TIMEOUT)
+        except Exception:
+            GONOGO_FETCH_TOTAL.inc(status='error')
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            GONOGO_FETCH_SECONDS.observe(elapsed)
+            if profiler.enabled:
+                profiler.record('fetch', elapsed)
+        GONOGO_FETCH_TOTAL.inc(status=str(resp.status_code))
+        GONOGO_FETCH_BYTES.inc(len(resp.content))
         resp.raise_for_status()
+        started = time.perf_counter()
         reader = csv.reader(io.StringIO(resp.text))
         data = list(reader)
+        elapsed = time.perf_counter() - started
+        CSV_PARSE_SECONDS.observe(elapsed)
+        if profiler.enabled:
+            profiler.record('parse', elapsed)
         gonogo = []
         for r in rows:
             val = 'N/A'
@@ -127,10 +813,188 @@ def fetch_gonogo():
             gonogo.append(val.strip().upper())
         return gonogo
     except Exception as e:
-        print(f"[ERROR] Failed to fetch Go/No-Go from sheet: {e}")
+        log.error("Failed to fetch Go/No-Go from sheet: %s", e, extra={'fields': {'link': link}})
         return ["ERROR", "ERROR", "ERROR"]
 
 
+MANUAL_KEYS = ('range', 'weather', 'vehicle')
+
+
+def set_manual_gonogo(which, val, persist=True):
+    """Set a manual Go/No-Go value (Buttons mode), log it and optionally persist it to settings."""
+    v = (val or '').strip().upper()
+    if which not in MANUAL_KEYS:
+        raise ValueError(f"Unknown Go/No-Go parameter: {which}")
+    setattr(fetch_gonogo, f'manual_{which}', v)
+    timeline.record('set_manual', which=which, value=v)
+    if persist:
+        persist_manual_gonogo()
+    return v
+
+
+def persist_manual_gonogo():
+    """Save the current manual Go/No-Go values so they survive restarts."""
+    try:
+        s = load_settings()
+        for key in MANUAL_KEYS:
+            s[f'manual_{key}'] = getattr(fetch_gonogo, f'manual_{key}', s.get(f'manual_{key}'))
+        save_settings(s)
+    except Exception:
+        pass
+
+
+def restore_manual_gonogo(settings=None):
+    """Load persisted manual Go/No-Go values back onto fetch_gonogo."""
+    s = settings if settings is not None else load_settings()
+    for key in MANUAL_KEYS:
+        val = s.get(f'manual_{key}')
+        if val and not hasattr(fetch_gonogo, f'manual_{key}'):
+            setattr(fetch_gonogo, f'manual_{key}', val)
+
+
+# -------------------------
+# Process-isolated Go/No-Go fetcher
+# -------------------------
+FETCHER_HEARTBEAT_SECONDS = 0.5
+FETCHER_RESTARTS = metrics.counter('rlc_fetcher_restarts_total', "Go/No-Go fetcher processes restarted, by reason")
+FETCHER_ROUNDTRIP_SECONDS = metrics.histogram('rlc_fetcher_roundtrip_seconds', "Request-to-result time of the fetcher process")
+FETCHER_DISCARDED = metrics.counter('rlc_fetcher_discarded_total', "Fetcher results dropped as stale")
+
+
+class _PipeLogHandler(logging.Handler):
+    def __init__(self, conn):
+        super().__init__()
+        self.conn = conn
+
+    def emit(self, record):
+        try:
+            self.conn.send(('log', record.levelno, record.getMessage()))
+        except Exception:
+            pass
+
+
+def _fetcher_main(conn, heartbeat=FETCHER_HEARTBEAT_SECONDS):
+    """Worker process loop: answer ('fetch', id) with ('result', id, values), beat in between.
+
+    A fetch that hangs also stops the heartbeats, which is how the supervisor notices.
+    """
+    log.addHandler(_PipeLogHandler(conn))
+    try:
+        while True:
+            if conn.poll(heartbeat):
+                msg = conn.recv()
+                if msg is None:
+                    return
+                conn.send(('result', msg[1], fetch_gonogo()))
+            conn.send(('heartbeat',))
+    except (EOFError, OSError):
+        # the app went away
+        return
+
+
+class ProcessFetcher:
+    """Go/No-Go source backed by a supervised worker process, for a network that misbehaves.
+
+    Calls never block: each one reads whatever the worker has sent, restarts it if it has
+    missed heartbeats for `heartbeat_timeout` seconds (or died), sends the next request when
+    none is outstanding, and returns the newest values (None until the first answer).
+    Results for anything but the outstanding request are stale and dropped, as are results
+    whose request is older than `max_age` seconds. A restart or a request left unanswered
+    for `max_age` turns the values to ERROR, as a failed fetch would, so an old GO is never
+    shown as current.
+    """
+
+    def __init__(self, heartbeat_timeout=10.0, max_age=15.0):
+        import multiprocessing
+        self.ctx = multiprocessing.get_context('spawn')
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_age = max_age
+        self.values = None
+        self.proc = None
+        self.conn = None
+        self._next_id = 0
+        self._pending = None
+        self._last_start = 0.0
+        self._start()
+
+    def _start(self):
+        parent, child = self.ctx.Pipe()
+        self.proc = self.ctx.Process(target=_fetcher_main, args=(child,), name="gonogo-fetcher", daemon=True)
+        self.proc.start()
+        child.close()
+        self.conn = parent
+        self._pending = None
+        self._last_start = self.last_heartbeat = time.monotonic()
+
+    def restart(self, reason):
+        FETCHER_RESTARTS.inc(reason=reason)
+        log.warning("Restarting the Go/No-Go fetcher process (%s)", reason)
+        self.close()
+        self._start()
+        self._expire()
+
+    def _expire(self):
+        # nothing current to show: say so rather than keep the last (or restored) answer up
+        self.values = ["ERROR", "ERROR", "ERROR"]
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+        if self.proc is not None and self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join(1.0)
+
+    def _drain(self):
+        now = time.monotonic()
+        try:
+            while self.conn.poll():
+                msg = self.conn.recv()
+                self.last_heartbeat = now
+                if msg[0] == 'log':
+                    log.log(msg[1], "[fetcher] %s", msg[2])
+                elif msg[0] == 'result':
+                    pending = self._pending
+                    if pending is None or pending[0] != msg[1]:
+                        FETCHER_DISCARDED.inc()
+                        continue
+                    self._pending = None
+                    if now - pending[1] > self.max_age:
+                        FETCHER_DISCARDED.inc()
+                        self._expire()
+                        continue
+                    FETCHER_ROUNDTRIP_SECONDS.observe(now - pending[1])
+                    self.values = list(msg[2])
+        except (EOFError, OSError):
+            pass
+
+    def __call__(self, settings=None):
+        # buttons mode answers from this process's manual values, no network involved;
+        # the engine passes the settings its tick already loaded
+        s = settings if settings is not None else load_settings()
+        if s.get('mode', 'spreadsheet') == 'buttons':
+            return fetch_gonogo(s)
+        self._drain()
+        now = time.monotonic()
+        if not self.proc.is_alive():
+            # don't spin if the worker cannot start at all
+            if now - self._last_start > 1.0:
+                self.restart('exited')
+        elif now - self.last_heartbeat > self.heartbeat_timeout:
+            self.restart('missed heartbeats')
+        elif self._pending is not None and now - self._pending[1] > self.max_age:
+            self._expire()
+        if self._pending is None and self.proc.is_alive():
+            self._next_id += 1
+            try:
+                self.conn.send(('fetch', self._next_id))
+                self._pending = (self._next_id, now)
+            except (EOFError, OSError):
+                pass
+        return self.values
+
+
 # -------------------------
 # Helper for color
 # -------------------------
@@ -165,15 +1029,32 @@ def format_status_display(status):
 # -------------------------
 # Write Countdown HTML
 # -------------------------
-def write_countdown_html(mission_name, timer_text):
-    s = load_settings()
+def render_countdown_html(mission_name, timer_text, settings=None, template=None, stale=False, name=None):
+    """Build countdown.html; a custom `template` (string.Template text) may use $mission, $timer,
+    $bg, $text, $font, $mission_px, $timer_px and $stale ('stale' while the clock is not live).
+
+    With `time_sync_port` set, the page renders countdown `name` itself from the time-sync
+    service instead of reloading this file every second.
+    """
+    s = settings if settings is not None else load_settings()
     # Prefer HTML-specific settings; fall back to GUI appearance settings for backwards compatibility
     bg = s.get('html_bg_color', s.get('bg_color', '#000000'))
     text = s.get('html_text_color', s.get('text_color', '#FFFFFF'))
     font = s.get('html_font_family', s.get('font_family', 'Consolas, monospace'))
     mission_px = int(s.get('html_mission_font_px', s.get('mission_font_px', 48)))
     timer_px = int(s.get('html_timer_font_px', s.get('timer_font_px', 120)))
-    html = f"""<!DOCTYPE html>
+    if template is not None:
+        return string.Template(template).safe_substitute(
+            mission=mission_name, timer=timer_text, bg=bg, text=text, font=font,
+            mission_px=mission_px, timer_px=timer_px, stale='stale' if stale else '')
+    stale_banner = '<div id="stale">CLOCK NOT LIVE</div>\n' if stale else ''
+    live = ''
+    reload_script = '<script>\nsetTimeout(() => location.reload(), 1000);\n</script>\n'
+    if s.get('time_sync_port'):
+        live = time_sync_page_script(name or PRIMARY_COUNTDOWN,
+                                     s.get('time_sync_url') or f"http://127.0.0.1:{s['time_sync_port']}")
+        reload_script = ''
+    return f"""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="UTF-8">
@@ -190,26 +1071,39 @@ body {{
 }}
 #mission {{ font-size: {mission_px}px; margin-bottom: 0; }}
 #timer {{ font-size: {timer_px}px; margin-bottom: 40px; }}
+.stale #timer {{ opacity: 0.35; }}
+#stale {{ background: #FF0000; color: #FFFFFF; font-size: {max(16, mission_px // 2)}px; padding: 4px 16px; }}
 </style>
-<script>
-setTimeout(() => location.reload(), 1000);
-</script>
-</head>
-<body>
-<div id="mission">{mission_name}</div>
+{reload_script}</head>
+<body{' class="stale"' if stale else ''}>
+{stale_banner}<div id="mission">{mission_name}</div>
 <div id="timer">{timer_text}</div>
-</body>
+{live}</body>
 </html>"""
-    with open(COUNTDOWN_HTML, "w", encoding="utf-8") as f:
-        f.write(html)
+
+
+def write_countdown_html(mission_name, timer_text, path=None, settings=None, stale=False, name=None):
+    started = time.perf_counter()
+    html = render_countdown_html(mission_name, timer_text, settings, stale=stale, name=name)
+    rendered = time.perf_counter()
+    write_text_atomic(path or COUNTDOWN_HTML, html)
+    size = len(html.encode('utf-8'))
+    finished = time.perf_counter()
+    HTML_WRITE_SECONDS.observe(finished - started, file='countdown')
+    if profiler.enabled:
+        profiler.record('render', rendered - started)
+        profiler.record('write', finished - rendered)
+    HTML_WRITE_BYTES.inc(size, file='countdown')
 
 # -------------------------
 # Write Go/No-Go HTML
 # -------------------------
-def write_gonogo_html(gonogo_values=None):
+def render_gonogo_html(gonogo_values=None, settings=None, template=None):
+    """Build gonogo.html; a custom `template` may use $range, $weather, $vehicle (display text),
+    $range_class/$weather_class/$vehicle_class ('go' or 'nogo') and the $bg, $text, $font, $gn_* colors and $gn_px."""
     if gonogo_values is None:
         gonogo_values = ["N/A", "N/A", "N/A"]
-    s = load_settings()
+    s = settings if settings is not None else load_settings()
     # Prefer HTML-specific settings; fall back to GUI appearance settings for backwards compatibility
     bg = s.get('html_bg_color', s.get('bg_color', '#000000'))
     text = s.get('html_text_color', s.get('text_color', '#FFFFFF'))
@@ -226,91 +1120,3241 @@ def write_gonogo_html(gonogo_values=None):
     n0 = re.sub(r'[^A-Z]', '', (str(gonogo_values[0] or '')).strip().upper())
     n1 = re.sub(r'[^A-Z]', '', (str(gonogo_values[1] or '')).strip().upper())
     n2 = re.sub(r'[^A-Z]', '', (str(gonogo_values[2] or '')).strip().upper())
+    if template is not None:
+        return string.Template(template).safe_substitute(
+            range=disp0, weather=disp1, vehicle=disp2,
+            range_class='go' if n0 == 'GO' else 'nogo',
+            weather_class='go' if n1 == 'GO' else 'nogo',
+            vehicle_class='go' if n2 == 'GO' else 'nogo',
+            bg=bg, text=text, font=font, gn_bg=gn_bg, gn_border=gn_border,
+            gn_go=gn_go, gn_nogo=gn_nogo, gn_px=gn_px)
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<style>
+body {{
+    margin: 0;
+    background-color: {bg};
+    color: {text};
+    font-family: {font};
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    height: 100vh;
+}}
+#gonogo {{
+    display: flex;
+    gap: 40px;
+}}
+.status-box {{
+    border: 2px solid {gn_border};
+    padding: 20px 40px;
+    font-size: {gn_px}px;
+    text-align: center;
+    background-color: {gn_bg};
+}}
+.go {{ color: {gn_go}; }}
+.nogo {{ color: {gn_nogo}; }}
+</style>
+<script>
+setTimeout(() => location.reload(), 5000);
+</script>
+</head>
+<body>
+    <div id="gonogo">
+    <div class="status-box {'go' if n0=='GO' else 'nogo'}">Range: {disp0}</div>
+    <div class="status-box {'go' if n2=='GO' else 'nogo'}">Vehicle: {disp2}</div>
+    <div class="status-box {'go' if n1=='GO' else 'nogo'}">Weather: {disp1}</div>
+</div>
+</body>
+</html>"""
+
+
+def write_gonogo_html(gonogo_values=None, settings=None):
+    started = time.perf_counter()
+    html = render_gonogo_html(gonogo_values, settings)
+    rendered = time.perf_counter()
+    write_text_atomic(GONOGO_HTML, html)
+    size = len(html.encode('utf-8'))
+    finished = time.perf_counter()
+    HTML_WRITE_SECONDS.observe(finished - started, file='gonogo')
+    if profiler.enabled:
+        profiler.record('render', rendered - started)
+        profiler.record('write', finished - rendered)
+    HTML_WRITE_BYTES.inc(size, file='gonogo')
+
+
+# -------------------------
+# Output profiles (extra renditions of the same state)
+# -------------------------
+BUILTIN_PAGE_PATTERN = re.compile(r'countdown(_.+)?\.html')
+
+
+def is_builtin_output(path):
+    """True for a file the app writes itself: the countdown pages, gonogo.html, settings and the state snapshot."""
+    path = os.path.normcase(os.path.abspath(path))
+    if os.path.dirname(path) == os.path.normcase(os.path.abspath(app_folder)) and \
+            BUILTIN_PAGE_PATTERN.fullmatch(os.path.basename(path)):
+        return True
+    return path in {os.path.normcase(os.path.abspath(p)) for p in (GONOGO_HTML, SETTINGS_FILE, STATE_SNAPSHOT_FILE)}
+
+
+class OutputFanout:
+    """Renders the configured `output_profiles` from one state snapshot per tick.
+
+    A profile is {"name", "kind": "countdown"|"gonogo", "countdown" (for kind countdown),
+    "path", optional "template" (a file, see render_*_html) and "appearance" (html_* overrides)}.
+    Profiles that would render identical output share one render, and a destination is
+    only rewritten when its content changed. A profile whose path is one of the app's own
+    files is skipped.
+    """
+
+    def __init__(self):
+        self._profiles = []
+        self._rejected = set()
+        self._written = {}
+        self._templates = {}
+
+    def invalidate(self):
+        """Forget what was last written so every profile is rewritten on the next render."""
+        self._written = {}
+
+    @staticmethod
+    def _destination(profile):
+        dest = profile.get('path') or f"{profile.get('name', profile.get('kind', 'countdown'))}.html"
+        return dest if os.path.isabs(dest) else os.path.join(app_folder, dest)
+
+    def _load(self, profiles):
+        self._profiles = profiles
+        self._written = {}
+        self._rejected = set()
+        for profile in profiles:
+            try:
+                dest = self._destination(profile)
+            except Exception:
+                continue  # reported when it is rendered
+            if is_builtin_output(dest):
+                log.error("Output profile %s would overwrite %s, which the app writes itself; skipping it",
+                          profile.get('name'), dest)
+                self._rejected.add(dest)
+
+    def _template(self, path):
+        if not path:
+            return None
+        path = path if os.path.isabs(path) else os.path.join(app_folder, path)
+        try:
+            mtime = os.path.getmtime(path)
+            cached = self._templates.get(path)
+            if cached is None or cached[0] != mtime:
+                with open(path, 'r', encoding='utf-8') as fh:
+                    cached = (mtime, fh.read())
+                self._templates[path] = cached
+            return cached[1]
+        except Exception as e:
+            log.error("Failed to read output template %s: %s", path, e)
+            return None
+
+    def render(self, state, settings):
+        """Write every profile whose output changed; returns how many files were written."""
+        profiles = settings.get('output_profiles') or []
+        if profiles != self._profiles:
+            self._load(profiles)
+        renders = {}
+        written = 0
+        for profile in profiles:
+            try:
+                dest = self._destination(profile)
+                if dest in self._rejected:
+                    continue
+                kind = profile.get('kind', 'countdown')
+                appearance = profile.get('appearance') or {}
+                template_path = profile.get('template')
+                if kind == 'gonogo':
+                    g = state['gonogo']
+                    inputs = (g.get('range'), g.get('weather'), g.get('vehicle'))
+                else:
+                    cd = state['countdowns'].get(profile.get('countdown') or PRIMARY_COUNTDOWN)
+                    if cd is None:
+                        continue
+                    inputs = (cd['mission'], cd['timer'], state.get('stale', False))
+                key = (kind, template_path, json.dumps(appearance, sort_keys=True), inputs)
+                html = renders.get(key)
+                if html is None:
+                    merged = dict(settings)
+                    merged.update(appearance)
+                    template = self._template(template_path)
+                    if kind == 'gonogo':
+                        html = render_gonogo_html(list(inputs), merged, template)
+                    else:
+                        html = render_countdown_html(inputs[0], inputs[1], merged, template, stale=inputs[2])
+                    renders[key] = html
+                if self._written.get(dest) == html:
+                    continue
+                write_text_atomic(dest, html)
+                self._written[dest] = html
+                written += 1
+            except Exception as e:
+                log.error("Failed to render output profile %s: %s", profile.get('name'), e)
+        return written
+
+# -------------------------
+# Output sinks (one worker thread per destination, fed from the tick loop)
+# -------------------------
+SINK_QUEUE_LENGTH = 32
+SINK_WRITE_SECONDS = metrics.histogram('rlc_sink_write_seconds', "Time for an output sink to deliver one state")
+SINK_DELIVERED_TOTAL = metrics.counter('rlc_sink_delivered_total', "States delivered by an output sink")
+SINK_DROPPED_TOTAL = metrics.counter('rlc_sink_dropped_total', "States an output sink replaced or dropped before delivery")
+SINK_ERRORS_TOTAL = metrics.counter('rlc_sink_errors_total', "Output sink deliveries that failed")
+
+
+def _sink_path(path):
+    return path if os.path.isabs(path) else os.path.join(app_folder, path)
+
+
+def write_text_atomic(path, text):
+    """Write-then-rename so readers (OBS, browsers) never see a half-written file."""
+    # a temporary name per process and thread: two sinks writing one path never share it
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            fh.write(text)
+        try:
+            os.replace(tmp, path)
+        except PermissionError:
+            # Windows refuses the rename while another program holds the file open
+            with open(path, 'w', encoding='utf-8') as fh:
+                fh.write(text)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class OutputSink:
+    """One output destination, fed through a bounded queue by its own worker thread.
+
+    offer() never blocks. With policy "coalesce" only the newest undelivered state is kept,
+    which suits files where only the latest matters; "drop_oldest" delivers states in order
+    and drops the oldest once `queue` of them are waiting. A slow or failing sink only
+    ever falls behind itself.
+
+    Each concrete sink defines write(state, settings), which delivers one state and is
+    only ever called on the sink's own thread; an exception counts as a failed delivery.
+    """
+    kind = None
+    default_policy = 'coalesce'
+
+    def __init__(self, config):
+        self.config = config
+        self.name = config.get('name') or self.kind
+        self.policy = config.get('policy') or self.default_policy
+        if self.policy not in ('coalesce', 'drop_oldest'):
+            raise ValueError(f"Unknown sink policy: {self.policy}")
+        self.maxlen = 1 if self.policy == 'coalesce' else max(1, int(config.get('queue', SINK_QUEUE_LENGTH)))
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"sink-{self.name}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def offer(self, item):
+        with self._cond:
+            if len(self._pending) >= self.maxlen:
+                self._pending.popleft()
+                SINK_DROPPED_TOTAL.inc(sink=self.name)
+            self._pending.append(item)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._pending:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                state, settings = self._pending.popleft()
+            started = time.perf_counter()
+            try:
+                self.write(state, settings)
+                SINK_DELIVERED_TOTAL.inc(sink=self.name)
+            except Exception as e:
+                SINK_ERRORS_TOTAL.inc(sink=self.name)
+                log.error("Output sink %s failed: %s", self.name, e)
+            SINK_WRITE_SECONDS.observe(time.perf_counter() - started, sink=self.name)
+
+    def invalidate(self):
+        """Forget what was last written so the next state is written even if it looks unchanged."""
+
+    def close(self, timeout=1.0):
+        """Stop after delivering what is already queued (waiting at most `timeout`)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+
+class _ChangedFileSink(OutputSink):
+    """Base for file sinks: a destination is only rewritten when its content changed."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._written = {}
+
+    def _write_if_changed(self, path, text, writer=write_text_atomic):
+        if self._written.get(path) == text:
+            return False
+        writer(path, text)
+        self._written[path] = text
+        return True
+
+    def invalidate(self):
+        self._written = {}
+
+
+class HtmlSink(_ChangedFileSink):
+    """countdown.html pages or gonogo.html, as the tick loop used to write them directly.
+
+    Config: {"page": "countdown" | "gonogo", "countdown": name (default: every countdown,
+    each to its own page), "path": for a single page}.
+    """
+    kind = 'html'
+
+    def __init__(self, config):
+        super().__init__(config)
+        # pages written for every countdown, so a removed countdown's page can go with it
+        self._pages = set()
+
+    def write(self, state, settings):
+        if self.config.get('page') == 'gonogo':
+            g = state['gonogo']
+            html = render_gonogo_html([g.get('range'), g.get('weather'), g.get('vehicle')], settings)
+            self._write_if_changed(_sink_path(self.config.get('path') or GONOGO_HTML), html, self._write_html('gonogo'))
+            return
+        names = [self.config['countdown']] if self.config.get('countdown') else list(state['countdowns'])
+        for name in names:
+            cd = state['countdowns'].get(name)
+            if cd is None:
+                continue
+            html = render_countdown_html(cd['mission'], cd['timer'], settings, stale=state.get('stale', False), name=name)
+            path = self.config.get('path') if self.config.get('countdown') else None
+            self._write_if_changed(_sink_path(path or countdown_html_path(name)), html, self._write_html('countdown'))
+        if not self.config.get('countdown'):
+            pages = {countdown_html_path(name) for name in names}
+            for path in self._pages - pages:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                self._written.pop(path, None)
+            self._pages = pages
+
+    @staticmethod
+    def _write_html(label):
+        def writer(path, html):
+            started = time.perf_counter()
+            write_text_atomic(path, html)
+            size = len(html.encode('utf-8'))
+            HTML_WRITE_SECONDS.observe(time.perf_counter() - started, file=label)
+            HTML_WRITE_BYTES.inc(size, file=label)
+        return writer
+
+
+class TextSink(_ChangedFileSink):
+    """Plain text for OBS text sources. Config: {"path", "template": "$timer", "countdown"}.
+
+    Template fields: $name $mission $timer $milestone $status $range $weather $vehicle.
+    """
+    kind = 'text'
+
+    def write(self, state, settings):
+        cd = state['countdowns'].get(self.config.get('countdown') or PRIMARY_COUNTDOWN)
+        if cd is None:
+            return
+        if cd['scrubbed']:
+            status = 'SCRUB'
+        elif cd['on_hold']:
+            status = 'HOLD'
+        else:
+            status = 'COUNTING' if cd['running'] else 'IDLE'
+        fields = dict(state['gonogo'], name=cd['name'], mission=cd['mission'], timer=cd['timer'],
+                      milestone=cd['milestone'], status=status)
+        text = string.Template(self.config.get('template') or '$timer').safe_substitute(fields)
+        self._write_if_changed(_sink_path(self.config.get('path') or f"{self.name}.txt"), text)
+
+
+class JsonSink(_ChangedFileSink):
+    """The full engine state as one JSON document. Config: {"path"}."""
+    kind = 'json'
+
+    def write(self, state, settings):
+        self._write_if_changed(_sink_path(self.config.get('path') or 'state.json'), json.dumps(state, indent=2))
+
+
+class WebhookSink(OutputSink):
+    """POSTs each state as JSON to a local endpoint. Config: {"url", "timeout": 2, "headers": {}}."""
+    kind = 'webhook'
+    default_policy = 'drop_oldest'
+
+    def __init__(self, config):
+        super().__init__(config)
+        if not config.get('url'):
+            raise ValueError("webhook sink needs a url")
+
+    def write(self, state, settings):
+        import urllib.request
+        body = json.dumps({'sent_at': time.time(), 'state': state}).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        headers.update(self.config.get('headers') or {})
+        req = urllib.request.Request(self.config['url'], data=body, headers=headers, method='POST')
+        with urllib.request.urlopen(req, timeout=float(self.config.get('timeout', 2.0))) as resp:
+            resp.read()
+
+
+class PipeSink(OutputSink):
+    """One JSON line per state into a named pipe. Config: {"path"}.
+
+    On POSIX the FIFO is created when missing and states are skipped while no reader has it
+    open or its buffer is full. On Windows `path` is a pipe served by the reader (\\\\.\\pipe\\name).
+    """
+    kind = 'pipe'
+    default_policy = 'drop_oldest'
+
+    def __init__(self, config):
+        super().__init__(config)
+        path = config.get('path') or 'countdown.pipe'
+        self.path = path if path.startswith('\\\\') else _sink_path(path)
+        self._fh = None
+        if os.name == 'posix' and not os.path.exists(self.path):
+            os.mkfifo(self.path)
+
+    def _open(self):
+        if os.name == 'posix':
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    return None  # nobody is reading
+                raise
+            return os.fdopen(fd, 'wb', buffering=0)
+        try:
+            return open(self.path, 'wb', buffering=0)
+        except FileNotFoundError:
+            return None
+
+    def write(self, state, settings):
+        if self._fh is None:
+            self._fh = self._open()
+            if self._fh is None:
+                return
+        try:
+            self._fh.write((json.dumps(state) + '\n').encode('utf-8'))
+        except BlockingIOError:
+            SINK_DROPPED_TOTAL.inc(sink=self.name)  # the reader is behind; skip rather than wait
+        except (BrokenPipeError, OSError):
+            # the reader went away; reopen on the next state
+            self.close_pipe()
+
+    def close_pipe(self):
+        try:
+            if self._fh is not None:
+                self._fh.close()
+        except Exception:
+            pass
+        self._fh = None
+
+    def close(self, timeout=1.0):
+        super().close(timeout)
+        self.close_pipe()
+
+
+class ProfilesSink(OutputSink):
+    """Runs the `output_profiles` fan-out (see OutputFanout) off the tick loop."""
+    kind = 'profiles'
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.fanout = OutputFanout()
+
+    def write(self, state, settings):
+        self.fanout.render(state, settings)
+
+    def invalidate(self):
+        self.fanout.invalidate()
+
+
+SINK_KINDS = {cls.kind: cls for cls in (HtmlSink, TextSink, JsonSink, WebhookSink, PipeSink)}
+
+
+class OutputPipeline:
+    """Publishes each state change once to every output sink, without waiting on any of them.
+
+    The built-in sinks write the countdown pages, gonogo.html and the output profiles; the
+    `output_sinks` setting adds more, each {"kind": "html"|"text"|"json"|"webhook"|"pipe",
+    "name", "policy": "coalesce"|"drop_oldest", "queue", ...kind options}.
+    """
+
+    def __init__(self):
+        self.sinks = []
+        self._config = None
+        self._last = None
+        # the tick loop publishes; the watchdog thread may publish a stale state while it is stuck
+        self._lock = threading.RLock()
+
+    def configure(self, settings):
+        config = settings.get('output_sinks') or []
+        if config == self._config:
+            return
+        self.close()
+        self._config = config
+        sinks = [HtmlSink({'name': 'countdown_html', 'page': 'countdown'}),
+                 HtmlSink({'name': 'gonogo_html', 'page': 'gonogo'}),
+                 ProfilesSink({'name': 'output_profiles'})]
+        for entry in config:
+            cls = SINK_KINDS.get(entry.get('kind'))
+            try:
+                if cls is None:
+                    raise ValueError(f"unknown kind {entry.get('kind')!r}")
+                sinks.append(cls(entry))
+            except Exception as e:
+                log.error("Skipping output sink %s: %s", entry.get('name') or entry.get('kind'), e)
+        self.sinks = [sink.start() for sink in sinks]
+
+    def publish(self, state, settings):
+        """Hand the state to every sink if it, or the settings it renders with, changed."""
+        with self._lock:
+            self.configure(settings)
+            item = (state, settings)
+            if item == self._last:
+                return False
+            self._last = item
+            for sink in self.sinks:
+                sink.offer(item)
+            return True
+
+    def invalidate(self):
+        """Make the next publish rewrite every output (after something else wrote over them)."""
+        with self._lock:
+            self._last = None
+            for sink in self.sinks:
+                sink.invalidate()
+
+    def close(self, timeout=1.0):
+        with self._lock:
+            for sink in self.sinks:
+                sink.close(timeout)
+            self.sinks = []
+            self._last = None
+
+
+# -------------------------
+# Webhook notifications (state transitions, coalesced)
+# -------------------------
+WEBHOOK_EVENTS = ('hold', 'resume', 'scrub', 't0', 'gonogo')
+WEBHOOK_DELIVERY_SECONDS = metrics.histogram('rlc_webhook_delivery_seconds', "Time from a transition to its webhook being accepted")
+WEBHOOK_ATTEMPT_SECONDS = metrics.histogram('rlc_webhook_attempt_seconds', "Duration of one webhook POST attempt")
+WEBHOOK_DELIVERIES_TOTAL = metrics.counter('rlc_webhook_deliveries_total', "Webhook deliveries by outcome")
+
+
+class WebhookNotifier:
+    """Sends countdown transitions (hold, resume, scrub, T-0, Go/No-Go changes) to webhook targets.
+
+    It listens to the timeline. Events arriving within `coalesce_ms` of the first one go out
+    as one POST, {"seq", "sent_at", "events": [...]}, with Go/No-Go changes in a window
+    merged into one. Deliveries wait in a bounded queue (the oldest is dropped when it is
+    full) and a small pool of workers posts them concurrently, retrying connection errors
+    and 5xx answers. Config (the `webhooks` setting): {"targets": [{"url", "events",
+    "headers"}], "coalesce_ms": 250, "retries": 3, "timeout": 2, "queue": 100, "workers": 4}.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.targets = [t for t in config.get('targets') or [] if t.get('url')]
+        self.window = max(0.0, float(config.get('coalesce_ms', 250)) / 1000.0)
+        self.retries = max(0, int(config.get('retries', 3)))
+        self.timeout = float(config.get('timeout', 2.0))
+        self.deliveries = queue.Queue(maxsize=max(1, int(config.get('queue', 100))))
+        self.recent = deque(maxlen=200)
+        self.seq = 0
+        # set while this instance is a passive standby: its primary sends the notifications
+        self.paused = False
+        self._batch = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._dispatch, name="webhook-dispatch", daemon=True)]
+        for i in range(max(1, int(config.get('workers', 4)))):
+            self._threads.append(threading.Thread(target=self._deliver_loop, name=f"webhook-{i}", daemon=True))
+        for t in self._threads:
+            t.start()
+
+    def notify(self, entry):
+        """Timeline listener; only queues the event, never blocks the caller."""
+        if entry.get('event') not in WEBHOOK_EVENTS or self._closed or self.paused:
+            return
+        if entry['event'] == 'gonogo' and entry.get('values') == entry.get('previous'):
+            return
+        with self._cond:
+            self._batch.append(dict(entry, received=time.monotonic()))
+            self._cond.notify()
+
+    def _dispatch(self):
+        while True:
+            with self._cond:
+                while not self._batch and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # let the rest of the window's events arrive, then take them all
+                deadline = self._batch[0]['received'] + self.window
+                while not self._closed and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                batch, self._batch = self._batch, []
+            events = self.coalesce(batch)
+            if events:
+                self._enqueue(events)
+
+    @staticmethod
+    def coalesce(batch):
+        """Merge the window's Go/No-Go changes into one (dropped if they cancel out)."""
+        events = []
+        gonogo = None
+        for entry in batch:
+            if entry['event'] != 'gonogo':
+                events.append(entry)
+            elif gonogo is None:
+                gonogo = dict(entry)
+                events.append(gonogo)
+            else:
+                gonogo.update(values=entry.get('values'), wall=entry['wall'], mono=entry['mono'])
+        if gonogo is not None and gonogo.get('values') == gonogo.get('previous'):
+            events.remove(gonogo)
+        return events
+
+    def _enqueue(self, events):
+        self.seq += 1
+        first = min(e['received'] for e in events)
+        payload = [{k: v for k, v in e.items() if k != 'received'} for e in events]
+        for target in self.targets:
+            wanted = target.get('events')
+            selected = [e for e in payload if not wanted or e['event'] in wanted]
+            if not selected:
+                continue
+            body = {'seq': self.seq, 'events': selected}
+            while True:
+                try:
+                    self.deliveries.put_nowait((target, body, first))
+                    break
+                except queue.Full:
+                    try:
+                        dropped = self.deliveries.get_nowait()
+                        WEBHOOK_DELIVERIES_TOTAL.inc(target=dropped[0]['url'], status='dropped')
+                    except queue.Empty:
+                        pass
+
+    def _deliver_loop(self):
+        while True:
+            item = self.deliveries.get()
+            if item is None or self._closed:
+                return
+            self.deliver(*item)
+
+    def deliver(self, target, body, first):
+        import urllib.request
+        import urllib.error
+        url = target['url']
+        headers = {'Content-Type': 'application/json'}
+        headers.update(target.get('headers') or {})
+        status, error = 'failed', None
+        attempt = 0
+        while attempt <= self.retries and not self._closed:
+            if attempt:
+                time.sleep(min(2.0, 0.1 * 2 ** attempt))
+            attempt += 1
+            data = json.dumps(dict(body, sent_at=time.time(), attempt=attempt)).encode('utf-8')
+            started = time.perf_counter()
+            try:
+                req = urllib.request.Request(url, data=data, headers=headers, method='POST')
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    resp.read()
+                status, error = 'ok', None
+                break
+            except urllib.error.HTTPError as e:
+                error = f"HTTP {e.code}"
+                if e.code < 500:
+                    break  # the receiver rejected it; retrying won't help
+            except Exception as e:
+                error = str(e)
+            finally:
+                WEBHOOK_ATTEMPT_SECONDS.observe(time.perf_counter() - started, target=url)
+        latency = time.monotonic() - first
+        if status == 'ok':
+            WEBHOOK_DELIVERY_SECONDS.observe(latency, target=url)
+        else:
+            log.warning("Webhook %s failed after %d attempt(s): %s", url, attempt, error)
+        WEBHOOK_DELIVERIES_TOTAL.inc(target=url, status=status)
+        self.recent.append({'url': url, 'seq': body['seq'], 'events': [e['event'] for e in body['events']],
+                            'status': status, 'attempts': attempt, 'latency_ms': round(latency * 1000, 2),
+                            'error': error})
+
+    def close(self):
+        self._closed = True
+        with self._cond:
+            self._cond.notify_all()
+        for _ in self._threads[1:]:
+            try:
+                self.deliveries.put_nowait(None)
+            except queue.Full:
+                pass
+
+
+# -------------------------
+# Raster frame output (PNG / raw RGBA shared memory) from a glyph atlas
+# -------------------------
+# 5x7 bitmap font: one 5-bit row mask per line, leftmost pixel in the high bit
+FONT_5X7 = {
+    '0': (0x0E, 0x11, 0x13, 0x15, 0x19, 0x11, 0x0E), '1': (0x04, 0x0C, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    '2': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x08, 0x1F), '3': (0x1F, 0x02, 0x04, 0x02, 0x01, 0x11, 0x0E),
+    '4': (0x02, 0x06, 0x0A, 0x12, 0x1F, 0x02, 0x02), '5': (0x1F, 0x10, 0x1E, 0x01, 0x01, 0x11, 0x0E),
+    '6': (0x06, 0x08, 0x10, 0x1E, 0x11, 0x11, 0x0E), '7': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x08, 0x08),
+    '8': (0x0E, 0x11, 0x11, 0x0E, 0x11, 0x11, 0x0E), '9': (0x0E, 0x11, 0x11, 0x0F, 0x01, 0x02, 0x0C),
+    'A': (0x0E, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11), 'B': (0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E),
+    'C': (0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E), 'D': (0x1C, 0x12, 0x11, 0x11, 0x11, 0x12, 0x1C),
+    'E': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F), 'F': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10),
+    'G': (0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F), 'H': (0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    'I': (0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E), 'J': (0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C),
+    'K': (0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11), 'L': (0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F),
+    'M': (0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11), 'N': (0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11),
+    'O': (0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E), 'P': (0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10),
+    'Q': (0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D), 'R': (0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11),
+    'S': (0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E), 'T': (0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04),
+    'U': (0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E), 'V': (0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04),
+    'W': (0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A), 'X': (0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11),
+    'Y': (0x11, 0x11, 0x11, 0x0A, 0x04, 0x04, 0x04), 'Z': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F),
+    ':': (0x00, 0x0C, 0x0C, 0x00, 0x0C, 0x0C, 0x00), '-': (0x00, 0x00, 0x00, 0x1F, 0x00, 0x00, 0x00),
+    '+': (0x00, 0x04, 0x04, 0x1F, 0x04, 0x04, 0x00), '.': (0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x0C),
+    '/': (0x01, 0x01, 0x02, 0x04, 0x08, 0x10, 0x10), '_': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F),
+    '?': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x00, 0x04), ' ': (0x00,) * 7,
+}
+RASTER_SHM_NAME = "RocketLaunchCountdown_frame"
+# shared-memory header: magic, width, height, frame sequence number
+RASTER_SHM_HEADER = struct.Struct('<4sIIQ')
+
+
+def _rgba(color, default=(255, 255, 255)):
+    s = str(color or '').strip().lstrip('#')
+    try:
+        if len(s) == 3:
+            s = ''.join(ch * 2 for ch in s)
+        return bytes((int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16), 255))
+    except Exception:
+        return bytes(default + (255,))
+
+
+class GlyphAtlas:
+    """FONT_5X7 pre-rendered at one scale and color pair, as ready-to-copy RGBA pixel rows.
+
+    Each glyph keeps its 7 distinct rows (5 columns plus one column of spacing); composing
+    a line of text is then a join of cached byte strings instead of any text layout.
+    """
+
+    def __init__(self, scale, fg, bg):
+        self.scale = scale
+        self.glyph_width = 6 * scale
+        self.height = 7 * scale
+        on, off = _rgba(fg) * scale, _rgba(bg) * scale
+        self.rows = {
+            ch: [b''.join(on if bits & (0x10 >> i) else off for i in range(5)) + off for bits in pattern]
+            for ch, pattern in FONT_5X7.items()
+        }
+
+    def line_rows(self, text):
+        glyphs = [self.rows.get(ch, self.rows['?']) for ch in str(text).upper()]
+        return [b''.join(g[r] for g in glyphs) for r in range(7)]
+
+
+class FrameRenderer:
+    """Composes countdown + Go/No-Go frames into one RGBA buffer with row blits.
+
+    The frame has three horizontal bands (mission, timer, Go/No-Go panel); a band is only
+    redrawn when its text or colors change, so a normal tick rewrites just the timer band.
+    """
+
+    def __init__(self, width, height, settings=None):
+        s = settings if settings is not None else load_settings()
+        self.width = int(width)
+        self.height = int(height)
+        self.stride = self.width * 4
+        self.bg = s.get('html_bg_color', s.get('bg_color', '#000000'))
+        self.text = s.get('html_text_color', s.get('text_color', '#FFFFFF'))
+        self.gn_bg = s.get('html_gn_bg_color', s.get('gn_bg_color', '#111111'))
+        self.gn_go = s.get('html_gn_go_color', s.get('gn_go_color', '#00FF00'))
+        self.gn_nogo = s.get('html_gn_nogo_color', s.get('gn_nogo_color', '#FF0000'))
+        self.frame = bytearray(_rgba(self.bg) * (self.width * self.height))
+        self._atlases = {}
+        self._bands = {}
+        h = self.height
+        # (top, height) of each band
+        self.mission_band = (int(h * 0.08), int(h * 0.12))
+        self.timer_band = (int(h * 0.25), int(h * 0.40))
+        self.gonogo_band = (int(h * 0.72), int(h * 0.20))
+
+    def _atlas(self, scale, fg, bg):
+        key = (scale, fg, bg)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(scale, fg, bg)
+        return atlas
+
+    def _scale_for(self, band_h, width, chars):
+        return max(1, min(band_h // 7, int(width * 0.9) // (6 * max(1, chars))))
+
+    def _draw_band(self, key, band, scale, cells, bg):
+        """cells: list of (text, fg, x0, x1); text is centered in [x0, x1) on a bg-colored band."""
+        if self._bands.get(key) == (scale, cells, bg):
+            return
+        self._bands[key] = (scale, cells, bg)
+        top, band_h = band
+        blank = _rgba(bg) * self.width
+        # compose the 7 distinct pixel rows of the band, then copy each one `scale` times
+        rows = [bytearray(blank) for _ in range(7)]
+        for text, fg, x0, x1 in cells:
+            atlas = self._atlas(scale, fg, bg)
+            line = atlas.line_rows(text)
+            line_w = min(len(line[0]) // 4, x1 - x0)
+            x = x0 + max(0, (x1 - x0 - line_w) // 2)
+            for r in range(7):
+                rows[r][x * 4:(x + line_w) * 4] = line[r][:line_w * 4]
+        glyph_h = 7 * scale
+        pad = max(0, (band_h - glyph_h) // 2)
+        frame = self.frame
+        stride = self.stride
+        for y in range(top, min(self.height, top + band_h)):
+            rel = y - top - pad
+            row = rows[rel // scale] if 0 <= rel < glyph_h else blank
+            off = y * stride
+            frame[off:off + stride] = row
+
+    def render(self, mission, timer, gonogo):
+        w = self.width
+        self._draw_band('mission', self.mission_band, self._scale_for(self.mission_band[1], w, len(mission)),
+                        [(mission, self.text, 0, w)], self.bg)
+        # size the timer for the widest form so the digits don't jump when the prefix changes
+        self._draw_band('timer', self.timer_band, self._scale_for(self.timer_band[1], w, 10),
+                        [(timer, self.text, 0, w)], self.bg)
+        col = w // 3
+        labels = [('RANGE', gonogo[0]), ('VEHICLE', gonogo[2]), ('WEATHER', gonogo[1])]
+        gn_scale = self._scale_for(self.gonogo_band[1], col, 14)
+        cells = []
+        for i, (label, value) in enumerate(labels):
+            norm = re.sub(r'[^A-Z]', '', str(value or '').upper())
+            fg = self.gn_go if norm == 'GO' else self.gn_nogo
+            cells.append((f"{label} {format_status_display(value)}", fg, i * col, (i + 1) * col))
+        self._draw_band('gonogo', self.gonogo_band, gn_scale, cells, self.gn_bg)
+        return self.frame
+
+
+def encode_png(width, height, rgba, level=1):
+    """Encode an RGBA buffer as PNG using only zlib (filter type 0 on every row)."""
+    stride = width * 4
+    view = memoryview(rgba)
+    raw = b''.join(b'\x00' + view[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw, level))
+            + chunk(b'IEND', b''))
+
+
+def write_png_atomic(path, width, height, rgba):
+    """Write the PNG next to `path` and rename it into place so readers never see a partial frame."""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as fh:
+        fh.write(encode_png(width, height, rgba))
+    os.replace(tmp, path)
+
+
+class SharedFrameBuffer:
+    """Raw RGBA frames in named shared memory: RASTER_SHM_HEADER followed by width*height*4 bytes.
+
+    The sequence number is a seqlock: it is odd while a frame is being copied in and even
+    once the frame is complete. A reader takes the sequence, skips odd values, copies the
+    frame and re-reads the sequence; if it changed, the copy is torn and must be retried.
+    Only a segment this process created is unlinked on close.
+    """
+
+    def __init__(self, width, height, name=RASTER_SHM_NAME):
+        from multiprocessing import shared_memory
+        size = RASTER_SHM_HEADER.size + width * height * 4
+        self.width, self.height = width, height
+        self.seq = 0
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.created = True
+        except FileExistsError:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.created = False
+            try:
+                # attaching registers the segment for removal at exit; it isn't ours to remove
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self.shm._name, 'shared_memory')
+            except Exception:
+                pass
+            if self.shm.size < size:
+                self.shm.close()
+                raise
+            # carry on from the segment's frame number so readers never see it go backwards
+            magic, _, _, seq = RASTER_SHM_HEADER.unpack_from(self.shm.buf, 0)
+            if magic == b'RLCF':
+                self.seq = seq + (seq & 1)
+
+    def write(self, rgba):
+        h = RASTER_SHM_HEADER.size
+        RASTER_SHM_HEADER.pack_into(self.shm.buf, 0, b'RLCF', self.width, self.height, self.seq + 1)
+        self.shm.buf[h:h + len(rgba)] = rgba
+        self.seq += 2
+        RASTER_SHM_HEADER.pack_into(self.shm.buf, 0, b'RLCF', self.width, self.height, self.seq)
+
+    def close(self):
+        try:
+            self.shm.close()
+            if self.created:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+
+class RasterOutput:
+    """Optional frame renderer driven by the `raster_output` setting, on its own worker thread.
+
+    The tick loop only hands over the latest (mission, timer, Go/No-Go) state; the worker
+    renders and writes it, and states that arrive while it is busy are coalesced.
+    Config: {"width": 1920, "height": 1080, "format": "png" | "rgba_shm", "path": "frame.png",
+    "shm_name": ..., "countdown": "main"}.
+    """
+
+    def __init__(self, config, settings):
+        self.config = config
+        self.countdown = config.get('countdown') or PRIMARY_COUNTDOWN
+        self.format = config.get('format', 'png')
+        path = config.get('path') or 'frame.png'
+        self.path = path if os.path.isabs(path) else os.path.join(app_folder, path)
+        self.renderer = FrameRenderer(int(config.get('width', 1920)), int(config.get('height', 1080)), settings)
+        self.shm = None
+        if self.format == 'rgba_shm':
+            self.shm = SharedFrameBuffer(self.renderer.width, self.renderer.height,
+                                         config.get('shm_name') or RASTER_SHM_NAME)
+        self._latest = None
+        self._last = None
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="raster-output", daemon=True)
+        self._thread.start()
+
+    def submit(self, state):
+        cd = state['countdowns'].get(self.countdown)
+        if cd is None:
+            return
+        g = state['gonogo']
+        frame_state = (cd['mission'], cd['timer'], (g.get('range'), g.get('weather'), g.get('vehicle')))
+        with self._cond:
+            self._latest = frame_state
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (self._latest is None or self._latest == self._last):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                frame_state = self._latest
+            self._last = frame_state
+            try:
+                self.write_frame(*frame_state)
+            except Exception as e:
+                log.error("Failed to write raster frame: %s", e)
+
+    def write_frame(self, mission, timer, gonogo):
+        r = self.renderer
+        frame = r.render(mission, timer, gonogo)
+        if self.shm is not None:
+            self.shm.write(frame)
+        else:
+            write_png_atomic(self.path, r.width, r.height, frame)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        # let a frame in progress finish before its buffer goes away
+        self._thread.join(2.0)
+        if self.shm is not None:
+            self.shm.close()
+
+
+# -------------------------
+# Countdown Sequence (planned holds and milestones)
+# -------------------------
+def parse_countdown_time(value):
+    """Parse 'T-00:10:00', 'T+30', '-5:00' or plain seconds into seconds before T-0 (negative = after T-0)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    s = str(value or '').strip().upper()
+    sign = 1
+    if s.startswith('T'):
+        s = s[1:]
+    if s.startswith('+'):
+        sign = -1
+        s = s[1:]
+    elif s.startswith('-'):
+        s = s[1:]
+    total = 0.0
+    for part in s.split(':'):
+        total = total * 60 + float(part or 0)
+    return sign * total
+
+
+def sequence_script_path(name=None):
+    """Script for a countdown: the main one uses `sequence_file` (default sequence.json), others sequence-<slug>.json."""
+    if not name or name == PRIMARY_COUNTDOWN:
+        return load_settings().get('sequence_file', SEQUENCE_FILE)
+    return os.path.join(app_folder, f"sequence-{countdown_slug(name)}.json")
+
+
+def load_sequence_script(path=None, name=None):
+    """Load a countdown script: {"events": [{"t": "T-00:10:00", "label": "...", "hold": 600}, ...]}.
+
+    Without a path, countdown `name`'s own script is loaded (see sequence_script_path).
+    """
+    if path is None:
+        path = sequence_script_path(name)
+    try:
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+            if isinstance(data, dict):
+                data = data.get('events', [])
+            return list(data or [])
+    except Exception as e:
+        log.error("Failed to load countdown sequence: %s", e)
+    return []
+
+
+class CountdownSequence:
+    """Priority-queue scheduler of milestone events keyed on countdown time.
+
+    Events are keyed on T-minus seconds rather than wall time, so a hold (manual or
+    scripted) freezes the countdown and automatically shifts every later event.
+    The heap head is the next event, so checking it each tick is O(1); firing or
+    scheduling an event is O(log n).
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = 0
+
+    def clear(self):
+        self._heap = []
+
+    def schedule(self, t_minus, label='', hold=0, **extra):
+        event = dict(extra)
+        event.update({'t': float(t_minus), 'label': label, 'hold': float(hold or 0)})
+        # heapq is a min-heap: negate so the largest T-minus (earliest in the count) is on top
+        heapq.heappush(self._heap, (-event['t'], self._counter, event))
+        self._counter += 1
+        return event
+
+    def load(self, events, start_seconds=None):
+        """Replace the queue with scripted events, skipping any already passed at start_seconds."""
+        self.clear()
+        for ev in events or []:
+            try:
+                t = parse_countdown_time(ev.get('t', ev.get('time')))
+            except Exception:
+                continue
+            if start_seconds is not None and t > start_seconds:
+                continue
+            extra = {k: v for k, v in ev.items() if k not in ('t', 'time', 'label', 'hold')}
+            self.schedule(t, ev.get('label', ''), parse_countdown_time(ev.get('hold', 0)), **extra)
+
+    def peek(self):
+        return self._heap[0][2] if self._heap else None
+
+    def due(self, countdown_seconds):
+        """Pop and return every event whose countdown time has been reached."""
+        fired = []
+        while self._heap and -self._heap[0][0] >= countdown_seconds:
+            event = heapq.heappop(self._heap)[2]
+            fired.append(event)
+            # a planned hold freezes the count; anything after it waits for the resume
+            if event['hold'] > 0:
+                break
+        return fired
+
+    def __len__(self):
+        return len(self._heap)
+
+
+# -------------------------
+# Countdown engine (one per clock, shared tick loop)
+# -------------------------
+def format_time(seconds, prefix="T-"):
+    h = int(seconds // 3600)
+    m = int((seconds % 3600) // 60)
+    s = int(seconds % 60)
+    return f"{prefix}{h:02}:{m:02}:{s:02}"
+
+
+def parse_clock_time(text):
+    """Parse 'HH', 'HH:MM' or 'HH:MM:SS' into (h, m, s); ValueError if it isn't a time of day."""
+    try:
+        h, m, s = (int(p or 0) for p in (str(text).split(':') + ['0', '0'])[:3])
+    except ValueError:
+        raise ValueError(f"Bad clock time: {text!r}") from None
+    if not (0 <= h < 24 and 0 <= m < 60 and 0 <= s < 60):
+        raise ValueError(f"Bad clock time: {text!r}")
+    return h, m, s
+
+
+def seconds_until_clock_time(h, m, s, tzname=None):
+    """Seconds from now until the next HH:MM:SS wall-clock time in the given timezone ('local' = system tz)."""
+    now = datetime.fromtimestamp(clock.time())
+    if ZoneInfo is not None and tzname not in (None, '', 'local'):
+        try:
+            tz = ZoneInfo(tzname)
+            # construct aware "now" in that timezone and create the target time
+            now_tz = datetime.fromtimestamp(clock.time(), tz)
+            target = now_tz.replace(hour=h, minute=m, second=s, microsecond=0)
+            # if target already passed in that tz, roll to next day
+            if target <= now_tz:
+                target = target + timedelta(days=1)
+            # compute total seconds using aware-datetime subtraction to avoid epoch mixing
+            return (target - now_tz).total_seconds()
+        except Exception:
+            pass
+    # naive local time handling — use timedelta to roll day
+    target_today = now.replace(hour=h, minute=m, second=s, microsecond=0)
+    if target_today <= now:
+        target_today = target_today + timedelta(days=1)
+    return (target_today - now).total_seconds()
+
+
+def countdown_slug(name):
+    """File-name form of a countdown name, different for every name.
+
+    A name made only of lowercase letters, digits and '-' is used as it is. Any other name
+    is lowercased, has the rest replaced by '-' and gets '_' plus a checksum of the exact
+    name, so "a b", "a_b" and "A-B" never share a file, even on a case-insensitive disk.
+    """
+    text = str(name)
+    slug = re.sub(r'[^a-z0-9-]+', '-', text.lower()).strip('-') or 'countdown'
+    if slug != text:
+        slug = f"{slug}_{zlib.crc32(text.encode('utf-8')):08x}"
+    return slug
+
+
+def countdown_html_path(name):
+    """Output file for a countdown: the primary clock keeps countdown.html, others get countdown_<slug>.html."""
+    if not name or name == PRIMARY_COUNTDOWN:
+        return COUNTDOWN_HTML
+    return os.path.join(app_folder, f"countdown_{countdown_slug(name)}.html")
+
+
+class Countdown:
+    """State of a single countdown clock, free of any Tk widgets."""
+
+    def __init__(self, name=PRIMARY_COUNTDOWN, mission_name="Placeholder Mission"):
+        self.name = name
+        self.mission_name = mission_name
+        self.running = False
+        self.on_hold = False
+        self.scrubbed = False
+        self.counting_up = False
+        self.target_time = None
+        self.hold_start_time = None
+        self.remaining_time = 0
+        self.timer_text = "T-00:00:00"
+        self.milestone_text = ""
+        # scripted milestones / planned holds, keyed on countdown time
+        self.sequence = CountdownSequence()
+        self.auto_resume_at = None
+        self.html_path = countdown_html_path(name)
+        self._written = None
+
+    def start(self, total_seconds, now=None, script=None):
+        now = clock.time() if now is None else now
+        self.running = True
+        self.on_hold = False
+        self.scrubbed = False
+        self.counting_up = False
+        self.target_time = now + total_seconds
+        self.remaining_time = total_seconds
+        self.timer_text = format_time(total_seconds, "T-")
+        # load the countdown script; milestones already passed at this start time are skipped
+        self.sequence.load(load_sequence_script(name=self.name) if script is None else script, total_seconds)
+        self.auto_resume_at = None
+        self.milestone_text = ""
+        self._record('start', seconds=total_seconds, events=len(self.sequence))
+
+    def _record(self, event, **fields):
+        timeline.record(event, countdown=self.name, mission=self.mission_name, timer=self.timer_text, **fields)
+
+    def hold(self, now=None, reason='manual'):
+        """Stop the count. A manual hold during a scripted one cancels its automatic resume."""
+        if self.running and not self.on_hold and not self.scrubbed:
+            self.on_hold = True
+            self.hold_start_time = clock.time() if now is None else now
+            self.remaining_time = max(0, self.target_time - self.hold_start_time)
+            self._record('hold', remaining=self.remaining_time, reason=reason)
+            return True
+        if self.on_hold and reason == 'manual' and self.auto_resume_at is not None:
+            # the operator takes over the planned hold: it now lasts until they resume
+            self.auto_resume_at = None
+            self._record('hold', remaining=self.remaining_time, reason=reason, was='scripted')
+            return True
+        return False
+
+    def resume(self, now=None, reason='manual'):
+        if self.running and self.on_hold and not self.scrubbed:
+            self.on_hold = False
+            self.auto_resume_at = None
+            self.target_time = (clock.time() if now is None else now) + self.remaining_time
+            self._record('resume', remaining=self.remaining_time, reason=reason)
+            return True
+        return False
+
+    def scrub(self):
+        self.scrubbed = True
+        self.running = False
+        self.sequence.clear()
+        self.auto_resume_at = None
+        self.timer_text = "SCRUB"
+        self._record('scrub')
+
+    def reset(self):
+        self.running = False
+        self.on_hold = False
+        self.scrubbed = False
+        self.counting_up = False
+        self.sequence.clear()
+        self.auto_resume_at = None
+        self.milestone_text = ""
+        self.timer_text = "T-00:00:00"
+        self._record('reset')
+
+    def _fire_sequence_event(self, event, now):
+        """Apply a scripted milestone: record its callout and enter its planned hold, if any."""
+        label = event.get('label') or ''
+        self.set_milestone(label, event['t'])
+        self._record('milestone', label=label, t=event['t'], hold=event['hold'])
+        if event['hold'] > 0 and not self.counting_up:
+            self.hold(now, reason='scripted')
+            # snap to the scripted hold point so tick granularity doesn't eat into the count
+            self.remaining_time = max(0, event['t'])
+            self.auto_resume_at = now + event['hold']
+
+    def set_milestone(self, label, t):
+        if label:
+            when = format_time(t, "T-") if t >= 0 else format_time(-t, "T+")
+            self.milestone_text = f"{when}  {label}"
+
+    def tick(self, now):
+        """Advance this clock to `now`; returns the scripted events fired on this tick."""
+        fired = []
+        if not self.running or self.scrubbed:
+            return fired
+
+        # Scripted sequence: end planned holds when due, then fire reached milestones
+        if self.on_hold:
+            if self.auto_resume_at is not None and now >= self.auto_resume_at:
+                self.resume(now, reason='scripted')
+        elif self.target_time and len(self.sequence):
+            # counting up moves target_time to T-0, so this goes negative after liftoff
+            for event in self.sequence.due(self.target_time - now):
+                self._fire_sequence_event(event, now)
+                fired.append(event)
+
+        if self.on_hold:
+            elapsed = int(now - self.hold_start_time)
+            self.timer_text = format_time(elapsed, "H+")
+        elif self.target_time:
+            diff = int(self.target_time - now)
+            if diff <= 0 and not self.counting_up:
+                self.counting_up = True
+                self.target_time = now
+                diff = 0
+                self._record('t0')
+            if self.counting_up:
+                elapsed = int(now - self.target_time)
+                self.timer_text = format_time(elapsed, "T+")
+            else:
+                self.timer_text = format_time(diff, "T-")
+        else:
+            self.timer_text = "T-00:00:00"
+        return fired
+
+    def snapshot(self):
+        """Plain-dict view of this clock for control interfaces and logs."""
+        return {
+            'name': self.name,
+            'mission': self.mission_name,
+            'timer': self.timer_text,
+            'running': self.running,
+            'on_hold': self.on_hold,
+            'scrubbed': self.scrubbed,
+            'counting_up': self.counting_up,
+            'target_time': self.target_time,
+            'remaining': self.remaining_time,
+            'milestone': self.milestone_text,
+        }
+
+    def persist_state(self):
+        """Everything a warm start needs to put this clock back where it was (times are wall-clock)."""
+        return {
+            'mission': self.mission_name,
+            'running': self.running,
+            'on_hold': self.on_hold,
+            'scrubbed': self.scrubbed,
+            'counting_up': self.counting_up,
+            'target_time': self.target_time,
+            'hold_start_time': self.hold_start_time,
+            'remaining_time': self.remaining_time,
+            'auto_resume_at': self.auto_resume_at,
+            'milestone': self.milestone_text,
+        }
+
+    def restore(self, data, now=None, record=True):
+        """Re-arm from persist_state(): a running count carries on against its original target time."""
+        now = clock.time() if now is None else now
+        self.mission_name = data.get('mission') or self.mission_name
+        for key in ('running', 'on_hold', 'scrubbed', 'counting_up'):
+            setattr(self, key, bool(data.get(key)))
+        for key in ('target_time', 'hold_start_time', 'auto_resume_at'):
+            setattr(self, key, data.get(key))
+        self.remaining_time = data.get('remaining_time') or 0
+        self.milestone_text = data.get('milestone') or ""
+        if self.running and not self.scrubbed and not self.counting_up and self.target_time:
+            remaining = self.remaining_time if self.on_hold else self.target_time - now
+            self.sequence.load(load_sequence_script(name=self.name), remaining)
+        if self.scrubbed:
+            self.timer_text = "SCRUB"
+        else:
+            self.tick(now)
+        if record:
+            self._record('restore', running=self.running, on_hold=self.on_hold)
+
+    def write_output(self, settings=None, force=False):
+        """Write this clock's HTML file, skipping the write when nothing visible changed."""
+        state = (self.mission_name, self.timer_text)
+        if not force and state == self._written:
+            return False
+        write_countdown_html(self.mission_name, self.timer_text, self.html_path, settings, name=self.name)
+        self._written = state
+        return True
+
+
+class CountdownScheduler:
+    """Owns every countdown in the process and advances them all from one tick loop."""
+
+    def __init__(self, names=None):
+        self.countdowns = {}
+        for name in names or [PRIMARY_COUNTDOWN]:
+            self.add(name)
+
+    def add(self, name, mission_name="Placeholder Mission"):
+        if name not in self.countdowns:
+            self.countdowns[name] = Countdown(name, mission_name)
+        return self.countdowns[name]
+
+    def remove(self, name):
+        if name != PRIMARY_COUNTDOWN:
+            self.countdowns.pop(name, None)
+
+    def get(self, name):
+        return self.countdowns.get(name)
+
+    def names(self):
+        return list(self.countdowns)
+
+    def tick(self, now=None, settings=None, write=True):
+        """Advance every countdown and write changed outputs; settings are read once for all of them.
+
+        With write=False only the clocks advance (the engine's output pipeline writes the pages).
+        """
+        now = clock.time() if now is None else now
+        settings = settings if settings is not None else load_settings()
+        fired = {}
+        for cd in self.countdowns.values():
+            events = cd.tick(now)
+            if events:
+                fired[cd.name] = events
+            if not write:
+                continue
+            try:
+                cd.write_output(settings)
+            except Exception as e:
+                log.error("Failed to write countdown output for %s: %s", cd.name, e)
+        return fired
+
+
+# -------------------------
+# Timeline replay / simulation
+# -------------------------
+def load_timeline(path=TIMELINE_FILE):
+    entries = []
+    with open(path, 'r', encoding='utf-8') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except Exception:
+                continue
+    return entries
+
+
+def synthetic_timeline(duration=4 * 3600, holds=((600, 600), (240, 120)), gonogo_flips=30, seed=0):
+    """Build a timeline for a count of `duration` seconds with (T-minus, length) holds and random Go/No-Go flips."""
+    rng = random.Random(seed)
+    entries = [{'wall': 0.0, 'event': 'start', 'countdown': PRIMARY_COUNTDOWN,
+                'mission': 'Simulated Mission', 'seconds': duration}]
+    elapsed_holds = 0.0
+    for t_minus, length in sorted(holds, reverse=True):
+        at = duration - t_minus + elapsed_holds
+        entries.append({'wall': at, 'event': 'hold', 'countdown': PRIMARY_COUNTDOWN, 'reason': 'scripted'})
+        entries.append({'wall': at + length, 'event': 'resume', 'countdown': PRIMARY_COUNTDOWN, 'reason': 'scripted'})
+        elapsed_holds += length
+    total = duration + elapsed_holds
+    for _ in range(gonogo_flips):
+        values = [rng.choice(('GO', 'GO', 'GO', 'NO-GO')) for _ in range(3)]
+        entries.append({'wall': rng.uniform(0, total), 'event': 'gonogo', 'values': values})
+    entries.sort(key=lambda e: e['wall'])
+    return entries
+
+
+class TimelineReplayer:
+    """Re-applies a recorded (or synthetic) timeline to a CountdownScheduler.
+
+    Entries are replayed at their original spacing relative to the first entry, measured on
+    the active clock source, so a SimulatedClock plays the timeline back at its speed.
+    Scripted milestones are not re-run: the recorded holds/resumes are replayed verbatim.
+    """
+
+    def __init__(self, entries, scheduler=None, start=None):
+        self.entries = sorted(entries, key=lambda e: float(e.get('wall', 0)))
+        self.scheduler = scheduler
+        self.start = start
+        self.index = 0
+        self.gonogo = None
+        self._base = float(self.entries[0].get('wall', 0)) if self.entries else 0.0
+
+    @property
+    def finished(self):
+        return self.index >= len(self.entries)
+
+    def fetch_gonogo(self):
+        """Stand-in for fetch_gonogo() during replay."""
+        return list(self.gonogo) if self.gonogo else ['N/A', 'N/A', 'N/A']
+
+    def advance(self, now):
+        """Apply every entry whose replay time has been reached; returns how many were applied."""
+        if self.start is None:
+            self.start = now
+        applied = 0
+        while self.index < len(self.entries):
+            entry = self.entries[self.index]
+            due = self.start + float(entry.get('wall', 0)) - self._base
+            if due > now:
+                break
+            self.index += 1
+            try:
+                self._apply(entry, due)
+            except Exception as e:
+                log.error("Failed to replay timeline entry %s: %s", entry, e)
+            applied += 1
+        return applied
+
+    def _apply(self, entry, due):
+        event = entry.get('event')
+        if event == 'gonogo':
+            self.gonogo = list(entry.get('values') or [])
+            return
+        if event == 'set_manual':
+            values = self.fetch_gonogo()
+            idx = {'range': 0, 'weather': 1, 'vehicle': 2}.get(entry.get('which'))
+            if idx is not None:
+                values[idx] = entry.get('value', 'N/A')
+                self.gonogo = values
+            return
+        name = entry.get('countdown')
+        if not name:
+            return
+        cd = self.scheduler.add(name)
+        if event == 'start':
+            cd.mission_name = entry.get('mission') or cd.mission_name
+            cd.start(float(entry.get('seconds', 0)), now=due, script=[])
+        elif event == 'hold':
+            cd.hold(due, reason=entry.get('reason', 'manual'))
+        elif event == 'resume':
+            cd.resume(due, reason=entry.get('reason', 'manual'))
+        elif event == 'scrub':
+            cd.scrub()
+        elif event == 'reset':
+            cd.reset()
+        elif event == 'milestone':
+            cd.set_milestone(entry.get('label'), float(entry.get('t', 0)))
+
+
+# -------------------------
+# Countdown engine: clocks + Go/No-Go poller + outputs, shared by GUI and headless mode
+# -------------------------
+GONOGO_POLL_SECONDS = 0.1
+ENGINE_COMMANDS = ('start', 'hold', 'resume', 'scrub', 'reset', 'mission', 'set_manual',
+                   'add_countdown', 'remove_countdown', 'state', 'profile')
+
+
+def parse_command(line):
+    """Parse a control command: a JSON object, or text like 'start 600', 'start at 14:00:00', 'set range GO'."""
+    line = (line or '').strip()
+    if not line:
+        return None
+    if line.startswith('{') or line.startswith('['):
+        return json.loads(line)
+    parts = line.split()
+    name = parts[0].lower()
+    args = parts[1:]
+    if name == 'start':
+        if args and args[0].lower() == 'at':
+            return {'cmd': 'start', 'at': args[1] if len(args) > 1 else ''}
+        return {'cmd': 'start', 'seconds': parse_countdown_time(args[0])} if args else {'cmd': 'start'}
+    if name in ('set', 'set_manual'):
+        return {'cmd': 'set_manual', 'which': args[0].lower() if args else '', 'value': ' '.join(args[1:])}
+    if name == 'mission':
+        return {'cmd': 'mission', 'name': ' '.join(args)}
+    if name == 'profile':
+        return {'cmd': 'profile', 'seconds': float(args[0])} if args else {'cmd': 'profile'}
+    if name in ('add', 'add_countdown', 'remove', 'remove_countdown'):
+        return {'cmd': 'add_countdown' if name.startswith('add') else 'remove_countdown', 'countdown': ' '.join(args)}
+    return {'cmd': name}
+
+
+class CountdownEngine:
+    """Every countdown, the Go/No-Go poll and the HTML writers, with no UI attached.
+
+    The Tk app and headless mode both call tick() on their own loop and send operator
+    actions through execute(), so both behave identically.
+    """
+
+    def __init__(self, scheduler=None, gonogo_source=None, replayer=None, gonogo_interval=GONOGO_POLL_SECONDS,
+                 replication=None):
+        settings = load_settings()
+        self.scheduler = scheduler or CountdownScheduler(settings.get('countdowns') or [PRIMARY_COUNTDOWN])
+        self.scheduler.add(PRIMARY_COUNTDOWN)
+        # when replaying a timeline, the replayer drives the clocks and stands in for the sheet poller
+        self.replayer = replayer
+        if replayer is not None:
+            replayer.scheduler = self.scheduler
+        if gonogo_source is None and replayer is None and settings.get('gonogo_fetcher') == 'process':
+            try:
+                gonogo_source = ProcessFetcher(float(settings.get('fetcher_heartbeat_timeout', 10.0)))
+            except Exception as e:
+                log.error("Failed to start the fetcher process, fetching in-process: %s", e)
+        self.gonogo_source = gonogo_source or (replayer.fetch_gonogo if replayer is not None else fetch_gonogo)
+        # a replay answers from memory and the fetcher process never waits on the network: both are polled on the
+        # loop thread. Sheet fetches in this process run on a worker so tick() never blocks on the network.
+        self.poll_inline = replayer is not None or isinstance(self.gonogo_source, ProcessFetcher)
+        self.gonogo_interval = gonogo_interval
+        self.gonogo_values = ['N/A', 'N/A', 'N/A']
+        self.last_gonogo_update = 0.0
+        # countdown pages, gonogo.html, output profiles and `output_sinks`, each on its own worker
+        self.outputs = OutputPipeline()
+        self.raster = None
+        self._raster_failed = None
+        self.webhooks = None
+        self._webhooks_failed = None
+        # warm start: periodic state snapshot
+        self.snapshot_path = None
+        self._snapshot_written = None
+        # Go/No-Go fetch running on a worker thread, when it started and what it answered
+        self._poll = None
+        self._poll_started = 0.0
+        self._polled = None
+        restore_manual_gonogo(settings)
+        self._update_webhooks(settings)
+        # hot standby: a primary streams its state after every tick, a standby follows until it takes over
+        self.replication = None
+        if replayer is None:
+            self.replication = start_replication(replication if replication is not None else settings.get('replication'))
+        # time service for live display pages and secondary instances, in this engine's timebase
+        self.time_sync = start_time_sync_server(settings.get('time_sync_port'), settings.get('time_sync_host'))
+
+    def countdown(self, name=None):
+        cd = self.scheduler.get(name or PRIMARY_COUNTDOWN)
+        if cd is None:
+            raise ValueError(f"Unknown countdown: {name}")
+        return cd
+
+    def poll_gonogo(self, now=None, settings=None):
+        """Fetch Go/No-Go and log a change (the next publish rewrites gonogo.html); returns the values."""
+        # fetch_gonogo returns [Range, Weather, Vehicle]; a ProcessFetcher returns None until its first answer
+        if self.gonogo_source is fetch_gonogo or isinstance(self.gonogo_source, ProcessFetcher):
+            values = self.gonogo_source(settings)
+        else:
+            values = self.gonogo_source()
+        if values is None:
+            return self.gonogo_values
+        return self._set_gonogo(list(values), now, settings)
+
+    def _set_gonogo(self, values, now=None, settings=None):
+        startup.mark('first_data')
+        if values != self.gonogo_values:
+            timeline.record('gonogo', values=values, previous=list(self.gonogo_values or []))
+        self.gonogo_values = values
+        self.last_gonogo_update = clock.time() if now is None else now
+        return values
+
+    def tick(self, now=None):
+        """Advance every countdown and poll Go/No-Go when due; returns True if Go/No-Go was polled."""
+        started = time.perf_counter()
+        now = clock.time() if now is None else now
+        if self.replayer is not None:
+            self.replayer.advance(now)
+        settings = load_settings()
+        passive = self.replication is not None and not self.replication.before_tick(self, now)
+        if self.webhooks is not None:
+            self.webhooks.paused = passive
+        if passive:
+            # passive standby: keep the mirrored clocks current and leave every output to the primary
+            self.scheduler.tick(now, settings, write=False)
+            return False
+        # one pass advances every countdown; their pages are written by the output pipeline
+        self.scheduler.tick(now, settings, write=False)
+        polled = False
+        if self._poll is not None and not self._poll.is_alive():
+            self._poll = None
+            # a manual value set while the fetch ran is newer than its answer
+            if self._polled is not None and self._poll_started >= self.last_gonogo_update:
+                self._set_gonogo(self._polled, now, settings)
+                polled = True
+        if self._poll is None and now - self.last_gonogo_update > self.gonogo_interval:
+            if self.poll_inline or settings.get('mode', 'spreadsheet') == 'buttons':
+                self.poll_gonogo(now, settings)
+                polled = True
+            else:
+                self.start_gonogo_poll()
+        # every output renders from this one snapshot, on the sinks' own threads
+        outputs_started = time.perf_counter()
+        state = self.state()
+        self.outputs.publish(state, settings)
+        if self.time_sync is not None:
+            self.time_sync.update(self.scheduler)
+        self._update_raster(state, settings)
+        self._update_webhooks(settings)
+        if self.replication is not None:
+            self.replication.after_tick(self)
+        if self.snapshot_path is not None:
+            self.save_snapshot()
+        if profiler.enabled:
+            finished = time.perf_counter()
+            profiler.record('outputs', finished - outputs_started)
+            profiler.record('tick', finished - started)
+        if profiler.capturing:
+            profiler.check()
+        return polled
+
+    def save_snapshot(self):
+        """Persist countdown and Go/No-Go state when it changed (not on every timer second)."""
+        data = {
+            'gonogo': list(self.gonogo_values),
+            'countdowns': {cd.name: cd.persist_state() for cd in self.scheduler.countdowns.values()},
+        }
+        if data == self._snapshot_written:
+            return False
+        try:
+            write_state_snapshot(dict(data, saved_at=time.time(), version=appVersion), self.snapshot_path)
+            self._snapshot_written = data
+            return True
+        except Exception as e:
+            log.error("Failed to write state snapshot: %s", e)
+            self.snapshot_path = None
+            return False
+
+    def warm_start(self, path=STATE_SNAPSHOT_FILE, restore=True):
+        """Restore the last snapshot, write outputs from it at once and revalidate Go/No-Go in the background.
+
+        Snapshots are kept from here on; returns True when a snapshot was restored. With
+        restore=False only the background first fetch is started.
+        """
+        passive = self.replication is not None and self.replication.passive
+        # a standby's state comes from its primary, not from its own last run
+        snapshot = load_state_snapshot(path) if restore and not passive else None
+        now = clock.time()
+        restored = False
+        if snapshot:
+            for name, data in (snapshot.get('countdowns') or {}).items():
+                try:
+                    cd = self.scheduler.get(name) or self.scheduler.add(name)
+                    cd.restore(data, now)
+                    restored = True
+                except Exception as e:
+                    log.error("Failed to restore countdown %s: %s", name, e)
+            values = snapshot.get('gonogo')
+            if isinstance(values, list) and len(values) == 3:
+                self.gonogo_values = values
+            self.publish_outputs()
+            log.info("Restored state from %s (saved %.0f s ago)", path, time.time() - (snapshot.get('saved_at') or time.time()))
+        self.last_gonogo_update = now
+        self.start_gonogo_poll()
+        self.snapshot_path = path
+        return restored
+
+    def start_gonogo_poll(self):
+        """Fetch Go/No-Go on a worker thread; the next tick after it finishes applies the result.
+
+        Does nothing while a fetch is already running.
+        """
+        if self._poll is not None and self._poll.is_alive():
+            return
+        self._polled = None
+        self._poll_started = clock.time()
+
+        def run():
+            try:
+                values = self.gonogo_source()
+                self._polled = list(values) if values is not None else None
+            except Exception as e:
+                log.error("Go/No-Go poll failed: %s", e)
+
+        self._poll = threading.Thread(target=run, name="gonogo-poll", daemon=True)
+        self._poll.start()
+
+    def close(self):
+        """Stop the output workers, the raster output and replication at shutdown."""
+        self.outputs.close()
+        if self.raster is not None:
+            self.raster.close()
+            self.raster = None
+        if self.replication is not None:
+            self.replication.close()
+
+    def _update_raster(self, state, settings):
+        config = settings.get('raster_output') or None
+        if self.raster is not None and self.raster.config != config:
+            self.raster.close()
+            self.raster = None
+        if config and self.raster is None and config != self._raster_failed:
+            try:
+                self.raster = RasterOutput(config, settings)
+            except Exception as e:
+                # don't retry every tick; a changed config gets a fresh attempt
+                log.error("Failed to start raster output: %s", e)
+                self._raster_failed = config
+        if self.raster is not None:
+            self.raster.submit(state)
+
+    def _update_webhooks(self, settings):
+        # a replay re-enacts old events; announcing them would fire real cues and bots
+        config = (settings.get('webhooks') or None) if self.replayer is None else None
+        if self.webhooks is not None and self.webhooks.config != config:
+            timeline.listeners.remove(self.webhooks.notify)
+            self.webhooks.close()
+            self.webhooks = None
+        if config and self.webhooks is None and config != self._webhooks_failed:
+            try:
+                self.webhooks = WebhookNotifier(config)
+            except Exception as e:
+                log.error("Failed to start webhook notifications: %s", e)
+                self._webhooks_failed = config
+                return
+            timeline.listeners.append(self.webhooks.notify)
+
+    def set_manual(self, which, value):
+        self.execute({'cmd': 'set_manual', 'which': which, 'value': value})
+
+    def execute(self, command):
+        """Apply a control command and return the resulting state.
+
+        `command` is a dict with 'cmd', or a batch: a list of such dicts or
+        {'cmd': 'batch', 'commands': [...]}. A batch is validated up front and then
+        applied as a unit with one settings save and one write per affected output.
+        """
+        if isinstance(command, dict) and command.get('cmd') == 'batch':
+            command = command.get('commands') or []
+        commands = command if isinstance(command, list) else [command]
+        self._validate(commands)
+        if self.replication is not None and self.replication.passive:
+            if any(cmd.get('cmd') != 'state' for cmd in commands):
+                raise ValueError("This instance is a standby; send commands to the primary")
+            return self.state()
+        touched = set()
+        manual = False
+        for cmd in commands:
+            name = self._apply(cmd)
+            if name == 'set_manual':
+                manual = True
+            elif name not in ('state', 'add_countdown', 'remove_countdown'):
+                touched.add(cmd.get('countdown') or PRIMARY_COUNTDOWN)
+        if manual:
+            persist_manual_gonogo()
+            # manual values only count in buttons mode, where the source answers at once
+            settings = load_settings()
+            if self.poll_inline or settings.get('mode', 'spreadsheet') == 'buttons':
+                self.poll_gonogo(settings=settings)
+        now = clock.time()
+        for name in touched:
+            cd = self.scheduler.get(name)
+            if cd is not None:
+                # bring the timer text up to date so the reply and outputs reflect the commands
+                cd.tick(now)
+        state = self.publish_outputs()
+        if self.replication is not None and any(cmd.get('cmd') != 'state' for cmd in commands):
+            # don't leave the standby a tick (and possibly a slow fetch) behind the command
+            self.replication.publish(self)
+        return state
+
+    def _validate(self, commands):
+        known = set(self.scheduler.names())
+        for cmd in commands:
+            if not isinstance(cmd, dict):
+                raise ValueError(f"Expected a command object, got {cmd!r}")
+            name = cmd.get('cmd')
+            if name not in ENGINE_COMMANDS:
+                raise ValueError(f"Unknown command: {name}")
+            if name == 'add_countdown':
+                known.add(str(cmd.get('countdown') or '').strip() or PRIMARY_COUNTDOWN)
+            elif name == 'remove_countdown':
+                known.discard(cmd.get('countdown'))
+            elif name == 'set_manual':
+                if cmd.get('which') not in MANUAL_KEYS:
+                    raise ValueError(f"Unknown Go/No-Go parameter: {cmd.get('which')}")
+            elif (cmd.get('countdown') or PRIMARY_COUNTDOWN) not in known:
+                raise ValueError(f"Unknown countdown: {cmd.get('countdown')}")
+            # parse arguments here too, so a bad one rejects the batch before anything is applied
+            if name == 'start':
+                if cmd.get('at'):
+                    parse_clock_time(cmd['at'])
+                else:
+                    try:
+                        parse_countdown_time(cmd.get('seconds', 0))
+                    except (TypeError, ValueError):
+                        raise ValueError(f"Bad countdown time: {cmd.get('seconds')!r}") from None
+            elif name == 'profile':
+                try:
+                    float(cmd.get('seconds') or 10)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Bad profile length: {cmd.get('seconds')!r}") from None
+
+    def _apply(self, command):
+        """Apply one validated command to the engine state, without writing any output."""
+        name = command.get('cmd')
+        if name == 'set_manual':
+            set_manual_gonogo(command.get('which'), command.get('value'), persist=False)
+        elif name == 'add_countdown':
+            self.scheduler.add(str(command.get('countdown') or '').strip() or PRIMARY_COUNTDOWN)
+        elif name == 'remove_countdown':
+            self.scheduler.remove(command.get('countdown'))
+        elif name == 'profile':
+            # capture on this (the engine loop's) thread; --profile is not required for a one-off window
+            profiler.start_capture(float(command.get('seconds') or 10))
+        elif name != 'state':
+            cd = self.countdown(command.get('countdown'))
+            if name == 'start':
+                if command.get('mission'):
+                    cd.mission_name = command['mission']
+                if command.get('at'):
+                    h, m, s = parse_clock_time(command['at'])
+                    tzname = command.get('timezone') or load_settings().get('timezone', 'local')
+                    seconds = seconds_until_clock_time(h, m, s, tzname)
+                else:
+                    seconds = parse_countdown_time(command.get('seconds', 0))
+                cd.start(seconds)
+            elif name == 'hold':
+                cd.hold()
+            elif name == 'resume':
+                cd.resume()
+            elif name == 'scrub':
+                cd.scrub()
+            elif name == 'reset':
+                cd.reset()
+            elif name == 'mission':
+                cd.mission_name = str(command.get('name') or '').strip() or "Placeholder Mission"
+        return name
+
+    def state(self):
+        return {
+            'countdowns': {name: cd.snapshot() for name, cd in list(self.scheduler.countdowns.items())},
+            'gonogo': dict(zip(MANUAL_KEYS, self.gonogo_values)),
+            'stale': False,
+        }
+
+    def publish_outputs(self):
+        """Hand the current state to the output workers now, after a change made outside tick() and execute()."""
+        state = self.state()
+        self.outputs.publish(state, load_settings())
+        return state
+
+    def publish_stale(self):
+        """Called off the loop thread while the loop is stuck: publish the last state flagged as not live."""
+        state = self.state()
+        state['stale'] = True
+        self.outputs.publish(state, load_settings())
+
+
+# -------------------------
+# Warm-start snapshot
+# -------------------------
+def load_state_snapshot(path=STATE_SNAPSHOT_FILE):
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as fh:
+                return json.load(fh)
+    except Exception as e:
+        log.error("Ignoring unreadable state snapshot %s: %s", path, e)
+    return None
+
+
+def write_state_snapshot(data, path=STATE_SNAPSHOT_FILE):
+    # write-then-rename so a crash mid-write leaves the previous snapshot intact
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh)
+    os.replace(tmp, path)
+
+
+def write_snapshot_outputs(path=STATE_SNAPSHOT_FILE):
+    """Render countdown and Go/No-Go pages straight from the last snapshot; returns False without one."""
+    snapshot = load_state_snapshot(path)
+    if not snapshot:
+        return False
+    settings = load_settings()
+    for name, data in (snapshot.get('countdowns') or {}).items():
+        cd = Countdown(name)
+        cd.restore(data, record=False)
+        cd.write_output(settings, force=True)
+    if isinstance(snapshot.get('gonogo'), list):
+        write_gonogo_html(snapshot['gonogo'], settings)
+    return True
+
+
+# -------------------------
+# Hot-standby replication (primary -> standby over TCP)
+# -------------------------
+REPLICATION_PORT = 8790
+REPLICATION_HEARTBEAT_SECONDS = 0.2
+# five missed heartbeats; sheet fetches run off the loop, so a loop this late is stuck
+REPLICATION_TIMEOUT_SECONDS = 1.0
+REPLICATION_LOOP_GRACE_SECONDS = 1.0
+REPLICATION_BYTES_TOTAL = metrics.counter('rlc_replication_bytes_total', "Replication stream bytes")
+REPLICATION_MESSAGES_TOTAL = metrics.counter('rlc_replication_messages_total', "Replication stream messages")
+REPLICATION_TAKEOVERS_TOTAL = metrics.counter('rlc_replication_takeovers_total', "Times this standby took over from its primary")
+REPLICATION_STEPDOWNS_TOTAL = metrics.counter('rlc_replication_stepdowns_total', "Times this standby handed back to a recovered primary")
+REPLICATION_FAILOVER_SECONDS = metrics.histogram('rlc_replication_failover_seconds', "Time from the primary's last message to this standby taking over")
+
+
+def replication_state(engine):
+    """The compact state a standby needs: each armed clock (target epoch, hold state) and Go/No-Go."""
+    countdowns = {}
+    for cd in engine.scheduler.countdowns.values():
+        data = cd.persist_state()
+        if data['running'] and not data['on_hold']:
+            # follows from target_time; leaving it out keeps a running count to zero traffic
+            data.pop('remaining_time')
+        countdowns[cd.name] = data
+    return {'countdowns': countdowns, 'gonogo': list(engine.gonogo_values)}
+
+
+def replication_delta(old, new):
+    """Changed keys per countdown, removed countdowns and Go/No-Go if it changed; None when equal."""
+    delta = {}
+    changed = {}
+    for name, data in new['countdowns'].items():
+        before = old['countdowns'].get(name) or {}
+        diff = {k: v for k, v in data.items() if before.get(k, object()) != v}
+        # a dropped key (remaining_time once the count resumes) is sent as None
+        diff.update({k: None for k in before if k not in data})
+        if diff:
+            changed[name] = diff
+    if changed:
+        delta['countdowns'] = changed
+    removed = [name for name in old['countdowns'] if name not in new['countdowns']]
+    if removed:
+        delta['removed'] = removed
+    if new['gonogo'] != old['gonogo']:
+        delta['gonogo'] = new['gonogo']
+    return delta or None
+
+
+def parse_host_port(text, default_host, default_port=REPLICATION_PORT):
+    host, _, port = str(text).rpartition(':')
+    return host or default_host, int(port or default_port)
+
+
+class _ReplicaConnection:
+    """One connected standby; its own writer thread so a slow link never reaches the tick loop."""
+
+    def __init__(self, sock, addr):
+        self.sock = sock
+        self.addr = addr
+        self.seq = 0
+        self.queue = queue.Queue(maxsize=256)
+        self.closed = False
+        # the tick loop and the heartbeat thread both send; numbering and queueing happen together
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name=f"replication-{addr[0]}:{addr[1]}", daemon=True).start()
+
+    def send(self, message, after_full=False):
+        """Number and queue a message; a standby too far behind is disconnected (it resyncs on reconnect).
+
+        With after_full=True nothing is sent until the connection's full snapshot has gone out.
+        """
+        with self._lock:
+            if after_full and self.seq == 0:
+                return
+            self.seq += 1
+            line = (json.dumps(dict(message, seq=self.seq), separators=(',', ':')) + '\n').encode('utf-8')
+            try:
+                self.queue.put_nowait((message['type'], line))
+            except queue.Full:
+                self.close()
+
+    def _run(self):
+        while not self.closed:
+            item = self.queue.get()
+            if item is None:
+                break
+            kind, line = item
+            try:
+                self.sock.sendall(line)
+            except OSError:
+                break
+            REPLICATION_BYTES_TOTAL.inc(len(line), direction='sent')
+            REPLICATION_MESSAGES_TOTAL.inc(type=kind, direction='sent')
+        self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class ReplicationPrimary:
+    """Streams state deltas to standbys, numbered per connection, with heartbeats.
+
+    A standby gets a full snapshot when it connects, then deltas from after_tick() and from
+    publish() after each command. A heartbeat thread sends {"loop_age"} (seconds since the
+    last tick) every `heartbeat` seconds, so a slow sheet fetch holding up the tick never
+    looks like a dead primary; the standby judges a stuck loop from loop_age instead.
+    """
+    passive = False
+
+    def __init__(self, listen, heartbeat=REPLICATION_HEARTBEAT_SECONDS):
+        self.heartbeat = float(heartbeat)
+        self.address = parse_host_port(listen, '0.0.0.0')
+        self.sock = socket.create_server(self.address)
+        self.address = self.sock.getsockname()[:2]
+        self.clients = []
+        self._state = None
+        self._last_tick = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        threading.Thread(target=self._accept, name="replication-accept", daemon=True).start()
+        threading.Thread(target=self._heartbeats, name="replication-heartbeat", daemon=True).start()
+        log.info("Replicating to standbys on %s:%s", *self.address)
+
+    def _heartbeats(self):
+        while not self._stop.wait(self.heartbeat):
+            message = {'type': 'hb', 't': time.time(), 'loop_age': round(time.monotonic() - self._last_tick, 3)}
+            with self._lock:
+                clients = list(self.clients)
+            for client in clients:
+                client.send(message, after_full=True)
+
+    def _accept(self):
+        while True:
+            try:
+                sock, addr = self.sock.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            log.info("Standby connected from %s:%s", *addr)
+            with self._lock:
+                self.clients.append(_ReplicaConnection(sock, addr))
+
+    def before_tick(self, engine, now):
+        return True
+
+    def after_tick(self, engine):
+        self._last_tick = time.monotonic()
+        self.publish(engine)
+
+    def publish(self, engine):
+        """Send the full snapshot to new standbys and the delta since the last call to the others."""
+        state = replication_state(engine)
+        with self._lock:
+            self.clients = [c for c in self.clients if not c.closed]
+            clients = list(self.clients)
+        for client in clients:
+            if client.seq == 0:
+                client.send({'type': 'full', 't': time.time(), 'state': state})
+        delta = replication_delta(self._state, state) if self._state is not None else None
+        self._state = state
+        if delta:
+            message = dict(delta, type='delta', t=time.time())
+            for client in clients:
+                client.send(message, after_full=True)
+
+    def close(self):
+        self._stop.set()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+        with self._lock:
+            for client in self.clients:
+                client.close()
+
+
+class ReplicationStandby:
+    """Mirrors a primary and takes over output generation when it goes quiet.
+
+    While passive the engine follows the replicated clocks and writes nothing (no outputs,
+    no webhooks). The first tick after the connection drops, after `timeout` seconds without
+    a message, or once the primary reports its loop stuck for more than `loop_grace`
+    seconds, promotes this instance: it polls Go/No-Go and writes every output. It keeps
+    reconnecting, and steps down again as soon as the primary is back with a live loop,
+    so two instances never stay in charge together. A standby that never heard from its
+    primary keeps waiting.
+    """
+
+    def __init__(self, primary, timeout=REPLICATION_TIMEOUT_SECONDS, loop_grace=REPLICATION_LOOP_GRACE_SECONDS):
+        self.primary = parse_host_port(primary, '127.0.0.1')
+        self.timeout = float(timeout)
+        self.loop_grace = float(loop_grace)
+        self.passive = True
+        self.connected = False
+        self.last_heard = None
+        self.loop_age = 0.0
+        self._closed = False
+        self._mirror = None
+        self._changed = set()
+        self._gonogo_changed = False
+        self._lock = threading.Lock()
+        self._sock = None
+        threading.Thread(target=self._run, name="replication-standby", daemon=True).start()
+        log.info("Standing by for primary %s:%s", *self.primary)
+
+    def _run(self):
+        while not self._closed:
+            try:
+                sock = socket.create_connection(self.primary, timeout=1.0)
+            except OSError:
+                time.sleep(0.25)
+                continue
+            sock.settimeout(None)
+            self._sock = sock
+            self.loop_age = 0.0
+            try:
+                self._receive(sock.makefile('rb'))
+            except (OSError, ValueError) as e:
+                log.warning("Replication stream from %s:%s broke: %s", *self.primary, e)
+            finally:
+                self.connected = False
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+    def _receive(self, stream):
+        expected = 1
+        for line in stream:
+            message = json.loads(line)
+            REPLICATION_BYTES_TOTAL.inc(len(line), direction='received')
+            REPLICATION_MESSAGES_TOTAL.inc(type=message.get('type'), direction='received')
+            if message.get('seq') != expected:
+                raise ValueError(f"sequence gap: expected {expected}, got {message.get('seq')}")
+            expected += 1
+            with self._lock:
+                self._apply(message)
+            if message.get('type') == 'hb':
+                self.loop_age = float(message.get('loop_age') or 0.0)
+            self.last_heard = time.monotonic()
+            self.connected = True
+
+    def _apply(self, message):
+        kind = message.get('type')
+        if kind == 'full':
+            self._mirror = message['state']
+            self._changed = set(self._mirror['countdowns']) | {None}
+            self._gonogo_changed = True
+        elif kind == 'delta' and self._mirror is not None:
+            for name, diff in (message.get('countdowns') or {}).items():
+                data = self._mirror['countdowns'].setdefault(name, {})
+                for key, value in diff.items():
+                    if value is None:
+                        data.pop(key, None)
+                    else:
+                        data[key] = value
+                self._changed.add(name)
+            for name in message.get('removed') or []:
+                self._mirror['countdowns'].pop(name, None)
+                self._changed.add(None)
+            if 'gonogo' in message:
+                self._mirror['gonogo'] = message['gonogo']
+                self._gonogo_changed = True
+
+    def primary_alive(self):
+        return (self.connected and time.monotonic() - self.last_heard <= self.timeout
+                and self.loop_age <= self.loop_grace)
+
+    def before_tick(self, engine, now):
+        """Apply what arrived since the last tick; True while this instance is in charge."""
+        if not self.passive:
+            if not self.primary_alive():
+                return True
+            self.step_down(engine)
+        with self._lock:
+            if self._mirror is not None:
+                countdowns = self._mirror['countdowns']
+                for name in self._changed:
+                    if name is None:
+                        for extra in set(engine.scheduler.names()) - set(countdowns):
+                            engine.scheduler.remove(extra)
+                    elif name in countdowns:
+                        cd = engine.scheduler.get(name) or engine.scheduler.add(name)
+                        cd.restore(dict(countdowns[name]), now, record=False)
+                if self._gonogo_changed:
+                    engine.gonogo_values = list(self._mirror['gonogo'])
+            self._changed = set()
+            self._gonogo_changed = False
+        if self.last_heard is None or self.primary_alive():
+            return False
+        self.promote(engine, time.monotonic() - self.last_heard)
+        return True
+
+    def promote(self, engine, silent):
+        self.passive = False
+        REPLICATION_TAKEOVERS_TOTAL.inc()
+        REPLICATION_FAILOVER_SECONDS.observe(silent)
+        if self.connected:
+            log.warning("Primary %s:%s loop stuck for %.1f s; taking over the outputs", *self.primary, self.loop_age)
+        else:
+            log.warning("Primary %s:%s silent for %.0f ms; taking over the outputs", *self.primary, silent * 1000)
+        timeline.record('failover', primary=f"{self.primary[0]}:{self.primary[1]}", silent=round(silent, 3),
+                        loop_age=self.loop_age)
+        engine.last_gonogo_update = 0.0
+        engine.outputs.invalidate()
+
+    def step_down(self, engine):
+        """The primary is back with a live loop: follow it again and leave the outputs to it."""
+        self.passive = True
+        REPLICATION_STEPDOWNS_TOTAL.inc()
+        log.warning("Primary %s:%s is back; handing the outputs back to it", *self.primary)
+        timeline.record('stepdown', primary=f"{self.primary[0]}:{self.primary[1]}")
+        with self._lock:
+            # take the primary's whole state again, whatever changed here meanwhile
+            if self._mirror is not None:
+                self._changed = set(self._mirror['countdowns']) | {None}
+                self._gonogo_changed = True
+
+    def after_tick(self, engine):
+        pass
+
+    def publish(self, engine):
+        pass
+
+    def close(self):
+        self._closed = True
+        try:
+            if self._sock is not None:
+                self._sock.close()
+        except OSError:
+            pass
+
+
+def replication_config(options):
+    """--primary / --standby from the command line; None falls back to the `replication` setting."""
+    if getattr(options, 'primary', None):
+        return {'role': 'primary', 'listen': options.primary}
+    if getattr(options, 'standby', None):
+        return {'role': 'standby', 'primary': options.standby}
+    return None
+
+
+def start_replication(config):
+    """ReplicationPrimary / ReplicationStandby from {"role": "primary", "listen": "[host:]port",
+    "heartbeat"} or {"role": "standby", "primary": "host:port", "timeout", "loop_grace"}; None when off or failing."""
+    if not config:
+        return None
+    try:
+        role = config.get('role')
+        if role == 'primary':
+            return ReplicationPrimary(config.get('listen') or REPLICATION_PORT,
+                                      config.get('heartbeat', REPLICATION_HEARTBEAT_SECONDS))
+        if role == 'standby':
+            return ReplicationStandby(config['primary'], config.get('timeout', REPLICATION_TIMEOUT_SECONDS),
+                                      config.get('loop_grace', REPLICATION_LOOP_GRACE_SECONDS))
+        raise ValueError(f"unknown role {role!r}")
+    except Exception as e:
+        log.error("Replication not started: %s", e)
+        return None
+
+
+# -------------------------
+# Time sync (NTP-style offset estimation against the app's timebase)
+# -------------------------
+TIME_SYNC_PORT = 8791
+TIME_SYNC_REQUEST = struct.Struct('!d')
+TIME_SYNC_REPLY = struct.Struct('!ddd')
+TIME_SYNC_STEP_SECONDS = 0.128
+TIME_SYNC_RTT_SECONDS = metrics.histogram('rlc_time_sync_rtt_seconds', "Round-trip delay of time-sync exchanges with the app")
+TIME_SYNC_REQUESTS_TOTAL = metrics.counter('rlc_time_sync_requests_total', "Time-sync requests served")
+
+
+class ClockSync:
+    """Offset and round-trip delay from four-timestamp exchanges, as NTP does it.
+
+    t1 and t4 are the client's send and receive times on its own clock, t2 and t3 the
+    server's receive and reply times. Of the last `window` samples the one with the least
+    delay is trusted most (queueing only ever adds delay), and the offset follows it
+    smoothly unless it is more than TIME_SYNC_STEP_SECONDS away, when it steps.
+    """
+
+    def __init__(self, window=8, smoothing=0.25):
+        self.samples = deque(maxlen=window)
+        self.smoothing = smoothing
+        self.offset = None
+        self.delay = None
+        self.jitter = 0.0
+
+    def add(self, t1, t2, t3, t4):
+        offset = ((t2 - t1) + (t3 - t4)) / 2
+        delay = max(0.0, (t4 - t1) - (t3 - t2))
+        self.samples.append((delay, offset))
+        self.delay, best = min(self.samples)
+        if self.offset is None or abs(best - self.offset) > TIME_SYNC_STEP_SECONDS:
+            self.offset = best
+        else:
+            self.jitter += (abs(offset - self.offset) - self.jitter) * self.smoothing
+            self.offset += (best - self.offset) * self.smoothing
+        return offset, delay
+
+
+class TimeSyncRequestHandler(BaseHTTPRequestHandler):
+    """GET /time?t1=<client time> for display pages; GET /countdown?name=<countdown> for live pages."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        t2 = clock.time()
+        url = urlparse(self.path)
+        query = dict(parse_qsl(url.query))
+        if url.path == '/time':
+            try:
+                t1 = float(query.get('t1', 0))
+            except ValueError:
+                t1 = 0.0
+            TIME_SYNC_REQUESTS_TOTAL.inc(transport='http')
+            self._reply({'t1': t1, 't2': t2, 't3': clock.time()})
+        elif url.path == '/countdown':
+            server = self.server.owner
+            cd = server.countdowns.get(query.get('name') or PRIMARY_COUNTDOWN)
+            if cd is None:
+                self.send_error(404)
+                return
+            age = time.monotonic() - server.updated if server.updated is not None else None
+            self._reply(dict(cd, age=age))
+        else:
+            self.send_error(404)
+
+    def _reply(self, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        # display pages are usually opened from file:// or another host
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TimeSyncServer:
+    """Answers time-sync requests in the app's timebase (clock.time()) over UDP and HTTP on one port.
+
+    UDP: the client sends its transmit time t1 (8 bytes, a big-endian double) and gets back
+    t1, t2 and t3 (24 bytes). HTTP: see TimeSyncRequestHandler. update() is called from the
+    tick loop with the countdowns that live display pages render.
+    """
+
+    def __init__(self, port=TIME_SYNC_PORT, host='0.0.0.0'):
+        self.http = ThreadingHTTPServer((host, int(port)), TimeSyncRequestHandler)
+        self.http.daemon_threads = True
+        self.http.owner = self
+        self.address = self.http.server_address[:2]
+        self.udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp.bind(self.address)
+        self.countdowns = {}
+        self.updated = None
+        threading.Thread(target=self.http.serve_forever, name="time-sync-http", daemon=True).start()
+        threading.Thread(target=self._serve_udp, name="time-sync-udp", daemon=True).start()
+
+    def _serve_udp(self):
+        while True:
+            try:
+                data, addr = self.udp.recvfrom(64)
+                t2 = clock.time()
+                if len(data) < TIME_SYNC_REQUEST.size:
+                    continue
+                t1, = TIME_SYNC_REQUEST.unpack_from(data)
+                TIME_SYNC_REQUESTS_TOTAL.inc(transport='udp')
+                self.udp.sendto(TIME_SYNC_REPLY.pack(t1, t2, clock.time()), addr)
+            except OSError:
+                if self.udp.fileno() < 0:
+                    return
+
+    def update(self, scheduler):
+        self.countdowns = {cd.name: dict(cd.snapshot(), hold_start_time=cd.hold_start_time)
+                           for cd in scheduler.countdowns.values()}
+        self.updated = time.monotonic()
+
+    def close(self):
+        self.http.shutdown()
+        self.udp.close()
+
+
+def start_time_sync_server(port, host=None):
+    """TimeSyncServer on `port` if one is configured; errors are reported, not raised."""
+    if not port:
+        return None
+    try:
+        return TimeSyncServer(port, host or '0.0.0.0')
+    except Exception as e:
+        log.error("Failed to start time sync on port %s: %s", port, e)
+        return None
+
+
+class SyncedClock:
+    """Clock source in another instance's timebase, for secondary instances (set_clock(SyncedClock(...))).
+
+    Exchanges with the server's UDP time service every `interval` seconds (a quick burst
+    first) and returns local monotonic time plus the estimated offset, so a step of this
+    machine's wall clock changes nothing. Until the first answer it is plain wall time.
+    `local` replaces time.monotonic as the local clock (the skew check uses it).
+    """
+
+    def __init__(self, server, interval=1.0, local=None):
+        self.server = parse_host_port(server, '127.0.0.1', TIME_SYNC_PORT)
+        self.interval = float(interval)
+        self.local = local or time.monotonic
+        self.sync = ClockSync()
+        self.ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="time-sync-client", daemon=True)
+        self._thread.start()
+
+    def time(self):
+        offset = self.sync.offset
+        return time.time() if offset is None else self.local() + offset
+
+    def on_tick(self):
+        pass
+
+    def exchange(self, sock):
+        t1 = self.local()
+        sock.sendto(TIME_SYNC_REQUEST.pack(t1), self.server)
+        while True:
+            data = sock.recv(64)
+            t4 = self.local()
+            if len(data) >= TIME_SYNC_REPLY.size:
+                echo, t2, t3 = TIME_SYNC_REPLY.unpack_from(data)
+                if echo == t1:
+                    break  # anything else is a late answer to an earlier request
+        offset, delay = self.sync.add(t1, t2, t3, t4)
+        TIME_SYNC_RTT_SECONDS.observe(delay)
+        return offset, delay
+
+    def _run(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(0.5)
+        synced = False
+        burst = 5
+        while not self._stop.is_set():
+            try:
+                self.exchange(sock)
+                if not synced:
+                    synced = True
+                    self.ready.set()
+                    log.info("Clock synced to %s:%s: offset %+.1f ms from wall time, RTT %.2f ms", *self.server,
+                             (self.time() - time.time()) * 1000, self.sync.delay * 1000)
+            except OSError as e:
+                log.debug("Time sync with %s:%s failed: %s", *self.server, e)
+            if burst:
+                burst -= 1
+                self._stop.wait(0.05)
+            else:
+                self._stop.wait(self.interval)
+        sock.close()
+
+    def close(self):
+        self._stop.set()
+
+
+def time_sync_page_script(name, url):
+    """Script for countdown.html that renders the count locally in the app's timebase.
+
+    The page estimates its clock offset from /time like ClockSync, follows the countdown's
+    state from /countdown four times a second, and falls back to reloading the written
+    file when the app stops answering.
+    """
+    return string.Template(TIME_SYNC_PAGE_JS).safe_substitute(url=json.dumps(url.rstrip('/')), name=json.dumps(name))
+
+
+TIME_SYNC_PAGE_JS = """<script>
+(function () {
+    var url = $url, name = $name, samples = [], offset = null, st = null, failures = 0;
+    var timer = document.getElementById("timer"), mission = document.getElementById("mission");
+    function now() { return (performance.timeOrigin + performance.now()) / 1000; }
+    function sync() {
+        var t1 = now();
+        fetch(url + "/time?t1=" + t1, {cache: "no-store"}).then(function (r) { return r.json(); }).then(function (j) {
+            var t4 = now();
+            samples.push([(t4 - t1) - (j.t3 - j.t2), ((j.t2 - t1) + (j.t3 - t4)) / 2]);
+            if (samples.length > 8) samples.shift();
+            var best = samples.reduce(function (a, b) { return b[0] < a[0] ? b : a; })[1];
+            offset = (offset === null || Math.abs(best - offset) > 0.128) ? best : offset + (best - offset) * 0.25;
+        }).catch(function () {});
+    }
+    function poll() {
+        fetch(url + "/countdown?name=" + encodeURIComponent(name), {cache: "no-store"}).then(function (r) { return r.json(); }).then(function (j) {
+            st = j; failures = 0;
+            document.body.classList.toggle("stale", j.age === null || j.age > 2);
+        }).catch(function () { if (++failures > 4) location.reload(); });
+    }
+    function fmt(s, prefix) {
+        s = Math.max(0, s);
+        return prefix + [Math.floor(s / 3600), Math.floor(s % 3600 / 60), Math.floor(s % 60)].map(function (v) {
+            return String(v).padStart(2, "0"); }).join(":");
+    }
+    function render() {
+        if (st && offset !== null) {
+            var t = now() + offset, text = st.timer;
+            if (st.running && !st.scrubbed) {
+                if (st.on_hold) text = fmt(Math.trunc(t - st.hold_start_time), "H+");
+                else if (st.counting_up) text = fmt(Math.trunc(t - st.target_time), "T+");
+                else if (st.target_time) { var d = Math.trunc(st.target_time - t); text = d <= 0 ? "T+00:00:00" : fmt(d, "T-"); }
+            }
+            if (timer.textContent !== text) timer.textContent = text;
+            if (mission.textContent !== st.mission) mission.textContent = st.mission;
+        }
+        requestAnimationFrame(render);
+    }
+    for (var i = 0; i < 5; i++) setTimeout(sync, i * 100);
+    setInterval(sync, 5000);
+    setInterval(poll, 250);
+    poll();
+    render();
+})();
+</script>"""
+
+
+# -------------------------
+# Control API (loopback HTTP)
+# -------------------------
+CONTROL_HOST = "127.0.0.1"
+LOOPBACK_NAMES = ("127.0.0.1", "localhost", "::1")
+
+
+class PendingCommand:
+    """A control command waiting to be run on the loop that owns the countdown state."""
+
+    def __init__(self, command):
+        self.command = command
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Claim the command for running; False if its caller already gave up on it."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.started_at = time.perf_counter()
+            return True
+
+    def cancel(self):
+        """Withdraw the command unless it has started; True if it will never run."""
+        with self._lock:
+            if self.started_at is None:
+                self.cancelled = True
+            return self.cancelled
+
+    def latency_ms(self):
+        if self.finished_at is None:
+            return None
+        return {
+            'queue': round((self.started_at - self.queued_at) * 1000, 3),
+            'execute': round((self.finished_at - self.started_at) * 1000, 3),
+            'total': round((self.finished_at - self.queued_at) * 1000, 3),
+        }
+
+
+class CommandChannel:
+    """Hands commands from API threads to the UI/engine loop, so state is only touched on that loop.
+
+    Round-trip latency (queued -> executed) of the last `maxlen` commands is kept for /latency.
+    """
+
+    def __init__(self, maxlen=1000):
+        self._queue = queue.Queue()
+        self._latencies = deque(maxlen=maxlen)
+
+    def submit(self, command, timeout=2.0):
+        """Queue a command and block until the owning loop has run it; returns the PendingCommand."""
+        pending = PendingCommand(command)
+        self._queue.put(pending)
+        if not pending.done.wait(timeout):
+            if pending.cancel():
+                # the caller is told it failed, so it must not happen later behind their back
+                raise TimeoutError("Countdown loop did not answer in time")
+            # already running: it's about to finish, so report what it did
+            pending.done.wait()
+        return pending
+
+    def process(self, execute, timeout=0.0):
+        """Run queued commands on the calling thread, waiting up to `timeout` for the first; returns how many ran."""
+        count = 0
+        while True:
+            try:
+                pending = self._queue.get(timeout=timeout) if count == 0 and timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return count
+            if not pending.start():
+                continue
+            try:
+                pending.result = execute(pending.command)
+            except Exception as e:
+                pending.error = str(e)
+            pending.finished_at = time.perf_counter()
+            self._latencies.append(pending.finished_at - pending.queued_at)
+            pending.done.set()
+            count += 1
+
+    def latency_stats(self):
+        samples = sorted(self._latencies)
+        if not samples:
+            return {'count': 0}
+        pick = lambda q: round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 3)
+        return {
+            'count': len(samples),
+            'mean_ms': round(sum(samples) / len(samples) * 1000, 3),
+            'p50_ms': pick(0.50),
+            'p95_ms': pick(0.95),
+            'max_ms': round(samples[-1] * 1000, 3),
+        }
+
+
+class ControlRequestHandler(BaseHTTPRequestHandler):
+    """Routes: GET /state, GET /latency, GET /metrics, POST /<cmd>, POST /countdowns/<name>/<cmd>,
+    POST /command (JSON body) and POST /batch (JSON list of commands)."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle(read_body=False)
+
+    def do_POST(self):
+        self._handle(read_body=True)
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _foreign(self):
+        """True when a browser page from elsewhere (or a rebound DNS name) is making this request.
+
+        A form or fetch() from any website can POST to localhost without a preflight, but
+        the browser always names the page's origin, and a rebound name shows in Host.
+        """
+        origin = self.headers.get('Origin')
+        if origin is not None and urlparse(origin).hostname not in LOOPBACK_NAMES:
+            return True
+        host = self.headers.get('Host')
+        return host is not None and urlparse(f"//{host}").hostname not in LOOPBACK_NAMES
+
+    def _handle(self, read_body):
+        channel = self.server.channel
+        if self._foreign():
+            self._reply(403, {'error': "Only local clients may use the control API"})
+            return
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        command = dict(parse_qsl(url.query))
+        try:
+            if read_body:
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    body = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+                    if isinstance(body, list):
+                        body = {'cmd': 'batch', 'commands': body}
+                    if not isinstance(body, dict):
+                        raise ValueError("Expected a JSON object or a list of commands")
+                    command.update(body)
+        except Exception as e:
+            self._reply(400, {'error': f"Bad request body: {e}"})
+            return
+
+        if parts == ['latency']:
+            self._reply(200, channel.latency_stats())
+            return
+        if parts == ['metrics']:
+            body = metrics.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not parts or parts == ['state']:
+            command['cmd'] = 'state'
+        elif not read_body:
+            self._reply(405, {'error': "Use POST for commands"})
+            return
+        elif parts == ['batch']:
+            command['cmd'] = 'batch'
+        elif len(parts) == 3 and parts[0] == 'countdowns':
+            command['countdown'], command['cmd'] = parts[1], parts[2]
+        elif parts != ['command']:
+            command['cmd'] = parts[-1]
+
+        try:
+            pending = channel.submit(command)
+        except TimeoutError as e:
+            self._reply(504, {'error': str(e)})
+            return
+        if pending.error:
+            self._reply(400, {'error': pending.error, 'latency_ms': pending.latency_ms()})
+        else:
+            self._reply(200, {'ok': True, 'state': pending.result, 'latency_ms': pending.latency_ms()})
+
+
+class ControlServer:
+    """Loopback-only HTTP control API in a background thread."""
+
+    def __init__(self, channel, port, host=CONTROL_HOST):
+        self.httpd = ThreadingHTTPServer((host, port), ControlRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.channel = channel
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="control-api", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def start_control_server(channel, port):
+    """Start the control API if a port is configured; errors are reported, not raised."""
+    if not port:
+        return None
+    try:
+        return ControlServer(channel, int(port)).start()
+    except Exception as e:
+        log.error("Failed to start control API on port %s: %s", port, e)
+        return None
+
+
+# -------------------------
+# Control socket (persistent newline-delimited JSON)
+# -------------------------
+class ControlSocketHandler(socketserver.StreamRequestHandler):
+    """One JSON value per line: a command object, a list of commands, or {"cmd": "batch", "commands": [...]}.
+
+    Each line is answered with one JSON line; a list is applied as a single batch.
+    """
+
+    def handle(self):
+        channel = self.server.channel
+        for raw in self.rfile:
+            line = raw.decode('utf-8', 'replace').strip()
+            if not line:
+                continue
+            try:
+                pending = channel.submit(parse_command(line))
+                if pending.error:
+                    reply = {'error': pending.error, 'latency_ms': pending.latency_ms()}
+                else:
+                    reply = {'ok': True, 'state': pending.result, 'latency_ms': pending.latency_ms()}
+            except Exception as e:
+                reply = {'error': str(e)}
+            try:
+                self.wfile.write((json.dumps(reply) + '\n').encode('utf-8'))
+                self.wfile.flush()
+            except Exception:
+                return
+
+
+class ControlSocketServer:
+    """Persistent local command socket: a Unix socket path, or 'tcp:PORT' on loopback (e.g. on Windows)."""
+
+    def __init__(self, channel, address):
+        address = str(address)
+        if address.startswith('tcp:'):
+            self.server = socketserver.ThreadingTCPServer((CONTROL_HOST, int(address[4:])), ControlSocketHandler)
+            self.path = None
+        else:
+            if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+                raise OSError("Unix sockets are not available here; use tcp:PORT")
+            # remove a stale socket file left by a previous run, but never anything else at that path
+            try:
+                mode = os.lstat(address).st_mode
+            except FileNotFoundError:
+                mode = None
+            if mode is not None:
+                if not stat.S_ISSOCK(mode):
+                    raise OSError(f"{address} exists and is not a socket")
+                os.remove(address)
+            self.server = socketserver.ThreadingUnixStreamServer(address, ControlSocketHandler)
+            self.path = address
+        self.server.daemon_threads = True
+        self.server.channel = channel
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="control-socket", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.path:
+            try:
+                os.remove(self.path)
+            except Exception:
+                pass
+
+
+def start_control_socket(channel, address):
+    if not address:
+        return None
+    try:
+        return ControlSocketServer(channel, address).start()
+    except Exception as e:
+        log.error("Failed to open control socket %s: %s", address, e)
+        return None
+
+
+# -------------------------
+# Main-loop watchdog
+# -------------------------
+WATCHDOG_STALL_SECONDS = 2.0
+LOOP_STALLS = metrics.counter('rlc_loop_stalls_total', "Times the tick loop stopped beating for longer than the stall threshold")
+
+
+class LoopWatchdog:
+    """Daemon thread that watches the tick loop's heartbeat.
+
+    The loop calls beat() every tick. If no beat arrives for `threshold` seconds the loop's
+    current stack is logged (via sys._current_frames) and on_stall() runs on the watchdog
+    thread; on_recover() runs once beats resume.
+    """
+
+    def __init__(self, threshold=WATCHDOG_STALL_SECONDS, on_stall=None, on_recover=None, thread=None):
+        self.threshold = float(threshold)
+        self.on_stall = on_stall
+        self.on_recover = on_recover
+        self.thread_id = (thread or threading.current_thread()).ident
+        self.last_beat = time.monotonic()
+        self.stalled_since = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="loop-watchdog", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def beat(self):
+        self.last_beat = time.monotonic()
+
+    def stack(self):
+        frame = sys._current_frames().get(self.thread_id)
+        return ''.join(traceback.format_stack(frame)) if frame is not None else '(thread not running)'
+
+    def _run(self):
+        interval = min(0.5, self.threshold / 4)
+        while not self._stop.wait(interval):
+            gap = time.monotonic() - self.last_beat
+            if self.stalled_since is None and gap > self.threshold:
+                self.stalled_since = self.last_beat
+                LOOP_STALLS.inc()
+                log.error("Main loop stalled for %.1f s; it is at:\n%s", gap, self.stack(),
+                          extra={'fields': {'stall_seconds': round(gap, 3)}})
+                self._call(self.on_stall)
+            elif self.stalled_since is not None and self.last_beat > self.stalled_since:
+                log.warning("Main loop recovered after %.1f s", self.last_beat - self.stalled_since)
+                self.stalled_since = None
+                self._call(self.on_recover)
+
+    def _call(self, callback):
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            log.error("Watchdog callback failed: %s", e)
+
+
+def start_watchdog(engine, tick_seconds, settings=None):
+    """Watch the calling thread's loop; the threshold never drops below three tick intervals. 0 disables."""
+    s = settings if settings is not None else load_settings()
+    threshold = float(s.get('watchdog_stall_seconds', WATCHDOG_STALL_SECONDS) or 0)
+    if threshold <= 0:
+        return None
+    # the stale state goes through the output pipeline; the next tick's state replaces it
+    return LoopWatchdog(max(threshold, 3 * tick_seconds), on_stall=engine.publish_stale).start()
+
+
+# -------------------------
+# Headless mode
+# -------------------------
+def _read_commands(stream, channel):
+    for line in stream:
+        try:
+            command = parse_command(line)
+            if not command:
+                continue
+            pending = channel.submit(command)
+            reply = {'error': pending.error} if pending.error else pending.result
+        except Exception as e:
+            reply = {'error': f"Bad command: {e}"}
+        print(json.dumps(reply), flush=True)
+
+
+def run_headless(options, replayer=None):
+    """Run the countdown engine, Go/No-Go poller and HTML writers without any UI.
+
+    Operator commands are read as lines on stdin (see parse_command), each answering with
+    the resulting state as a JSON line on stdout, and from the control API if enabled.
+    """
+    engine = CountdownEngine(replayer=replayer, replication=replication_config(options))
+    channel = CommandChannel()
+    settings = load_settings()
+    server = start_control_server(channel, options.api_port or settings.get('control_api_port'))
+    socket_server = start_control_socket(channel, options.control_socket or settings.get('control_socket'))
+    metrics_server = start_metrics_server(options.metrics_port or settings.get('metrics_port'))
+    watchdog = start_watchdog(engine, max(1, options.tick_ms) / 1000.0, settings)
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(sig, lambda *_: stop.set())
+        except Exception:
+            pass
+    if sys.stdin is not None and not sys.stdin.closed:
+        threading.Thread(target=_read_commands, args=(sys.stdin, channel), name="headless-stdin", daemon=True).start()
+    if replayer is None:
+        engine.warm_start(restore=settings.get('warm_start', True))
+    # optional start from the command line
+    try:
+        if options.mission:
+            engine.execute({'cmd': 'mission', 'name': options.mission})
+        if options.start_at:
+            engine.execute({'cmd': 'start', 'at': options.start_at})
+        elif options.start is not None:
+            engine.execute({'cmd': 'start', 'seconds': options.start})
+    except Exception as e:
+        print(json.dumps({'error': str(e)}), flush=True)
+
+    interval = max(1, options.tick_ms) / 1000.0
+    due = next_tick = time.monotonic()
+    while not stop.is_set():
+        started = time.monotonic()
+        TICK_LATENESS_SECONDS.observe(max(0.0, started - due))
+        if watchdog is not None:
+            watchdog.beat()
+        clock.on_tick()
+        try:
+            engine.tick()
+        except Exception as e:
+            log.exception("Tick failed: %s", e)
+        TICK_SECONDS.observe(time.monotonic() - started)
+        # schedule against the monotonic clock so slow ticks don't accumulate drift
+        next_tick += interval
+        # lateness is measured against the original slot, before catching up
+        due = next_tick
+        if next_tick < time.monotonic():
+            next_tick = time.monotonic()
+        # run commands as soon as they arrive while waiting for the next tick; when ticks
+        # overrun there is no wait, so still run whatever is queued once per tick
+        channel.process(engine.execute)
+        while not stop.is_set():
+            remaining = next_tick - time.monotonic()
+            if remaining <= 0:
+                break
+            channel.process(engine.execute, timeout=min(remaining, 0.5))
+    for srv in (server, socket_server):
+        if srv is not None:
+            srv.stop()
+    if metrics_server is not None:
+        metrics_server.shutdown()
+    if watchdog is not None:
+        watchdog.stop()
+    engine.close()
+    timeline.close()
 
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<style>
-body {{
-    margin: 0;
-    background-color: {bg};
-    color: {text};
-    font-family: {font};
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    height: 100vh;
-}}
-#gonogo {{
-    display: flex;
-    gap: 40px;
-}}
-.status-box {{
-    border: 2px solid {gn_border};
-    padding: 20px 40px;
-    font-size: {gn_px}px;
-    text-align: center;
-    background-color: {gn_bg};
-}}
-.go {{ color: {gn_go}; }}
-.nogo {{ color: {gn_nogo}; }}
-</style>
-<script>
-setTimeout(() => location.reload(), 5000);
-</script>
-</head>
-<body>
-    <div id="gonogo">
-    <div class="status-box {'go' if n0=='GO' else 'nogo'}">Range: {disp0}</div>
-    <div class="status-box {'go' if n2=='GO' else 'nogo'}">Vehicle: {disp2}</div>
-    <div class="status-box {'go' if n1=='GO' else 'nogo'}">Weather: {disp1}</div>
-</div>
-</body>
-</html>"""
-    with open(GONOGO_HTML, "w", encoding="utf-8") as f:
-        f.write(html)
 
 # -------------------------
 # Countdown App
 # -------------------------
+TICK_MS = 200
+# how often the Tk loop checks for control API commands
+COMMAND_POLL_MS = 10
+
+# GUI presets for the appearance modes; saved into settings when a mode is chosen
+APPEARANCE_PRESETS = {
+    'dark': {
+        'bg_color': '#000000', 'text_color': '#FFFFFF', 'gn_bg_color': '#111111',
+        'gn_border_color': '#FFFFFF', 'gn_go_color': '#00FF00', 'gn_nogo_color': '#FF0000',
+        'font_family': 'Consolas', 'mission_font_px': 24, 'timer_font_px': 80, 'gn_font_px': 20
+    },
+    'light': {
+        'bg_color': '#FFFFFF', 'text_color': '#000000', 'gn_bg_color': '#EEEEEE',
+        'gn_border_color': '#333333', 'gn_go_color': '#008800', 'gn_nogo_color': '#AA0000',
+        'font_family': 'Consolas', 'mission_font_px': 24, 'timer_font_px': 80, 'gn_font_px': 20
+    }
+}
+
+
+class FontRegistry:
+    """Shared tkinter Font objects, so Tk resolves each font once instead of on every config call.
+
+    font() returns one Font per (family, size, weight). named() returns a font owned by a
+    role (timer, GN labels, ...) that is reconfigured in place when the appearance changes,
+    which re-renders every widget using it in one step.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self._fonts = {}
+        self._named = {}
+
+    def font(self, family, size, weight='normal'):
+        key = (family, int(size), weight)
+        f = self._fonts.get(key)
+        if f is None:
+            f = tkfont.Font(root=self.root, family=family, size=int(size), weight=weight)
+            self._fonts[key] = f
+        return f
+
+    def named(self, role, family, size, weight='normal'):
+        spec = (family, int(size), weight)
+        entry = self._named.get(role)
+        if entry is None:
+            f = tkfont.Font(root=self.root, family=family, size=int(size), weight=weight)
+            self._named[role] = (f, spec)
+            return f
+        f, current = entry
+        if current != spec:
+            f.configure(family=family, size=int(size), weight=weight)
+            self._named[role] = (f, spec)
+        return f
+
+
+class Theme:
+    """Appearance settings compiled once per change into ready-to-apply Tk option dicts.
+
+    Options are keyed on (Tk widget class, role); a role picks out widgets with special
+    styling (timer, footer, GN labels, scrub button) and falls back to the class default.
+    """
+
+    def __init__(self, settings=None, fonts=None):
+        s = dict(load_settings() if settings is None else settings)
+        self.mode = s.get('appearance_mode', 'dark')
+        s.update(APPEARANCE_PRESETS.get(self.mode, {}))
+        dark = self.mode == 'dark'
+        self.bg = s.get('bg_color', '#000000')
+        self.text = s.get('text_color', '#FFFFFF')
+        self.font_family = s.get('font_family', 'Consolas')
+        self.gn_go = s.get('gn_go_color', '#00FF00')
+        self.gn_nogo = s.get('gn_nogo_color', '#FF0000')
+        # with a FontRegistry the fonts are shared Font objects updated in place; otherwise plain tuples
+        def role_font(role, size, weight='normal'):
+            if fonts is not None:
+                return fonts.named(role, self.font_family, size, weight)
+            return (self.font_family, int(size), weight)
+        self.title_font = role_font('title', 20)
+        self.gn_font = role_font('gn', s.get('gn_font_px', 28))
+        self.timer_font = role_font('timer', s.get('timer_font_px', 100), 'bold')
+        # buttons and the footer invert the window colors
+        self.btn_bg, self.btn_fg = ('#FFFFFF', '#000000') if dark else ('#000000', '#FFFFFF')
+        self.footer_bg, self.footer_fg = self.btn_bg, self.btn_fg
+        # entries should contrast with the window background
+        self.entry_bg, self.entry_fg = ('#222222', self.text) if dark else ('#b4b4b4', '#000000')
+
+        bg, text = self.bg, self.text
+        self.options = {
+            ('Toplevel', None): {'bg': bg},
+            ('Frame', None): {'bg': bg},
+            ('Labelframe', None): {'bg': bg},
+            ('Label', None): {'bg': bg, 'fg': text},
+            ('Label', 'title'): {'bg': bg, 'fg': text, 'font': self.title_font},
+            ('Label', 'timer'): {'bg': bg, 'fg': text, 'font': self.timer_font},
+            # GN label fg depends on the status and is set by update_gn_labels
+            ('Label', 'gn'): {'bg': bg, 'font': self.gn_font},
+            ('Label', 'footer'): {'bg': self.footer_bg, 'fg': self.footer_fg},
+            ('Entry', None): {'bg': self.entry_bg, 'fg': self.entry_fg, 'insertbackground': self.entry_fg},
+            ('Menubutton', None): {'bg': self.btn_bg, 'fg': self.btn_fg, 'activebackground': '#555'},
+            # selectcolor is the indicator background; match the overall bg for neatness
+            ('Radiobutton', None): {'bg': bg, 'fg': text, 'selectcolor': bg, 'activebackground': bg},
+            ('Checkbutton', None): {'bg': bg, 'fg': text, 'selectcolor': bg, 'activebackground': bg},
+            ('Button', None): {'bg': self.btn_bg, 'fg': self.btn_fg, 'activebackground': '#555'},
+            # keep the scrub button's red text
+            ('Button', 'scrub'): {'bg': self.btn_bg, 'activebackground': '#555'},
+        }
+
+    def options_for(self, widget_class, role=None):
+        if role is not None and (widget_class, role) in self.options:
+            return self.options[(widget_class, role)]
+        return self.options.get((widget_class, None))
+
+    def apply(self, widget, roles=None):
+        """Theme every descendant of `widget` in one walk; `roles` maps widget path names to roles."""
+        roles = roles or {}
+        stack = list(widget.winfo_children())
+        while stack:
+            child = stack.pop()
+            try:
+                opts = self.options_for(child.winfo_class(), roles.get(str(child)))
+                if opts:
+                    child.config(**opts)
+            except Exception:
+                pass
+            try:
+                stack.extend(child.winfo_children())
+            except Exception:
+                pass
+
+
+class WidgetView:
+    """Remembers the options last applied to each widget and only passes changed ones on to Tk.
+
+    Anything that configures a widget behind the view's back (e.g. a theming pass) must
+    call invalidate() so the next update re-applies everything.
+    """
+
+    def __init__(self):
+        self._applied = {}
+
+    def config(self, widget, **options):
+        cache = self._applied.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if k not in cache or cache[k] != v}
+        if changed:
+            widget.config(**changed)
+            cache.update(changed)
+        return changed
+
+    def invalidate(self, widget=None):
+        if widget is None:
+            self._applied.clear()
+        else:
+            self._applied.pop(widget, None)
+
+
 class CountdownApp:
-    def __init__(self, root):
+    def __init__(self, root, replayer=None, tick_ms=TICK_MS, control_port=None, control_socket=None, metrics_port=None,
+                 replication=None):
+        load_tk()
         self.root = root
+        self.tick_ms = tick_ms
         self.root.title(f"RocketLaunchCountdown {appVersion}")
         self.root.config(bg="black")
         self.root.attributes("-topmost", True)
         self.root.geometry("800x615")
 
-        # State
-        self.running = False
-        self.on_hold = False
-        self.scrubbed = False
-        self.counting_up = False
-        self.target_time = None
-        self.hold_start_time = None
-        self.remaining_time = 0
-        self.mission_name = "Placeholder Mission"
-        # fetch_gonogo() returns [Range, Weather, Vehicle] to match gonogo.html writer
-        self.gonogo_values = fetch_gonogo()
-        self.last_gonogo_update = time.time()
+        # State: the engine owns every countdown and the Go/No-Go poll; the controls drive the selected countdown
+        self.engine = CountdownEngine(replayer=replayer, replication=replication)
+        self.scheduler = self.engine.scheduler
+        self.countdown = self.scheduler.get(PRIMARY_COUNTDOWN)
+        self._showing_resume = False
+        # diffing layer for per-tick widget updates, and the GN label style it applies
+        self.view = WidgetView()
+        self.fonts = FontRegistry(root)
+        self.theme = Theme(fonts=self.fonts)
+        entry_font = self.fonts.font("Arial", 18)
+        button_font = self.fonts.font("Arial", 14)
+        # last known state comes back from the snapshot; the first live Go/No-Go fetch runs in the background
+        if replayer is None:
+            self.engine.warm_start(restore=load_settings().get('warm_start', True))
+        else:
+            # the replayer answers from memory, so there is nothing to wait for
+            self.gonogo_values = self.engine.gonogo_source()
+            self.engine.last_gonogo_update = clock.time()
 
         # Title
-        self.titletext = tk.Label(root, text=f"RocketLaunchCountdown {appVersion}", font=("Consolas", 24), fg="white", bg="black")
+        self.titletext = tk.Label(root, text=f"RocketLaunchCountdown {appVersion}", font=self.theme.title_font, fg="white", bg="black")
         self.titletext.pack(pady=(10, 0))
 
         # Display
-        self.text = tk.Label(root, text="T-00:00:00", font=("Consolas", 80, "bold"), fg="white", bg="black")
+        self.text = tk.Label(root, text="T-00:00:00", font=self.theme.timer_font, fg="white", bg="black")
         self.text.pack(pady=(0, 5))
 
+        # Latest scripted milestone callout
+        self.milestone_label = tk.Label(root, text="", font=self.fonts.font("Consolas", 16), fg="white", bg="black")
+        self.milestone_label.pack(pady=(0, 5))
+
         # Mission name input
         frame_top = tk.Frame(root, bg="black")
         frame_top.pack(pady=5)
         tk.Label(frame_top, text="Mission Name:", fg="white", bg="black").pack(side="left")
-        self.mission_entry = tk.Entry(frame_top, width=20, font=("Arial", 18))
-        self.mission_entry.insert(0, self.mission_name)
+        self.mission_entry = tk.Entry(frame_top, width=20, font=entry_font)
+        self.mission_entry.insert(0, self.countdown.mission_name)
         self.mission_entry.pack(side="left")
 
+        # Countdown selector: controls and the main display follow the selected countdown
+        self.countdown_var = tk.StringVar(value=PRIMARY_COUNTDOWN)
+        self.countdown_menu = tk.OptionMenu(frame_top, self.countdown_var, *self.scheduler.names())
+        self.countdown_menu.pack(side="left", padx=(8, 2))
+        self._rebuild_countdown_menu()
+        self.add_countdown_btn = tk.Button(frame_top, text="+", width=2, command=self.add_countdown)
+        self.add_countdown_btn.pack(side="left", padx=1)
+        self.remove_countdown_btn = tk.Button(frame_top, text="−", width=2, command=self.remove_countdown)
+        self.remove_countdown_btn.pack(side="left", padx=1)
+
         # Mode toggle
         frame_mode = tk.Frame(root, bg="black")
         frame_mode.pack(pady=5)
@@ -345,15 +4389,15 @@ class CountdownApp:
         frame_duration = tk.Frame(root, bg="black")
         frame_duration.pack(pady=5)
         tk.Label(frame_duration, text="H", fg="white", bg="black").pack(side="left")
-        self.hours_entry = tk.Entry(frame_duration, width=3, font=("Arial", 18))
+        self.hours_entry = tk.Entry(frame_duration, width=3, font=entry_font)
         self.hours_entry.insert(0, "0")
         self.hours_entry.pack(side="left", padx=2)
         tk.Label(frame_duration, text="M", fg="white", bg="black").pack(side="left")
-        self.minutes_entry = tk.Entry(frame_duration, width=3, font=("Arial", 18))
+        self.minutes_entry = tk.Entry(frame_duration, width=3, font=entry_font)
         self.minutes_entry.insert(0, "5")
         self.minutes_entry.pack(side="left", padx=2)
         tk.Label(frame_duration, text="S", fg="white", bg="black").pack(side="left")
-        self.seconds_entry = tk.Entry(frame_duration, width=3, font=("Arial", 18))
+        self.seconds_entry = tk.Entry(frame_duration, width=3, font=entry_font)
         self.seconds_entry.insert(0, "0")
         self.seconds_entry.pack(side="left", padx=2)
 
@@ -361,15 +4405,15 @@ class CountdownApp:
         frame_clock = tk.Frame(root, bg="black")
         frame_clock.pack(pady=5)
         tk.Label(frame_clock, text="Clock (HH:MM:SS)", fg="white", bg="black").pack(side="left")
-        self.clock_hours_entry = tk.Entry(frame_clock, width=3, font=("Arial", 18), fg='white', bg='#111', insertbackground='white')
+        self.clock_hours_entry = tk.Entry(frame_clock, width=3, font=entry_font, fg='white', bg='#111', insertbackground='white')
         self.clock_hours_entry.insert(0, "14")
         self.clock_hours_entry.pack(side="left", padx=2)
         tk.Label(frame_clock, text=":", fg="white", bg="black").pack(side="left")
-        self.clock_minutes_entry = tk.Entry(frame_clock, width=3, font=("Arial", 18), fg='white', bg='#111', insertbackground='white')
+        self.clock_minutes_entry = tk.Entry(frame_clock, width=3, font=entry_font, fg='white', bg='#111', insertbackground='white')
         self.clock_minutes_entry.insert(0, "00")
         self.clock_minutes_entry.pack(side="left", padx=2)
         tk.Label(frame_clock, text=":", fg="white", bg="black").pack(side="left")
-        self.clock_seconds_entry = tk.Entry(frame_clock, width=3, font=("Arial", 18), fg='white', bg='#111', insertbackground='white')
+        self.clock_seconds_entry = tk.Entry(frame_clock, width=3, font=entry_font, fg='white', bg='#111', insertbackground='white')
         self.clock_seconds_entry.insert(0, "00")
         self.clock_seconds_entry.pack(side="left", padx=2)
 
@@ -377,24 +4421,24 @@ class CountdownApp:
         frame_buttons = tk.Frame(root, bg="black")
         frame_buttons.pack(pady=10)
 
-        self.start_btn = tk.Button(frame_buttons, text="▶ Start", command=self.start, font=("Arial", 14))
+        self.start_btn = tk.Button(frame_buttons, text="▶ Start", command=self.start, font=button_font)
         self.start_btn.grid(row=0, column=0, padx=5)
 
         # Hold and resume share the same position
-        self.hold_btn = tk.Button(frame_buttons, text="⏸ Hold", command=self.hold, font=("Arial", 14))
+        self.hold_btn = tk.Button(frame_buttons, text="⏸ Hold", command=self.hold, font=button_font)
         self.hold_btn.grid(row=0, column=1, padx=5)
 
-        self.resume_btn = tk.Button(frame_buttons, text="⏵ Resume", command=self.resume, font=("Arial", 14))
+        self.resume_btn = tk.Button(frame_buttons, text="⏵ Resume", command=self.resume, font=button_font)
         self.resume_btn.grid(row=0, column=1, padx=5)
         self.resume_btn.grid_remove()  # hidden at start
 
-        self.scrub_btn = tk.Button(frame_buttons, text="🚫 Scrub", command=self.scrub, font=("Arial", 14), fg="red")
+        self.scrub_btn = tk.Button(frame_buttons, text="🚫 Scrub", command=self.scrub, font=button_font, fg="red")
         self.scrub_btn.grid(row=0, column=2, padx=5)
 
-        self.reset_btn = tk.Button(frame_buttons, text="⟳ Reset", command=self.reset, font=("Arial", 14))
+        self.reset_btn = tk.Button(frame_buttons, text="⟳ Reset", command=self.reset, font=button_font)
         self.reset_btn.grid(row=0, column=3, padx=5)
         # Settings button moved next to control buttons (match size/style)
-        self.settings_btn = tk.Button(frame_buttons, text="Settings", command=self.show_settings_window, font=("Arial", 14), width=10)
+        self.settings_btn = tk.Button(frame_buttons, text="Settings", command=self.show_settings_window, font=button_font, width=10)
         self.settings_btn.grid(row=0, column=4, padx=6)
 
         # Note: gonogo mode switching remains in Settings; manual buttons appear when mode == 'buttons'
@@ -419,11 +4463,11 @@ class CountdownApp:
         frame_gn = tk.Frame(root, bg="black")
         frame_gn.pack(pady=10)
         # Labels displayed: Range, Weather, Vehicle — match write_gonogo_html ordering
-        self.range_label = tk.Label(frame_gn, text="RANGE: N/A", font=("Consolas", 20), fg="white", bg="black")
+        self.range_label = tk.Label(frame_gn, text="RANGE: N/A", font=self.theme.gn_font, fg="white", bg="black")
         self.range_label.pack()
-        self.weather_label = tk.Label(frame_gn, text="WEATHER: N/A", font=("Consolas", 20), fg="white", bg="black")
+        self.weather_label = tk.Label(frame_gn, text="WEATHER: N/A", font=self.theme.gn_font, fg="white", bg="black")
         self.weather_label.pack()
-        self.vehicle_label = tk.Label(frame_gn, text="VEHICLE: N/A", font=("Consolas", 20), fg="white", bg="black")
+        self.vehicle_label = tk.Label(frame_gn, text="VEHICLE: N/A", font=self.theme.gn_font, fg="white", bg="black")
         self.vehicle_label.pack()
 
         # Footer
@@ -433,7 +4477,7 @@ class CountdownApp:
         self.footer_label = tk.Label(
             footer_frame,
             text="Made by HamsterSpaceNerd3000",  # or whatever you want
-            font=("Consolas", 12),
+            font=self.fonts.font("Consolas", 12),
             fg="black",
             bg="white"
         )
@@ -446,7 +4490,17 @@ class CountdownApp:
             self.apply_appearance_settings()
         except Exception:
             pass
+        self.watchdog = start_watchdog(self.engine, self.tick_ms / 1000.0)
         self.update_clock()
+        # idle callbacks run in order, so this fires once the window has been drawn
+        self.root.after_idle(startup.mark, 'first_paint')
+
+        # Control API: HTTP threads queue commands; they are run here on the Tk thread
+        self.commands = CommandChannel()
+        self.control_server = start_control_server(self.commands, control_port)
+        self.control_socket = start_control_socket(self.commands, control_socket)
+        self.metrics_server = start_metrics_server(metrics_port)
+        self._process_commands()
 
     # ----------------------------
     # Settings window
@@ -458,12 +4512,9 @@ class CountdownApp:
         win.title("Settings")
         win.geometry("560x275")
         # apply current appearance mode so the settings window matches the main UI
-        s_local = load_settings()
-        mode_local = s_local.get('appearance_mode', 'dark')
-        if mode_local == 'dark':
-            win_bg = '#000000'; win_text = '#FFFFFF'; btn_bg = '#FFFFFF'; btn_fg = '#000000'
-        else:
-            win_bg = '#FFFFFF'; win_text = '#000000'; btn_bg = '#000000'; btn_fg = '#FFFFFF'
+        theme = self.theme
+        mode_local = theme.mode
+        win_bg, win_text, btn_bg, btn_fg = theme.bg, theme.text, theme.btn_bg, theme.btn_fg
         win.config(bg=win_bg)
         # set per-window widget defaults so nested widgets inherit the chosen theme
         try:
@@ -582,6 +4633,11 @@ class CountdownApp:
         frame_appearance_btn = tk.Frame(win, bg=win_bg)
         frame_appearance_btn.pack(fill='x', padx=8, pady=6)
         tk.Button(frame_appearance_btn, text='Appearance...', command=lambda: self.show_appearance_window(), fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='left')
+        tk.Button(frame_appearance_btn, text='Export timeline...', command=self.export_timeline, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='left', padx=6)
+        tk.Button(frame_appearance_btn, text='Metrics...', command=self.show_metrics_window, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='left')
+        tk.Button(frame_appearance_btn, text='Log...', command=self.show_log_window, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='left', padx=6)
+        if profiler.enabled:
+            tk.Button(frame_appearance_btn, text='Capture profile (10 s)', command=self.capture_profile, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='left', padx=6)
 
         # Timezone selector
         tz_frame = tk.Frame(frame_sheet, bg=win_bg)
@@ -605,13 +4661,13 @@ class CountdownApp:
         # helper to set manual and update UI from main app
         def set_manual_and_update(val_type, val):
             set_manual(val_type, val)
-            # update labels and write html
-            self.gonogo_values = fetch_gonogo()
+            # update labels and write html; the engine's source never blocks with the process fetcher
+            self.engine.poll_gonogo()
             # update GUI labels immediately
             self.range_label.config(text=f"RANGE: {self.gonogo_values[0]}", fg=get_status_color(self.gonogo_values[0]))
             self.weather_label.config(text=f"WEATHER: {self.gonogo_values[1]}", fg=get_status_color(self.gonogo_values[1]))
             self.vehicle_label.config(text=f"VEHICLE: {self.gonogo_values[2]}", fg=get_status_color(self.gonogo_values[2]))
-            write_gonogo_html(self.gonogo_values)
+            self.engine.publish_outputs()
 
         # Save/Cancel
         def cell_to_rc(cell_str):
@@ -649,7 +4705,9 @@ class CountdownApp:
                 v_row = DEFAULT_SETTINGS['vehicle_row']
             # determine column to use (prefer range column, else weather, else vehicle, else default)
             col_val = r_col or w_col or v_col or DEFAULT_SETTINGS['column']
-            new_settings = {
+            # start from the saved settings so keys edited elsewhere (HTML appearance, API port, ...) survive
+            new_settings = dict(settings)
+            new_settings.update({
                 'mode': mode_var.get(),
                 'sheet_link': sheet_entry.get().strip() or SHEET_LINK,
                 'range_row': int(r_row),
@@ -676,16 +4734,16 @@ class CountdownApp:
                 'mission_font_px': int(settings.get('mission_font_px', 48)),
                 'timer_font_px': int(settings.get('timer_font_px', 120)),
                 'gn_font_px': int(settings.get('gn_font_px', 28))
-            }
+            })
             # preserve the appearance_mode so saving Settings doesn't accidentally remove it
             try:
                 new_settings['appearance_mode'] = settings.get('appearance_mode', DEFAULT_SETTINGS.get('appearance_mode', 'dark'))
             except Exception:
                 new_settings['appearance_mode'] = DEFAULT_SETTINGS.get('appearance_mode', 'dark')
             save_settings(new_settings)
-            # update immediately
-            self.gonogo_values = fetch_gonogo()
-            write_gonogo_html(self.gonogo_values)
+            # the next tick fetches with the new settings, off the Tk thread like every other sheet poll
+            self.engine.last_gonogo_update = 0.0
+            self.engine.publish_outputs()
             # update manual visibility in main UI
             self.update_manual_visibility()
             # appearance changes are applied only from the Appearance window
@@ -698,9 +4756,9 @@ class CountdownApp:
         btn_frame.pack(fill='x', pady=8)
         tk.Button(btn_frame, text='Save', command=on_save, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='right', padx=8)
         tk.Button(btn_frame, text='Cancel', command=on_cancel, fg=btn_fg, bg=btn_bg, activebackground='#444').pack(side='right')
-        # ensure the new toplevel gets recursively themed like the main window
+        # ensure the new toplevel gets themed like the main window
         try:
-            self._theme_recursive(win, win_bg, win_text, btn_bg, btn_fg)
+            theme.apply(win)
         except Exception:
             pass
 
@@ -727,33 +4785,115 @@ class CountdownApp:
     # ----------------------------
     # Manual controls & helpers
     # ----------------------------
+    @property
+    def gonogo_values(self):
+        return self.engine.gonogo_values
+
+    @gonogo_values.setter
+    def gonogo_values(self, values):
+        self.engine.gonogo_values = list(values)
+
     def set_manual(self, which, val):
-        # normalize
-        v = (val or '').strip().upper()
-        if which == 'range':
-            fetch_gonogo.manual_range = v
-        elif which == 'weather':
-            fetch_gonogo.manual_weather = v
-        elif which == 'vehicle':
-            fetch_gonogo.manual_vehicle = v
-        # update GUI and HTML
-        self.gonogo_values = fetch_gonogo()
-        try:
-            self.range_label.config(text=f"RANGE: {self.gonogo_values[0]}", fg=get_status_color(self.gonogo_values[0]))
-            self.weather_label.config(text=f"WEATHER: {self.gonogo_values[1]}", fg=get_status_color(self.gonogo_values[1]))
-            self.vehicle_label.config(text=f"VEHICLE: {self.gonogo_values[2]}", fg=get_status_color(self.gonogo_values[2]))
-        except Exception:
-            pass
-        write_gonogo_html(self.gonogo_values)
-        # persist manual values immediately so they survive restarts
+        # sets, logs, persists and writes gonogo.html, then refreshes the labels
+        self.run_command({'cmd': 'set_manual', 'which': which, 'value': val})
+
+    def export_timeline(self):
+        """Ask for a destination and export the event timeline as CSV."""
+        path = filedialog.asksaveasfilename(parent=getattr(self, 'settings_win', None) or self.root,
+                                            defaultextension='.csv', initialdir=app_folder,
+                                            initialfile='timeline.csv', filetypes=[('CSV', '*.csv')])
+        if not path:
+            return
         try:
+            timeline.flush()
+            export_timeline_csv(path)
+        except Exception as e:
+            log.error("Failed to export timeline: %s", e)
+
+    def capture_profile(self, seconds=10.0):
+        """Run cProfile over the Tk loop for `seconds`; the dump and a readable summary land in the app folder."""
+        # the engine tick ends the window, so it always closes on the Tk thread that started it
+        profiler.start_capture(seconds)
+
+    def show_log_window(self):
+        """Log viewer over the in-memory ring buffer; the level chosen here is also saved as log_level."""
+        if getattr(self, 'log_win', None) is not None and self.log_win.winfo_exists():
+            self.log_win.lift()
+            return
+        win = self.log_win = tk.Toplevel(self.root)
+        win.title("Log")
+        win.config(bg="black")
+        top = tk.Frame(win, bg="black")
+        top.pack(fill='x', padx=6, pady=(6, 0))
+        tk.Label(top, text="Level:", fg="white", bg="black").pack(side='left')
+        level_var = tk.StringVar(value=logging.getLevelName(log.level))
+
+        def set_level(value):
+            if _log_listener is not None:
+                setup_logging(value)
+            else:
+                log.setLevel(value)
             s = load_settings()
-            s['manual_range'] = getattr(fetch_gonogo, 'manual_range', s.get('manual_range'))
-            s['manual_weather'] = getattr(fetch_gonogo, 'manual_weather', s.get('manual_weather'))
-            s['manual_vehicle'] = getattr(fetch_gonogo, 'manual_vehicle', s.get('manual_vehicle'))
+            s['log_level'] = value
             save_settings(s)
-        except Exception:
-            pass
+            refresh(reschedule=False)
+
+        tk.OptionMenu(top, level_var, *LOG_LEVELS, command=set_level).pack(side='left', padx=4)
+        tk.Label(top, text=LOG_FILE, fg="#888", bg="black").pack(side='left', padx=8)
+        text = tk.Text(win, width=120, height=28, bg="black", fg="white", font=self.fonts.font("Consolas", 10))
+        text.pack(fill='both', expand=True, padx=6, pady=6)
+        colors = {'ERROR': '#FF5555', 'CRITICAL': '#FF5555', 'WARNING': '#FFCC00', 'DEBUG': '#888888'}
+        for name, color in colors.items():
+            text.tag_configure(name, foreground=color)
+        shown = {'last': None}
+
+        def refresh(reschedule=True):
+            if not win.winfo_exists():
+                return
+            records = log_buffer.entries(logging.getLevelName(level_var.get()))[-500:]
+            last = records[-1] if records else None
+            # only redraw when something new arrived, so scrolling back isn't interrupted
+            if last is not shown['last'] or not reschedule:
+                shown['last'] = last
+                text.config(state='normal')
+                text.delete('1.0', tk.END)
+                for r in records:
+                    stamp = datetime.fromtimestamp(r.created).strftime('%H:%M:%S')
+                    text.insert(tk.END, f"{stamp} {format_log_line(r)}\n", r.levelname)
+                text.see(tk.END)
+                text.config(state='disabled')
+            if reschedule:
+                win.after(1000, refresh)
+
+        refresh()
+
+    def show_metrics_window(self):
+        """Debug panel: a live table of tick, fetch, write and settings timings (refreshed every second)."""
+        if getattr(self, 'metrics_win', None) is not None and self.metrics_win.winfo_exists():
+            self.metrics_win.lift()
+            return
+        win = self.metrics_win = tk.Toplevel(self.root)
+        win.title("Metrics")
+        win.config(bg="black")
+        text = tk.Text(win, width=110, height=24, bg="black", fg="white", font=self.fonts.font("Consolas", 10))
+        text.pack(fill='both', expand=True, padx=6, pady=6)
+
+        def refresh():
+            if not win.winfo_exists():
+                return
+            lines = [f"{'series':<58}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}"]
+            for series, count, mean, p50, p95, value in metrics.summary():
+                if value is not None:
+                    lines.append(f"{series:<58}{value:>8}")
+                else:
+                    lines.append(f"{series:<58}{count:>8}{mean:>10.3f}{p50:>10.3f}{p95:>10.3f}")
+            text.config(state='normal')
+            text.delete('1.0', tk.END)
+            text.insert('1.0', '\n'.join(lines))
+            text.config(state='disabled')
+            win.after(1000, refresh)
+
+        refresh()
 
     def update_manual_visibility(self):
         s = load_settings()
@@ -767,237 +4907,44 @@ class CountdownApp:
 
     def apply_appearance_settings(self):
         """Apply appearance-related settings to the running Tk UI."""
-        s = load_settings()
-        # If an appearance_mode preset is selected, override specific settings with the preset
-        mode = s.get('appearance_mode', None)
-        if mode == 'dark':
-            s.update({
-                'bg_color': '#000000', 'text_color': '#FFFFFF', 'gn_bg_color': '#111111',
-                'gn_border_color': '#FFFFFF', 'gn_go_color': '#00FF00', 'gn_nogo_color': '#FF0000',
-                'font_family': 'Consolas', 'mission_font_px': 44, 'timer_font_px': 80, 'gn_font_px': 24
-            })
-        elif mode == 'light':
-            s.update({
-                'bg_color': '#FFFFFF', 'text_color': '#000000', 'gn_bg_color': '#EEEEEE',
-                'gn_border_color': '#333333', 'gn_go_color': '#008800', 'gn_nogo_color': '#AA0000',
-                'font_family': 'Consolas', 'mission_font_px': 44, 'timer_font_px': 80, 'gn_font_px': 24
-            })
-        bg = s.get('bg_color', '#000000')
-        text = s.get('text_color', '#FFFFFF')
-        font_family = s.get('font_family', 'Consolas')
-        timer_px = int(s.get('timer_font_px', 100))
-        mission_px = int(s.get('mission_font_px', 48))
-        gn_px = int(s.get('gn_font_px', 24))
-        gn_bg = s.get('gn_bg_color', '#111111')
-        gn_border = s.get('gn_border_color', '#FFFFFF')
-        gn_go = s.get('gn_go_color', '#00FF00')
-        gn_nogo = s.get('gn_nogo_color', '#FF0000')
-        # apply to main window elements
+        # compile the theme once, then style the whole widget tree (open dialogs included) in one pass
+        self.theme = Theme(fonts=self.fonts)
         try:
-            self.root.config(bg=bg)
-            self.titletext.config(fg=text, bg=bg, font=(font_family, 20))
-            # timer label
-            self.text.config(fg=text, bg=bg, font=(font_family, timer_px, 'bold'))
-            # GN labels: set bg and font, and color depending on GO/NOGO
-            def style_gn_label(lbl, value):
-                try:
-                    lbl.config(bg=bg, font=(font_family, gn_px))
-                    v = (value or '').strip().upper()
-                    if v == 'GO':
-                        lbl.config(fg=gn_go)
-                    elif v in ('NOGO', 'NO-GO'):
-                        lbl.config(fg=gn_nogo)
-                    else:
-                        lbl.config(fg=text)
-                except Exception:
-                    pass
-
-            style_gn_label(self.range_label, getattr(self, 'range_status', None))
-            style_gn_label(self.weather_label, getattr(self, 'weather', None))
-            style_gn_label(self.vehicle_label, getattr(self, 'vehicle', None))
-
-            # Buttons: invert colors depending on mode
-            # dark mode -> buttons white bg, black text
-            # light mode -> buttons black bg, white text
-            if mode == 'dark':
-                btn_bg = '#FFFFFF'
-                btn_fg = '#000000'
-                active_bg = '#DDDDDD'
-            else:
-                btn_bg = '#000000'
-                btn_fg = '#FFFFFF'
-                active_bg = '#222222'
-
-            for btn in (self.start_btn, self.hold_btn, self.resume_btn, self.scrub_btn, self.reset_btn, self.settings_btn):
-                try:
-                    # preserve scrub button's custom color (red) if set
-                    try:
-                        cur_fg = btn.cget('fg')
-                    except Exception:
-                        cur_fg = None
-                    if btn is getattr(self, 'scrub_btn', None) and cur_fg:
-                        # keep existing foreground (usually red)
-                        btn.config(bg=btn_bg, activebackground=active_bg)
-                    else:
-                        btn.config(bg=btn_bg, fg=btn_fg, activebackground=active_bg)
-                except Exception:
-                    pass
-
-            # Manual toggle buttons
-            for btn in (self.range_toggle_btn, self.weather_toggle_btn, self.vehicle_toggle_btn):
-                try:
-                    btn.config(bg=btn_bg, fg=btn_fg)
-                except Exception:
-                    pass
-
-            # manual frame and footer
-            try:
-                self.manual_frame.config(bg=bg)
-                # Footer should invert colors depending on mode:
-                # - dark mode -> white background, black text
-                # - light mode -> black background, white text
-                mode = s.get('appearance_mode', 'dark')
-                if mode == 'dark':
-                    footer_bg = '#FFFFFF'
-                    footer_fg = '#000000'
-                else:
-                    footer_bg = '#000000'
-                    footer_fg = '#FFFFFF'
-                try:
-                    self.footer_label.config(bg=footer_bg, fg=footer_fg)
-                except Exception:
-                    # fall back to generic theme
-                    self.footer_label.config(bg=bg, fg=text)
-            except Exception:
-                pass
+            self.root.config(bg=self.theme.bg)
         except Exception:
             pass
-        # Recursively theme frames and common widgets so no frame is left with old colors
+        roles = {
+            str(self.titletext): 'title',
+            str(self.text): 'timer',
+            str(self.range_label): 'gn',
+            str(self.weather_label): 'gn',
+            str(self.vehicle_label): 'gn',
+            str(self.footer_label): 'footer',
+            str(self.scrub_btn): 'scrub',
+        }
+        self.theme.apply(self.root, roles)
+        # widgets were reconfigured directly above; forget cached options and restyle the GN labels
+        self.view.invalidate()
         try:
-            self._theme_recursive(self.root, bg, text, btn_bg, btn_fg)
+            self.update_gn_labels(*self.gonogo_values)
         except Exception:
             pass
 
     def update_gn_labels(self, range_val, weather_val, vehicle_val):
-        """Update GN label texts and apply theme-aware styling."""
-        s = load_settings()
-        gn_px = int(s.get('gn_font_px', 28))
-        font_family = s.get('font_family', 'Consolas')
-        bg = s.get('bg_color', '#000000')
-        text = s.get('text_color', '#FFFFFF')
-        gn_go = s.get('gn_go_color', '#00FF00')
-        gn_nogo = s.get('gn_nogo_color', '#FF0000')
-        # Range
-        try:
-            display_range = format_status_display(range_val)
-            self.range_label.config(text=f"RANGE: {display_range}", bg=bg, font=(font_family, gn_px))
-            rv = (range_val or '').strip().upper()
-            rnorm = re.sub(r'[^A-Z]', '', rv)
-            if rnorm == 'GO':
-                self.range_label.config(fg=gn_go)
-            elif rnorm == 'NOGO':
-                self.range_label.config(fg=gn_nogo)
-            else:
-                self.range_label.config(fg=text)
-        except Exception:
-            pass
-
-        # Weather
-        try:
-            display_weather = format_status_display(weather_val)
-            self.weather_label.config(text=f"WEATHER: {display_weather}", bg=bg, font=(font_family, gn_px))
-            wv = (weather_val or '').strip().upper()
-            wnorm = re.sub(r'[^A-Z]', '', wv)
-            if wnorm == 'GO':
-                self.weather_label.config(fg=gn_go)
-            elif wnorm == 'NOGO':
-                self.weather_label.config(fg=gn_nogo)
-            else:
-                self.weather_label.config(fg=text)
-        except Exception:
-            pass
-
-        # Vehicle
-        try:
-            display_vehicle = format_status_display(vehicle_val)
-            self.vehicle_label.config(text=f"VEHICLE: {display_vehicle}", bg=bg, font=(font_family, gn_px))
-            vv = (vehicle_val or '').strip().upper()
-            vnorm = re.sub(r'[^A-Z]', '', vv)
-            if vnorm == 'GO':
-                self.vehicle_label.config(fg=gn_go)
-            elif vnorm == 'NOGO':
-                self.vehicle_label.config(fg=gn_nogo)
-            else:
-                self.vehicle_label.config(fg=text)
-        except Exception:
-            pass
-
-    def _theme_recursive(self, widget, bg, text, btn_bg, btn_fg):
-        # load settings so we can theme GN label backgrounds if configured
-        s = load_settings()
-        for child in widget.winfo_children():
-            # Frame and LabelFrame
-            try:
-                if isinstance(child, (tk.Frame, tk.LabelFrame)):
-                    try:
-                        child.config(bg=bg)
-                    except Exception:
-                        pass
-                # Labels: set bg, but don't override GN label fg
-                if isinstance(child, tk.Label):
-                    try:
-                        # preserve GN label fg colors and don't override the footer label (it has a special inverted style)
-                        if child in (getattr(self, 'range_label', None), getattr(self, 'weather_label', None), getattr(self, 'vehicle_label', None)):
-                            # GN labels keep fg but should have themed bg
-                            child.config(bg=s.get('gn_bg_color', bg))
-                        elif child is getattr(self, 'footer_label', None):
-                            # footer_label was already styled by apply_appearance_settings; don't override it here
-                            pass
-                        else:
-                            child.config(bg=bg, fg=text)
-                    except Exception:
-                        pass
-                # Entries: avoid overriding entries that were explicitly styled (like mission_entry)
-                if isinstance(child, tk.Entry):
-                    try:
-                        # Set entry bg/fg depending on appearance mode
-                        mode_local = s.get('appearance_mode', 'dark')
-                        if mode_local == 'dark':
-                            child.config(bg='#222222', fg=text, insertbackground=text)
-                        else:
-                            # light mode entries should contrast with the white background
-                            child.config(bg='#b4b4b4', fg='#000000', insertbackground='#000000')
-                    except Exception:
-                        pass
-                # OptionMenu/Menubutton
-                if isinstance(child, tk.Menubutton):
-                    try:
-                        child.config(bg=btn_bg, fg=btn_fg, activebackground='#555')
-                    except Exception:
-                        pass
-                # Radiobutton / Checkbutton
-                if isinstance(child, (tk.Radiobutton, tk.Checkbutton)):
-                    try:
-                        # selectcolor is the indicator background; set it to match the overall bg for neatness
-                        child.config(bg=bg, fg=text, selectcolor=bg, activebackground=bg)
-                    except Exception:
-                        pass
-                # Buttons: ensure themed background and correct fg
-                if isinstance(child, tk.Button):
-                    try:
-                        # don't override scrub button's fg if it has a special color
-                        if child is getattr(self, 'scrub_btn', None):
-                            child.config(bg=btn_bg, activebackground='#555')
-                        else:
-                            child.config(bg=btn_bg, fg=btn_fg, activebackground='#555')
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            # Recurse
+        """Update GN label texts and apply theme-aware styling; only changed options reach Tk."""
+        theme = self.theme
+        for lbl, title, val in ((self.range_label, 'RANGE', range_val),
+                                (self.weather_label, 'WEATHER', weather_val),
+                                (self.vehicle_label, 'VEHICLE', vehicle_val)):
             try:
-                if hasattr(child, 'winfo_children'):
-                    self._theme_recursive(child, bg, text, btn_bg, btn_fg)
+                norm = re.sub(r'[^A-Z]', '', (val or '').strip().upper())
+                if norm == 'GO':
+                    fg = theme.gn_go
+                elif norm == 'NOGO':
+                    fg = theme.gn_nogo
+                else:
+                    fg = theme.text
+                self.view.config(lbl, text=f"{title}: {format_status_display(val)}", bg=theme.bg, font=theme.gn_font, fg=fg)
             except Exception:
                 pass
 
@@ -1009,12 +4956,10 @@ class CountdownApp:
         win.title('Appearance')
         win.geometry('520x450')
 
-        # derive colors from appearance_mode so the dialog matches the main UI
-        mode_local = settings.get('appearance_mode', 'dark')
-        if mode_local == 'dark':
-            win_bg = '#000000'; win_text = '#FFFFFF'; btn_bg = '#FFFFFF'; btn_fg = '#000000'; entry_bg = '#222'; entry_fg = '#FFFFFF'
-        else:
-            win_bg = '#FFFFFF'; win_text = '#000000'; btn_bg = '#000000'; btn_fg = '#FFFFFF'; entry_bg = '#b4b4b4'; entry_fg = '#000000'
+        # derive colors from the compiled theme so the dialog matches the main UI
+        theme = self.theme
+        win_bg, win_text, btn_bg, btn_fg = theme.bg, theme.text, theme.btn_bg, theme.btn_fg
+        entry_bg, entry_fg = theme.entry_bg, theme.entry_fg
         win.config(bg=win_bg)
 
         tk.Label(win, text='Choose UI mode:', fg=win_text, bg=win_bg).pack(anchor='w', padx=12, pady=(10,0))
@@ -1026,27 +4971,14 @@ class CountdownApp:
 
         def on_save_mode():
             choice = mode_var.get()
-            presets = {
-                'dark': {
-                    'bg_color': '#000000', 'text_color': '#FFFFFF', 'gn_bg_color': '#111111',
-                    'gn_border_color': '#FFFFFF', 'gn_go_color': '#00FF00', 'gn_nogo_color': '#FF0000',
-                    'font_family': 'Consolas', 'mission_font_px': 24, 'timer_font_px': 80, 'gn_font_px': 20
-                },
-                'light': {
-                    'bg_color': '#FFFFFF', 'text_color': '#000000', 'gn_bg_color': '#EEEEEE',
-                    'gn_border_color': '#333333', 'gn_go_color': '#008800', 'gn_nogo_color': '#AA0000',
-                    'font_family': 'Consolas', 'mission_font_px': 24, 'timer_font_px': 80, 'gn_font_px': 20
-                }
-            }
-            p = presets.get(choice, {})
+            p = APPEARANCE_PRESETS.get(choice, {})
             s = load_settings()
             s['appearance_mode'] = choice
             s.update(p)
             save_settings(s)
             try:
                 self.apply_appearance_settings()
-                write_countdown_html(self.mission_name, self.text.cget('text'))
-                write_gonogo_html(self.gonogo_values)
+                self.engine.publish_outputs()
             except Exception:
                 pass
             # close appearance window
@@ -1146,8 +5078,7 @@ class CountdownApp:
                 except Exception:
                     pass
                 save_settings(s_local)
-                write_countdown_html(self.mission_name, self.text.cget('text'))
-                write_gonogo_html(self.gonogo_values)
+                self.engine.publish_outputs()
             except Exception:
                 pass
 
@@ -1175,8 +5106,7 @@ class CountdownApp:
                 font_entry.delete(0, tk.END); font_entry.insert(0, s_local['html_font_family'])
                 mission_px_entry.delete(0, tk.END); mission_px_entry.insert(0, str(s_local['html_mission_font_px']))
                 timer_px_entry.delete(0, tk.END); timer_px_entry.insert(0, str(s_local['html_timer_font_px']))
-                write_countdown_html(self.mission_name, self.text.cget('text'))
-                write_gonogo_html(self.gonogo_values)
+                self.engine.publish_outputs()
             except Exception:
                 pass
 
@@ -1191,18 +5121,14 @@ class CountdownApp:
         tk.Button(btn_frame, text='Cancel', command=win.destroy, fg=btn_fg, bg=btn_bg).pack(side='right')
 
         try:
-            self._theme_recursive(win, win_bg, win_text, btn_bg, btn_fg)
+            theme.apply(win)
         except Exception:
             pass
 
     def _toggle_manual(self, which):
-        # get current values (Range, Weather, Vehicle)
-        cur = fetch_gonogo()
-        # map which to index
-        idx_map = {'range': 0, 'weather': 1, 'vehicle': 2}
-        idx = idx_map.get(which, 0)
+        # current manual value; toggling only happens in buttons mode, so there is nothing to fetch
         try:
-            cur_val = (cur[idx] or '').strip().upper()
+            cur_val = (getattr(fetch_gonogo, f'manual_{which}', 'N/A') or '').strip().upper()
         except Exception:
             cur_val = 'N/A'
         # toggle: if GO -> NOGO, else -> GO
@@ -1212,155 +5138,213 @@ class CountdownApp:
     # ----------------------------
     # Control logic
     # ----------------------------
-    def start(self):
-        self.mission_name = self.mission_entry.get().strip() or "Placeholder Mission"
-        self.running = True
-        self.on_hold = False
-        self.scrubbed = False
-        self.counting_up = False
-        self.show_hold_button()
+    def run_command(self, command):
+        """Send an operator action through the engine like a control API command; a rejection is shown to the operator."""
+        try:
+            return self.handle_command(command)
+        except ValueError as e:
+            messagebox.showerror("RocketLaunchCountdown", str(e), parent=self.root)
+            return None
 
+    def start(self):
+        command = {'cmd': 'start', 'countdown': self.countdown.name,
+                   'mission': self.mission_entry.get().strip() or "Placeholder Mission"}
         try:
             if self.mode_var.get() == "duration":
                 h = int(self.hours_entry.get())
                 m = int(self.minutes_entry.get())
                 s = int(self.seconds_entry.get())
-                total_seconds = h * 3600 + m * 60 + s
+                command['seconds'] = h * 3600 + m * 60 + s
             else:
-                now = datetime.now()
-                # read separate HH, MM, SS boxes
+                # read separate HH, MM, SS boxes; the engine resolves them in the configured timezone
                 h = int(self.clock_hours_entry.get() or 0)
                 m = int(self.clock_minutes_entry.get() or 0)
                 s = int(self.clock_seconds_entry.get() or 0)
-                # determine timezone from settings
-                ssettings = load_settings()
-                tzname = ssettings.get('timezone', DEFAULT_SETTINGS.get('timezone', 'local'))
-                if ZoneInfo is None or tzname in (None, '', 'local'):
-                    # naive local time handling (existing behavior) — use timedelta to roll day
-                    target_today = now.replace(hour=h, minute=m, second=s, microsecond=0)
-                    if target_today <= now:
-                        target_today = target_today + timedelta(days=1)
-                    total_seconds = (target_today - now).total_seconds()
-                else:
-                    try:
-                        tz = ZoneInfo(tzname)
-                        # construct aware "now" in that timezone and create the target time
-                        now_tz = datetime.now(tz)
-                        target = now_tz.replace(hour=h, minute=m, second=s, microsecond=0)
-                        # if target already passed in that tz, roll to next day
-                        if target <= now_tz:
-                            target = target + timedelta(days=1)
-                        # compute total seconds using aware-datetime subtraction to avoid epoch mixing
-                        total_seconds = (target - now_tz).total_seconds()
-                    except Exception:
-                        # fallback to naive local behavior
-                        target_today = now.replace(hour=h, minute=m, second=s, microsecond=0)
-                        if target_today <= now:
-                            target_today = target_today + timedelta(days=1)
-                        total_seconds = (target_today - now).total_seconds()
-        except Exception:
-            self.text.config(text="Invalid time")
-            write_countdown_html(self.mission_name, "Invalid time")
+                command['at'] = f"{h:02d}:{m:02d}:{s:02d}"
+        except ValueError:
+            messagebox.showerror("RocketLaunchCountdown", "Invalid time", parent=self.root)
             return
-
-        self.target_time = time.time() + total_seconds
-        self.remaining_time = total_seconds
+        self.run_command(command)
 
     def hold(self):
-        if self.running and not self.on_hold and not self.scrubbed:
-            self.on_hold = True
-            self.hold_start_time = time.time()
-            self.remaining_time = max(0, self.target_time - self.hold_start_time)
-            self.show_resume_button()
+        self.run_command({'cmd': 'hold', 'countdown': self.countdown.name})
 
     def resume(self):
-        if self.running and self.on_hold and not self.scrubbed:
-            self.on_hold = False
-            self.target_time = time.time() + self.remaining_time
-            self.show_hold_button()
+        self.run_command({'cmd': 'resume', 'countdown': self.countdown.name})
 
     def show_hold_button(self):
         self.resume_btn.grid_remove()
         self.hold_btn.grid()
+        self._showing_resume = False
 
     def show_resume_button(self):
         self.hold_btn.grid_remove()
         self.resume_btn.grid()
+        self._showing_resume = True
 
     def scrub(self):
-        self.scrubbed = True
-        self.running = False
-        write_countdown_html(self.mission_name, "SCRUB")
-        self.text.config(text="SCRUB")
+        self.run_command({'cmd': 'scrub', 'countdown': self.countdown.name})
 
     def reset(self):
-        self.running = False
-        self.on_hold = False
-        self.scrubbed = False
-        self.counting_up = False
-        self.text.config(text="T-00:00:00")
-        write_countdown_html(self.mission_name, "T-00:00:00")
-        self.show_hold_button()
+        self.run_command({'cmd': 'reset', 'countdown': self.countdown.name})
+
+    # ----------------------------
+    # Multiple countdowns
+    # ----------------------------
+    def select_countdown(self, name):
+        """Point the controls and main display at another countdown."""
+        cd = self.scheduler.get(name)
+        if cd is None:
+            return
+        self.countdown = cd
+        self.countdown_var.set(name)
+        self.mission_entry.delete(0, tk.END)
+        self.mission_entry.insert(0, cd.mission_name)
+        self.view.config(self.text, text=cd.timer_text)
+        self.view.config(self.milestone_label, text=cd.milestone_text)
+        if cd.on_hold:
+            self.show_resume_button()
+        else:
+            self.show_hold_button()
+
+    def _rebuild_countdown_menu(self):
+        menu = self.countdown_menu['menu']
+        menu.delete(0, 'end')
+        for name in self.scheduler.names():
+            menu.add_command(label=name, command=lambda n=name: self.select_countdown(n))
+
+    def _save_countdown_names(self):
+        try:
+            s = load_settings()
+            s['countdowns'] = self.scheduler.names()
+            save_settings(s)
+        except Exception:
+            pass
+
+    def add_countdown(self):
+        name = simpledialog.askstring("Add countdown", "Name for the new countdown:", parent=self.root)
+        name = (name or '').strip()
+        if not name:
+            return
+        if self.run_command({'cmd': 'add_countdown', 'countdown': name}) is not None:
+            self.select_countdown(name)
+
+    def remove_countdown(self):
+        name = self.countdown.name
+        if name == PRIMARY_COUNTDOWN:
+            return
+        self.run_command({'cmd': 'remove_countdown', 'countdown': name})
 
     # ----------------------------
     # Clock updating
     # ----------------------------
     def format_time(self, seconds, prefix="T-"):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        return f"{prefix}{h:02}:{m:02}:{s:02}"
+        return format_time(seconds, prefix)
+
+    # ----------------------------
+    # Control API commands
+    # ----------------------------
+    def _process_commands(self):
+        try:
+            self.commands.process(self.handle_command)
+        except Exception:
+            pass
+        self.root.after(COMMAND_POLL_MS, self._process_commands)
+
+    def handle_command(self, command):
+        """Run a control command (or batch) on the Tk thread and refresh the UI once to match."""
+        state = self.engine.execute(command)
+        if isinstance(command, dict) and command.get('cmd') == 'batch':
+            command = command.get('commands') or []
+        for cmd in (command if isinstance(command, list) else [command]):
+            self._sync_controls(cmd)
+        self.refresh_display()
+        return state
+
+    def _sync_controls(self, command):
+        name = command.get('cmd')
+        if name in ('add_countdown', 'remove_countdown'):
+            self._rebuild_countdown_menu()
+            self._save_countdown_names()
+            if self.scheduler.get(self.countdown.name) is None:
+                self.select_countdown(PRIMARY_COUNTDOWN)
+        if name == 'mission' and command.get('countdown', PRIMARY_COUNTDOWN) == self.countdown.name:
+            self.mission_entry.delete(0, tk.END)
+            self.mission_entry.insert(0, self.countdown.mission_name)
 
     def update_clock(self):
-        now_time = time.time()
-
-        # Update timer
-        if self.running and not self.scrubbed:
-            if self.on_hold:
-                elapsed = int(now_time - self.hold_start_time)
-                timer_text = self.format_time(elapsed, "H+")
-            elif self.target_time:
-                diff = int(self.target_time - now_time)
-                if diff <= 0 and not self.counting_up:
-                    self.counting_up = True
-                    self.target_time = now_time
-                    diff = 0
-                if self.counting_up:
-                    elapsed = int(now_time - self.target_time)
-                    timer_text = self.format_time(elapsed, "T+")
-                else:
-                    timer_text = self.format_time(diff, "T-")
-            else:
-                timer_text = "T-00:00:00"
-        else:
-            timer_text = self.text.cget("text")
+        if self.watchdog is not None:
+            self.watchdog.beat()
+        started = time.perf_counter()
+        due = getattr(self, '_tick_due', None)
+        if due is not None:
+            TICK_LATENESS_SECONDS.observe(max(0.0, started - due))
+        clock.on_tick()
+        polled = self.engine.tick()
+        refresh_started = time.perf_counter()
+        self.refresh_display(gonogo=polled)
+        finished = time.perf_counter()
+        if profiler.enabled:
+            profiler.record('tk', finished - refresh_started)
+        TICK_SECONDS.observe(finished - started)
+        self._tick_due = finished + self.tick_ms / 1000.0
+        self.root.after(self.tick_ms, self.update_clock)
 
-        self.text.config(text=timer_text)
-        write_countdown_html(self.mission_name, timer_text)
+    def refresh_display(self, gonogo=True):
+        """Bring the widgets in line with the engine state; only changed options reach Tk."""
+        # a passive standby takes its commands from the primary, so its own controls are off until takeover
+        passive = self.engine.replication is not None and self.engine.replication.passive
+        for button in (self.start_btn, self.hold_btn, self.resume_btn, self.scrub_btn, self.reset_btn,
+                       self.add_countdown_btn, self.remove_countdown_btn,
+                       self.range_toggle_btn, self.weather_toggle_btn, self.vehicle_toggle_btn):
+            self.view.config(button, state="disabled" if passive else "normal")
+        cd = self.countdown
+        self.view.config(self.text, text=cd.timer_text)
+        self.view.config(self.milestone_label, text=cd.milestone_text)
+        # planned holds start and end on their own, so keep Hold/Resume in step with the engine
+        if cd.on_hold != self._showing_resume:
+            if cd.on_hold:
+                self.show_resume_button()
+            else:
+                self.show_hold_button()
 
-        # Update Go/No-Go every 10 seconds
-        if now_time - self.last_gonogo_update > 0.1:
-            # fetch_gonogo returns [Range, Weather, Vehicle]
-            self.range_status, self.weather, self.vehicle = fetch_gonogo()
+        if gonogo:
+            range_status, weather, vehicle = self.gonogo_values
             # update texts and styles using theme
             try:
-                self.update_gn_labels(self.range_status, self.weather, self.vehicle)
+                self.update_gn_labels(range_status, weather, vehicle)
             except Exception:
                 # fallback to simple config
-                self.range_label.config(text=f"RANGE: {self.range_status}")
-                self.weather_label.config(text=f"WEATHER: {self.weather}")
-                self.vehicle_label.config(text=f"VEHICLE: {self.vehicle}")
-            self.gonogo_values = [self.range_status, self.weather, self.vehicle]
-            write_gonogo_html(self.gonogo_values)
-            self.last_gonogo_update = now_time
-
-        self.root.after(200, self.update_clock)
+                self.view.invalidate()
+                self.range_label.config(text=f"RANGE: {range_status}")
+                self.weather_label.config(text=f"WEATHER: {weather}")
+                self.vehicle_label.config(text=f"VEHICLE: {vehicle}")
 
 
 if __name__ == "__main__":
+    # needed by the fetcher process in frozen Windows builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     # Show a small splash/loading GUI while we fetch initial data and write HTML files.
-    def show_splash_and_start():
+    def start_main_window(options):
+        """Fast start: open the main window straight away; restored state and the first fetch fill it in."""
+        load_tk()
+        root = tk.Tk()
+        startup.mark('tk_init')
+        s_start = load_settings()
+        app = CountdownApp(root, replayer=replayer, tick_ms=options.tick_ms,
+                           control_port=options.api_port or s_start.get('control_api_port'),
+                           control_socket=options.control_socket or s_start.get('control_socket'),
+                           metrics_port=options.metrics_port or s_start.get('metrics_port'),
+                           replication=replication_config(options))
+        root.mainloop()
+        app.engine.close()
+
+    def show_splash_and_start(options):
+        load_tk()
         splash = tk.Tk()
+        startup.mark('tk_init')
         splash.title("RocketLaunchCountdown — Initialaization")
         splash.config(bg="black")
         splash.geometry("400x175")
@@ -1372,7 +5356,7 @@ if __name__ == "__main__":
         lbl = tk.Label(splash, text="Loading resources...", fg="white", bg="black", font=("Arial", 14))
         lbl.pack(pady=(0,5))
 
-        info = tk.Label(splash, text="Fetching Go/No-Go and preparing HTML files.", fg="#ccc", bg="black", font=("Arial", 10))
+        info = tk.Label(splash, text="Preparing HTML files.", fg="#ccc", bg="black", font=("Arial", 10))
         info.pack()
 
         cont_btn = tk.Button(splash, text="Continue", state="disabled", width=12)
@@ -1383,14 +5367,9 @@ if __name__ == "__main__":
         footer_frame.pack(side="bottom", pady=0, fill="x")
 
         # Footer uses inverted colors: white bg/black text in dark mode, black bg/white text in light mode
-        s = load_settings()
-        splash_mode = s.get('appearance_mode', 'dark')
-        if splash_mode == 'dark':
-            splash_footer_bg = '#FFFFFF'
-            splash_footer_fg = '#000000'
-        else:
-            splash_footer_bg = '#000000'
-            splash_footer_fg = '#FFFFFF'
+        splash_theme = Theme()
+        splash_footer_bg = splash_theme.footer_bg
+        splash_footer_fg = splash_theme.footer_fg
 
         footer_label = tk.Label(
             footer_frame,
@@ -1406,10 +5385,13 @@ if __name__ == "__main__":
 
         def init_worker():
             try:
-                # perform the same initial writes you had before
-                gonogo = fetch_gonogo()
-                write_countdown_html("Placeholder Mission", "T-00:00:00")
-                write_gonogo_html(gonogo)
+                # last known state first, so displays come back within milliseconds of launch
+                if replayer is not None or not load_settings().get('warm_start', True) or not write_snapshot_outputs():
+                    # placeholders only: the main window's warm start runs the first live fetch in the
+                    # background, and a replay answers from the recorded timeline
+                    gonogo = replayer.fetch_gonogo() if replayer is not None else None
+                    write_countdown_html("Placeholder Mission", "T-00:00:00")
+                    write_gonogo_html(gonogo)
                 init_state['done'] = True
             except Exception as e:
                 init_state['error'] = str(e)
@@ -1422,37 +5404,96 @@ if __name__ == "__main__":
             if init_state['done']:
                 if init_state['error']:
                     info.config(text=f"Initialization error: {init_state['error']}")
+                    # let the operator read the error, then carry on
+                    cont_btn.config(state='normal', command=on_continue)
                 else:
-                    # show a visible countdown before auto-start; allow Continue to skip
-                    AUTO_START_SECONDS = 5
-                    remaining = AUTO_START_SECONDS
-                    cont_btn.config(state='normal')
-
-                    def tick():
-                        nonlocal remaining
-                        if remaining <= 0:
-                            on_continue()
-                            return
-                        info.config(text=f"Ready — auto-starting in {remaining}...")
-                        cont_btn.config(text=f"Continue ({remaining})")
-                        remaining -= 1
-                        splash.after(1000, tick)
-
-                    # clicking Continue will immediately proceed
-                    cont_btn.config(command=on_continue)
-                    tick()
+                    # no fixed delay: move on as soon as the outputs are ready
+                    on_continue()
                 return
-            splash.after(200, check_init)
+            splash.after(50, check_init)
 
         def on_continue():
+            if not splash.winfo_exists():
+                return
             splash.destroy()
             # now create the real main window
             root = tk.Tk()
-            app = CountdownApp(root)
+            s_start = load_settings()
+            app = CountdownApp(root, replayer=replayer, tick_ms=options.tick_ms,
+                               control_port=options.api_port or s_start.get('control_api_port'),
+                               control_socket=options.control_socket or s_start.get('control_socket'),
+                               metrics_port=options.metrics_port or s_start.get('metrics_port'),
+                               replication=replication_config(options))
             root.mainloop()
+            app.engine.close()
 
         # begin polling
-        splash.after(100, check_init)
+        splash.after(50, check_init)
         splash.mainloop()
 
-    show_splash_and_start()
+    parser = argparse.ArgumentParser(description="RocketLaunchCountdown")
+    parser.add_argument('--replay', metavar='TIMELINE',
+                        help="replay a recorded timeline.jsonl (or 'synthetic') through the outputs")
+    parser.add_argument('--speed', type=float, default=1.0, help="clock speed for --replay, 1 to 1000 (default 1)")
+    parser.add_argument('--step', type=float, default=None,
+                        help="deterministic replay: advance exactly STEP simulated seconds per tick")
+    parser.add_argument('--tick-ms', type=int, default=TICK_MS, help="tick interval in milliseconds")
+    parser.add_argument('--headless', action='store_true',
+                        help="run without a window (no tkinter); commands are read from stdin")
+    parser.add_argument('--start', metavar='SECONDS', default=None,
+                        help="headless: start the main countdown at launch (seconds or T-HH:MM:SS)")
+    parser.add_argument('--start-at', metavar='HH:MM:SS', default=None,
+                        help="headless: start the main countdown to a clock time at launch")
+    parser.add_argument('--mission', default=None, help="headless: mission name")
+    parser.add_argument('--api-port', type=int, default=None,
+                        help="serve the loopback control API on this port (or set control_api_port in settings)")
+    parser.add_argument('--control-socket', metavar='PATH', default=None,
+                        help="persistent JSON-lines command socket: a Unix socket path or tcp:PORT (or set control_socket)")
+    parser.add_argument('--profile', action='store_true',
+                        help="time each loop stage and enable cProfile captures; summary in profile_summary.txt")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="serve Prometheus metrics on this loopback port (or set metrics_port in settings)")
+    parser.add_argument('--primary', metavar='[HOST:]PORT', default=None,
+                        help="hot standby: stream state to standbys connecting on this port (or set replication)")
+    parser.add_argument('--standby', metavar='HOST:PORT', default=None,
+                        help="hot standby: follow the primary at HOST:PORT and take over if it goes quiet")
+    parser.add_argument('--time-sync', metavar='HOST:PORT', default=None,
+                        help="run on another instance's clock, from its time-sync port (or set time_sync_server)")
+    parser.add_argument('--fast-start', action='store_true',
+                        help="skip the splash and open the main window at once (or set fast_start in settings)")
+    options = parser.parse_args()
+
+    startup.mark('imports')
+    settings_at_start = load_settings()
+    setup_logging(settings_at_start.get('log_level', 'INFO'))
+
+    if options.profile:
+        profiler.enabled = True
+        # the table is printed and written again at exit so short sessions still get one
+        atexit.register(lambda: print(profiler.summary()) if profiler.stages else None)
+        atexit.register(profiler.write_summary)
+
+    sync_server = options.time_sync or settings_at_start.get('time_sync_server')
+    if sync_server and not options.replay:
+        set_clock(SyncedClock(sync_server))
+        # a short wait so restored and replicated target times are read in the right timebase
+        if not clock.ready.wait(1.0):
+            log.warning("No answer from time server %s yet; using local time until it answers", sync_server)
+
+    replayer = None
+    if options.replay:
+        entries = synthetic_timeline() if options.replay == 'synthetic' else load_timeline(options.replay)
+        set_clock(SimulatedClock(speed=min(1000.0, max(1.0, options.speed)), step=options.step))
+        # keep the live timeline clean; replayed transitions go to their own file
+        timeline.path = os.path.join(app_folder, "timeline_replay.jsonl")
+        replayer = TimelineReplayer(entries)
+
+    if options.headless:
+        startup.mode = 'headless'
+        startup.expect = ('imports', 'first_data')
+        run_headless(options, replayer)
+    elif options.fast_start or settings_at_start.get('fast_start'):
+        startup.mode = 'fast'
+        start_main_window(options)
+    else:
+        show_splash_and_start(options)